@@ -0,0 +1,23 @@
+import random
+
+from django.db.models import (
+    Max,
+    Min,
+)
+
+
+def random_object(queryset):
+    # Picks random object without counting or loading objects of queryset, as it could be costly aggregating query:
+    # takes random id between min and max ids of whole model table and returns object of queryset with nearest
+    # not less id, or the first one if there is no such object. Database scans only objects between random id and
+    # picked one, not all objects of queryset, but objects after gaps in ids or after objects not in queryset
+    # are picked more often
+    ids_range = queryset.model.objects.aggregate(min_id=Min('pk'), max_id=Max('pk'))
+    if ids_range['min_id'] is None:
+        return None
+    random_id = random.randint(ids_range['min_id'], ids_range['max_id'])
+    ordered_queryset = queryset.order_by('pk')
+    picked_object = ordered_queryset.filter(pk__gte=random_id).first()
+    if picked_object is None:
+        picked_object = ordered_queryset.first()
+    return picked_object
@@ -0,0 +1,144 @@
+import json
+import re
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Iterable,
+    List,
+)
+
+import lemminflect
+import nltk
+from django.db import transaction
+
+from ds.models import (
+    DigestRecordLemma,
+    Lemma,
+    LemmatizedDigestRecord,
+)
+
+
+LEMMAS_KEYS = ('NOUN', 'VERB', 'AUX', 'ADV', 'ADJ')
+# Limits size of `IN (...)` lists and of single `INSERT` statements
+QUERY_BATCH_SIZE = 1000
+DEFAULT_WORDS_LEMMAS_CACHE_MAX_SIZE = 100000
+
+
+class WordsLemmasCache:
+    # Lemmas of least recently used words are dropped when cache is full
+
+    def __init__(self, max_size: int = DEFAULT_WORDS_LEMMAS_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.hits_count = 0
+        self.misses_count = 0
+        self._lemmas_by_word = OrderedDict()
+
+    def __len__(self):
+        return len(self._lemmas_by_word)
+
+    def get(self, word: str) -> List[str]:
+        lemmas = self._lemmas_by_word.get(word)
+        if lemmas is None:
+            self.misses_count += 1
+            return None
+        self.hits_count += 1
+        self._lemmas_by_word.move_to_end(word)
+        return lemmas
+
+    def put(self, word: str, lemmas: List[str]):
+        self._lemmas_by_word[word] = lemmas
+        self._lemmas_by_word.move_to_end(word)
+        while len(self._lemmas_by_word) > self.max_size:
+            self._lemmas_by_word.popitem(last=False)
+
+    def load(self, file_path: str):
+        with open(file_path, 'r') as fin:
+            for word, lemmas in json.load(fin).items():
+                self.put(word, lemmas)
+
+    def save(self, file_path: str):
+        # Words are saved from least to most recently used, so loading keeps their order
+        with open(file_path, 'w') as fout:
+            json.dump(self._lemmas_by_word, fout, ensure_ascii=False, separators=(',', ':'))
+
+    def reset_stats(self):
+        self.hits_count = 0
+        self.misses_count = 0
+
+    def stats(self) -> str:
+        return f'{self.hits_count} hit(s), {self.misses_count} miss(es), {len(self)} word(s) cached'
+
+
+words_lemmas_cache = WordsLemmasCache()
+
+
+def word_lemmas(word: str) -> List[str]:
+    lemmas = words_lemmas_cache.get(word)
+    if lemmas is None:
+        lemmas = _word_lemmas(word)
+        words_lemmas_cache.put(word, lemmas)
+    return lemmas
+
+
+def _word_lemmas(word: str) -> List[str]:
+    lemmas_by_key = lemminflect.getAllLemmas(word)
+    lemmas = []
+    for lemmas_key in LEMMAS_KEYS:
+        if lemmas_key in lemmas_by_key:
+            lemmas += (l.lower() for l in lemmas_by_key[lemmas_key])
+    if not lemmas_by_key and re.match(r'\w', word):
+        lemmas.append(word.lower())
+    return lemmas
+
+
+def lemmas_counts(text: str) -> Dict[str, int]:
+    counts = {}
+    for word in nltk.word_tokenize(text):
+        for lemma_text in word_lemmas(word):
+            counts[lemma_text] = counts.get(lemma_text, 0) + 1
+    return counts
+
+
+def _batches(items: List, batch_size: int = QUERY_BATCH_SIZE) -> Iterable[List]:
+    for i in range(0, len(items), batch_size):
+        yield items[i:i + batch_size]
+
+
+def _lemmas_ids_by_text(lemmas_texts: Iterable[str]) -> Dict[str, int]:
+    lemmas_texts = sorted(set(lemmas_texts))
+    lemmas_ids_by_text = {}
+    for lemmas_texts_batch in _batches(lemmas_texts):
+        lemmas_ids_by_text.update(Lemma.objects.filter(text__in=lemmas_texts_batch).values_list('text', 'id'))
+    missing_lemmas_texts = [t for t in lemmas_texts if t not in lemmas_ids_by_text]
+    if missing_lemmas_texts:
+        # Conflicts are possible when same lemmas are inserted concurrently, so ids are queried after insert
+        Lemma.objects.bulk_create([Lemma(text=t) for t in missing_lemmas_texts],
+                                  batch_size=QUERY_BATCH_SIZE,
+                                  ignore_conflicts=True)
+        for lemmas_texts_batch in _batches(missing_lemmas_texts):
+            lemmas_ids_by_text.update(Lemma.objects.filter(text__in=lemmas_texts_batch).values_list('text', 'id'))
+    return lemmas_ids_by_text
+
+
+def save_digest_records_lemmas(lemmas_counts_by_digest_record_id: Dict[int, Dict[str, int]]) -> int:
+    # Saves lemmas of many digest records with few queries, already saved lemmas of digest record are kept as is,
+    # digest records are marked as lemmatized together with saving, even if they have no lemmas
+    lemmas_ids_by_text = _lemmas_ids_by_text(lemma_text
+                                             for counts in lemmas_counts_by_digest_record_id.values()
+                                             for lemma_text in counts)
+    digest_records_lemmas = [
+        DigestRecordLemma(digest_record_id=digest_record_id,
+                          lemma_id=lemmas_ids_by_text[lemma_text],
+                          count=count)
+        for digest_record_id, counts in lemmas_counts_by_digest_record_id.items()
+        for lemma_text, count in counts.items()
+    ]
+    with transaction.atomic():
+        DigestRecordLemma.objects.bulk_create(digest_records_lemmas,
+                                              batch_size=QUERY_BATCH_SIZE,
+                                              ignore_conflicts=True)
+        LemmatizedDigestRecord.objects.bulk_create([LemmatizedDigestRecord(digest_record_id=digest_record_id)
+                                                    for digest_record_id in lemmas_counts_by_digest_record_id],
+                                                   batch_size=QUERY_BATCH_SIZE,
+                                                   ignore_conflicts=True)
+    return len(digest_records_lemmas)
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.23 on 2026-10-18 21:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from ds.models import (
+    DigestRecordLemma,
+    LemmatizedDigestRecord,
+)
+
+
+def fill_lemmatized_digest_records(apps, schema_editor):
+    # Records lemmatized before had at least one lemma, others are lemmatized again once
+    digest_records_ids = DigestRecordLemma.objects.values_list('digest_record_id', flat=True).distinct()
+    LemmatizedDigestRecord.objects.bulk_create([LemmatizedDigestRecord(digest_record_id=digest_record_id)
+                                                for digest_record_id in digest_records_ids],
+                                               batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0099_add_digest_records_indexes'),
+        ('ds', '0006_remove_russian_lemmas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LemmatizedDigestRecord',
+            fields=[
+                ('digest_record', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, primary_key=True, serialize=False, to='gatherer.digestrecord')),
+            ],
+        ),
+        migrations.RunPython(fill_lemmatized_digest_records, migrations.RunPython.noop),
+    ]
@@ -35,3 +35,11 @@ class DigestRecordLemma(models.Model):
             'digest_record',
             'lemma',
         )
+
+
+class LemmatizedDigestRecord(models.Model):
+    # Digest record which lemmas are parsed and saved, kept even when no lemmas are found, so it is not parsed again
+
+    digest_record = models.OneToOneField(to=DigestRecord,
+                                         on_delete=models.PROTECT,
+                                         primary_key=True)
@@ -57,6 +57,11 @@ class DigestRecordAdmin(admin.ModelAdmin):
     def links_to_keywords(self, obj):
         return object_modification_url('gatherer', 'keyword', [k.id for k in obj.title_keywords.all()], [str(k) for k in obj.title_keywords.all()])
 
+    def save_model(self, request, obj, form, change):
+        if 'text' in form.changed_data:
+            obj.set_text(obj.text)
+        super().save_model(request, obj, form, change)
+
 
 class SimilarDigestRecordsAdmin(admin.ModelAdmin):
 
@@ -138,6 +143,9 @@ class DigestRecordsSourceAdmin(admin.ModelAdmin):
         'links_to_projects',
         'language',
         'text_fetching_enabled',
+        'parsing_module_kind',
+        'filtration_by_generic_keywords',
+        'filtration_by_specific_keywords',
     )
 
     search_fields = (
@@ -182,6 +190,14 @@ class DigestGatheringIterationAdmin(admin.ModelAdmin):
         'source_enabled',
         'source_error',
         'parser_error',
+        'not_modified',
+        'http_status',
+        'bytes_downloaded',
+        'fetch_time',
+        'parse_time',
+        'filtration_time',
+        'save_time',
+        'queries_count',
     )
 
     autocomplete_fields = (
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class GathererConfig(AppConfig):
     name = 'gatherer'
+
+    def ready(self):
+        import gatherer.signals
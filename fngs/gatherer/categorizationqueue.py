@@ -0,0 +1,77 @@
+from typing import (
+    Iterable,
+    List,
+)
+
+from django.db import transaction
+from django.db.models import Max
+
+from gatherer.models import (
+    DigestRecord,
+    DigestRecordCategorizationQueueEntry,
+    DigestRecordState,
+)
+
+
+# Limits size of `IN (...)` lists
+QUERY_BATCH_SIZE = 1000
+# Changes of other digest records fields do not move them in or out of queue
+QUEUE_DIGEST_RECORD_FIELDS = (
+    'gather_dt',
+    'state',
+    'is_main',
+    'content_type',
+    'content_category',
+)
+BAD_STATES = (
+    DigestRecordState.SKIPPED.name,
+    DigestRecordState.IGNORED.name,
+    DigestRecordState.FILTERED.name,
+    DigestRecordState.OUTDATED.name,
+    DigestRecordState.DUPLICATE.name,
+)
+
+
+def is_partially_categorized(digest_record: DigestRecord) -> bool:
+    if digest_record.state == DigestRecordState.UNKNOWN.name:
+        return True
+    if digest_record.state in BAD_STATES:
+        return False
+    return (digest_record.content_type in ('UNKNOWN', None)
+            or digest_record.is_main is None
+            or (digest_record.content_category is None and digest_record.content_type != 'OTHER'))
+
+
+def refresh_categorization_queue(digest_records_ids: Iterable[int]):
+    # Recalculates queue entries of digest records from their current fields, projects and categorization attempts
+    digest_records_ids = sorted(set(digest_records_ids))
+    for i in range(0, len(digest_records_ids), QUERY_BATCH_SIZE):
+        _refresh_categorization_queue_batch(digest_records_ids[i:i + QUERY_BATCH_SIZE])
+
+
+def _refresh_categorization_queue_batch(digest_records_ids: List[int]):
+    digest_records = DigestRecord.objects.filter(
+        id__in=digest_records_ids,
+    ).only(
+        'id',
+        *QUEUE_DIGEST_RECORD_FIELDS,
+    ).annotate(
+        last_tbot_attempt_dt=Max('tbot_estimations__dt'),
+    )
+    projects_ids_by_digest_record_id = {}
+    for digest_record_id, project_id in DigestRecord.projects.through.objects.filter(
+            digestrecord_id__in=digest_records_ids).values_list('digestrecord_id', 'project_id'):
+        projects_ids_by_digest_record_id.setdefault(digest_record_id, []).append(project_id)
+    queue_entries = [
+        DigestRecordCategorizationQueueEntry(digest_record_id=digest_record.id,
+                                             project_id=project_id,
+                                             gather_dt=digest_record.gather_dt,
+                                             is_state_unknown=digest_record.state == DigestRecordState.UNKNOWN.name,
+                                             last_tbot_attempt_dt=digest_record.last_tbot_attempt_dt)
+        for digest_record in digest_records
+        if is_partially_categorized(digest_record)
+        for project_id in projects_ids_by_digest_record_id.get(digest_record.id, [])
+    ]
+    with transaction.atomic():
+        DigestRecordCategorizationQueueEntry.objects.filter(digest_record_id__in=digest_records_ids).delete()
+        DigestRecordCategorizationQueueEntry.objects.bulk_create(queue_entries)
@@ -0,0 +1,26 @@
+from lxml import (
+    etree,
+    html,
+)
+
+
+# Contents of these elements are not shown on page, so they are not part of text, like with BeautifulSoup
+NOT_TEXT_TAGS = ('script', 'style', 'template')
+
+
+def html_to_text(html_text: str) -> str:
+    # Text content of HTML document or fragment without tags, parsed once with lxml instead of building soup
+    # Encoded text is parsed, because lxml refuses unicode strings with XML encoding declaration
+    parser = html.HTMLParser(encoding='utf-8')
+    try:
+        root = html.fromstring(html_text.encode('utf-8'), parser=parser)
+    except etree.ParserError:
+        # Raised for documents without any content, like whitespaces only
+        return ''
+    return element_text(root)
+
+
+def element_text(element) -> str:
+    # Removes not text elements from element, so it should not be used after that
+    etree.strip_elements(element, *NOT_TEXT_TAGS, with_tail=False)
+    return element.text_content()
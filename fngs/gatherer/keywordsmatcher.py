@@ -0,0 +1,91 @@
+import threading
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+)
+
+from gatherer.models import Keyword
+
+
+def _is_word_char(c: str) -> bool:
+    # Same characters as matched by `\w` in regular expressions
+    return c.isalnum() or c == '_'
+
+
+def _is_word_boundary(text: str, position: int) -> bool:
+    # Same positions as matched by `\b` in regular expressions
+    word_char_before = position > 0 and _is_word_char(text[position - 1])
+    word_char_after = position < len(text) and _is_word_char(text[position])
+    return word_char_before != word_char_after
+
+
+def _fold_case(text: str) -> str:
+    # Lower case char by char keeping text length, so positions in folded text are the same as in original one
+    return ''.join(c_lower if len(c_lower := c.lower()) == 1 else c for c in text)
+
+
+class KeywordsMatcher:
+    # Finds keywords contained in text as whole words, ignoring case, like `\bKEYWORD\b` search for each keyword does,
+    # but in one pass over text using prefix tree built once from all keywords
+
+    _KEYWORDS_INDEXES_KEY = ''
+
+    def __init__(self, keywords: Iterable[Any], name: Callable[[Any], str] = None):
+        self._keywords = []
+        self._prefix_tree = {}
+        for keyword in keywords:
+            node = self._prefix_tree
+            for c in _fold_case(name(keyword) if name else keyword):
+                node = node.setdefault(c, {})
+            node.setdefault(self._KEYWORDS_INDEXES_KEY, []).append(len(self._keywords))
+            self._keywords.append(keyword)
+
+    @classmethod
+    def from_queryset(cls, keywords_queryset) -> 'KeywordsMatcher':
+        return cls(keywords_queryset, name=lambda k: k.name)
+
+    def match(self, text: str) -> List[Any]:
+        matched_indexes = sorted(set(self._matched_keywords_indexes(text)))
+        return [self._keywords[i] for i in matched_indexes]
+
+    def matches_any(self, text: str) -> bool:
+        return next(self._matched_keywords_indexes(text), None) is not None
+
+    def _matched_keywords_indexes(self, text: str) -> Iterator[int]:
+        folded_text = _fold_case(text)
+        for begin in range(len(text) + 1):
+            if not _is_word_boundary(text, begin):
+                continue
+            node = self._prefix_tree
+            end = begin
+            while True:
+                if self._KEYWORDS_INDEXES_KEY in node and _is_word_boundary(text, end):
+                    yield from node[self._KEYWORDS_INDEXES_KEY]
+                if end == len(text):
+                    break
+                node = node.get(folded_text[end])
+                if node is None:
+                    break
+                end += 1
+
+
+_cached_keywords_matchers = {}
+_cached_keywords_matchers_lock = threading.Lock()
+
+
+def cached_keywords_matcher(**keywords_filters) -> KeywordsMatcher:
+    # Matcher for keywords selected with filters, built on first call and reused until cache is cleared
+    cache_key = tuple(sorted(keywords_filters.items()))
+    with _cached_keywords_matchers_lock:
+        if cache_key not in _cached_keywords_matchers:
+            keywords_queryset = Keyword.objects.filter(**keywords_filters)
+            _cached_keywords_matchers[cache_key] = KeywordsMatcher.from_queryset(keywords_queryset)
+        return _cached_keywords_matchers[cache_key]
+
+
+def clear_cached_keywords_matchers():
+    with _cached_keywords_matchers_lock:
+        _cached_keywords_matchers.clear()
@@ -0,0 +1,166 @@
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+
+from gatherer.keywordsmatcher import clear_cached_keywords_matchers
+from gatherer.models import DigestGatheringIteration
+from .gatherfromsources import (
+    Command as GatheringCommand,
+    ParsingModuleFactory,
+    QueriesCounter,
+    custom_logger,
+)
+from .httpclient import HttpClient
+from .sources import DigestRecordsSourcesRegistry
+
+
+DEFAULT_DAYS_COUNT = 36500
+
+
+class BenchmarkRollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+
+    help = ('Replay sources responses recorded with `gatherfromsources --record-responses` through parsing, filtration '
+            'and saving to database, report stages timings, queries counts and peak memory, all database changes are '
+            'rolled back, run with `DJANGO_DATABASE=test` to use test database')
+
+    def add_arguments(self, parser):
+        parser.add_argument('-r',
+                            '--responses',
+                            required=True,
+                            help='directory with recorded responses')
+        parser.add_argument('-n',
+                            '--days-count',
+                            type=int,
+                            default=DEFAULT_DAYS_COUNT,
+                            help=f'days to gather, default - {DEFAULT_DAYS_COUNT}, so recorded posts are not filtered out as old')
+        parser.add_argument('-m',
+                            '--trace-memory',
+                            action='store_true',
+                            help='trace peak memory, slows down all stages')
+        parser.add_argument('-o',
+                            '--output-file',
+                            help='JSON file to save report to')
+        parser.add_argument('-d',
+                            '--debug',
+                            action='store_true',
+                            help='show gathering log')
+        parser.add_argument('MODULE',
+                            type=str,
+                            help='`ALL` or comma separated sources names')
+
+    def handle(self, *args, **options):
+        if not options['debug']:
+            custom_logger.console_handler.setLevel(logging.CRITICAL)
+        DigestRecordsSourcesRegistry.invalidate()
+        clear_cached_keywords_matchers()
+        sources_names = [source.name
+                         for source in DigestRecordsSourcesRegistry.all()
+                         if source.enabled and (options['MODULE'] == 'ALL' or source.name in options['MODULE'].split(','))]
+        if not sources_names:
+            self.stderr.write(f'Failed to find enabled sources matched "{options["MODULE"]}"')
+            sys.exit(1)
+        http_client = HttpClient(replaying_directory=options['responses'])
+        parsing_modules = ParsingModuleFactory.create(sources_names, custom_logger, http_client)
+        gathering_command = GatheringCommand()
+        gathering_command.iterations = []
+        gathering_command.digest_records_to_lemmatize = []
+        lemmatization_queries_counter = QueriesCounter()
+        if options['trace_memory']:
+            tracemalloc.start()
+        started_at = time.monotonic()
+        try:
+            with transaction.atomic():
+                for parsing_module in parsing_modules:
+                    parsing_module.conditional_requests_enabled = False
+                    queries_counter = QueriesCounter()
+                    with connection.execute_wrapper(queries_counter):
+                        parsing_result = parsing_module.parse(options['days_count'])
+                    parsing_module.stats.queries_count = queries_counter.count
+                    processed_parsing_result = gathering_command._process_parsing_result(parsing_module, parsing_result)
+                    if processed_parsing_result is not None:
+                        gathering_command._save_to_database(*processed_parsing_result)
+                lemmatization_started_at = time.monotonic()
+                with connection.execute_wrapper(lemmatization_queries_counter):
+                    gathering_command._save_lemmas(gathering_command.digest_records_to_lemmatize)
+                lemmatization_time = time.monotonic() - lemmatization_started_at
+                raise BenchmarkRollback()
+        except BenchmarkRollback:
+            pass
+        overall_time = time.monotonic() - started_at
+        peak_memory = None
+        if options['trace_memory']:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        report = self._report(gathering_command.iterations,
+                              overall_time,
+                              lemmatization_time,
+                              lemmatization_queries_counter.count,
+                              len(gathering_command.digest_records_to_lemmatize),
+                              peak_memory)
+        self._print_report(report)
+        if options['output_file']:
+            with open(options['output_file'], 'w') as fout:
+                json.dump(report, fout, indent=2)
+
+    @staticmethod
+    def _report(iterations: List[DigestGatheringIteration],
+                overall_time: float,
+                lemmatization_time: float,
+                lemmatization_queries_count: int,
+                lemmatized_count: int,
+                peak_memory: int):
+        stages = ('fetch_time', 'parse_time', 'filtration_time', 'save_time')
+        return {
+            'overall_time': overall_time,
+            'stages_times': {stage: sum(getattr(iteration, stage) or 0 for iteration in iterations)
+                             for stage in stages},
+            'lemmatization_time': lemmatization_time,
+            'queries_count': sum(iteration.queries_count or 0 for iteration in iterations) + lemmatization_queries_count,
+            'lemmatization_queries_count': lemmatization_queries_count,
+            'saved_count': sum(iteration.saved_count or 0 for iteration in iterations),
+            'lemmatized_count': lemmatized_count,
+            'peak_memory': peak_memory,
+            'sources': [
+                {
+                    'source': iteration.source.name,
+                    **{stage: getattr(iteration, stage) for stage in stages},
+                    'queries_count': iteration.queries_count,
+                    'bytes_downloaded': iteration.bytes_downloaded,
+                    'saved_count': iteration.saved_count,
+                    'error': iteration.source_error or iteration.parser_error,
+                }
+                for iteration in iterations
+            ],
+        }
+
+    def _print_report(self, report):
+        self.stdout.write(f'{"Source":<60} {"Fetch":>8} {"Parse":>8} {"Filter":>8} {"Save":>8} {"Queries":>8} {"Saved":>6}')
+        for source_report in sorted(report['sources'], key=lambda r: r['source']):
+            times = (source_report[stage] or 0
+                     for stage in ('fetch_time', 'parse_time', 'filtration_time', 'save_time'))
+            self.stdout.write(f'{source_report["source"]:<60} '
+                              + ' '.join(f'{stage_time:>8.3f}' for stage_time in times)
+                              + f' {source_report["queries_count"] or 0:>8} {source_report["saved_count"] or 0:>6}'
+                              + (f' ERROR: {source_report["error"]}' if source_report['error'] else ''))
+        stages_times = report['stages_times']
+        self.stdout.write(f'Overall time: {report["overall_time"]:.3f} s')
+        self.stdout.write(f'Stages times: fetch {stages_times["fetch_time"]:.3f} s, parse {stages_times["parse_time"]:.3f} s, '
+                          f'filtration {stages_times["filtration_time"]:.3f} s, save {stages_times["save_time"]:.3f} s, '
+                          f'lemmatization {report["lemmatization_time"]:.3f} s')
+        self.stdout.write(f'Queries: {report["queries_count"]} ({report["lemmatization_queries_count"]} for lemmatization)')
+        self.stdout.write(f'Saved {report["saved_count"]} digest record(s), lemmatized {report["lemmatized_count"]}')
+        if report['peak_memory'] is not None:
+            self.stdout.write(f'Peak memory: {report["peak_memory"] / 1024 / 1024:.1f} MiB')
@@ -0,0 +1,151 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+from django.utils import timezone
+
+from common.sampling import random_object
+from gatherer.models import (
+    DigestRecord,
+    DigestRecordState,
+    Project,
+)
+from tbot.models import (
+    TelegramBotDigestRecordCategorizationAttempt,
+    TelegramBotUser,
+)
+from tbot.views import NotCategorizedFossNewsDigestRecordsMixin
+from .gatherfromsources import QueriesCounter
+
+
+DEFAULT_ATTEMPTS_COUNT = 100000
+DEFAULT_USERS_COUNT = 100
+DEFAULT_REQUESTS_COUNT = 20
+DEFAULT_CANDIDATES_COUNT = 1000
+# Candidate records get this count of attempts, so they stay not categorized
+CANDIDATE_ATTEMPTS_COUNT = NotCategorizedFossNewsDigestRecordsMixin.ENOUGH_TBOT_USERS_DIGEST_RECORD_ESTIMATIONS - 1
+# Other records get this count of attempts, so they are categorized and only add attempts
+CATEGORIZED_ATTEMPTS_COUNT = NotCategorizedFossNewsDigestRecordsMixin.ENOUGH_TBOT_USERS_DIGEST_RECORD_ESTIMATIONS
+BENCHMARK_PROJECT_NAME = 'Telegram Bot Queries Benchmark'
+BATCH_SIZE = 1000
+
+
+class BenchmarkRollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+
+    help = ('Fill database with given count of not categorized digest records and then with categorized ones and '
+            'Telegram bot categorization attempts in several steps up to given attempts count and measure latency '
+            'of picking random not categorized record for Telegram bot user after each step, all database changes '
+            'are rolled back, run with `DJANGO_DATABASE=test` to use test database')
+
+    def add_arguments(self, parser):
+        parser.add_argument('-a',
+                            '--attempts-count',
+                            type=int,
+                            default=DEFAULT_ATTEMPTS_COUNT,
+                            help=f'categorization attempts count after last step, default - {DEFAULT_ATTEMPTS_COUNT}')
+        parser.add_argument('-c',
+                            '--candidates-count',
+                            type=int,
+                            default=DEFAULT_CANDIDATES_COUNT,
+                            help=f'not categorized digest records count, stays the same in all steps, '
+                                 f'default - {DEFAULT_CANDIDATES_COUNT}')
+        parser.add_argument('-u',
+                            '--users-count',
+                            type=int,
+                            default=DEFAULT_USERS_COUNT,
+                            help=f'Telegram bot users count, default - {DEFAULT_USERS_COUNT}')
+        parser.add_argument('-r',
+                            '--requests-count',
+                            type=int,
+                            default=DEFAULT_REQUESTS_COUNT,
+                            help=f'requests measured after each step, default - {DEFAULT_REQUESTS_COUNT}')
+
+    def handle(self, *args, **options):
+        steps_attempts_counts = [options['attempts_count'] // 100,
+                                 options['attempts_count'] // 10,
+                                 options['attempts_count']]
+        self.stdout.write(f'{"Attempts":>10} {"Records":>10} {"Candidates":>10} '
+                          f'{"Median, ms":>12} {"Max, ms":>10} {"Queries":>8}')
+        try:
+            with transaction.atomic():
+                project = Project.objects.create(name=BENCHMARK_PROJECT_NAME)
+                tbot_users = TelegramBotUser.objects.bulk_create([
+                    TelegramBotUser(tid=-i - 1, username=f'benchmark{i}')
+                    for i in range(options['users_count'])
+                ])
+                attempts_count = 0
+                digest_records_count = 0
+                while digest_records_count < options['candidates_count']:
+                    batch_size = min(BATCH_SIZE, options['candidates_count'] - digest_records_count)
+                    digest_records_batch = self._create_digest_records(project, digest_records_count, batch_size)
+                    attempts_count += self._create_attempts(digest_records_batch, tbot_users, CANDIDATE_ATTEMPTS_COUNT)
+                    digest_records_count += len(digest_records_batch)
+                for step_attempts_count in steps_attempts_counts:
+                    while attempts_count < step_attempts_count:
+                        batch_size = min(BATCH_SIZE,
+                                         (step_attempts_count - attempts_count) // CATEGORIZED_ATTEMPTS_COUNT + 1)
+                        digest_records_batch = self._create_digest_records(project, digest_records_count, batch_size)
+                        attempts_count += self._create_attempts(digest_records_batch, tbot_users, CATEGORIZED_ATTEMPTS_COUNT)
+                        digest_records_count += len(digest_records_batch)
+                    # Measured user has estimated some of candidates too
+                    self._measure(tbot_users[0], attempts_count, digest_records_count, options['candidates_count'],
+                                  options['requests_count'])
+                raise BenchmarkRollback()
+        except BenchmarkRollback:
+            pass
+
+    @staticmethod
+    def _create_digest_records(project: Project, first_index: int, count: int):
+        digest_records = DigestRecord.objects.bulk_create([
+            DigestRecord(title=f'Benchmark digest record {i}',
+                         url=f'https://benchmark.example.com/{i}',
+                         dt=timezone.now(),
+                         gather_dt=timezone.now(),
+                         state=DigestRecordState.UNKNOWN.name)
+            for i in range(first_index, first_index + count)
+        ])
+        DigestRecord.projects.through.objects.bulk_create([
+            DigestRecord.projects.through(digestrecord_id=digest_record.id, project_id=project.id)
+            for digest_record in digest_records
+        ])
+        return digest_records
+
+    @staticmethod
+    def _create_attempts(digest_records, tbot_users, attempts_per_digest_record: int) -> int:
+        attempts = [
+            TelegramBotDigestRecordCategorizationAttempt(dt=timezone.now(),
+                                                         telegram_bot_user=tbot_users[(digest_record.id + i) % len(tbot_users)],
+                                                         digest_record=digest_record,
+                                                         estimated_state=DigestRecordState.IN_DIGEST.name)
+            for digest_record in digest_records
+            for i in range(attempts_per_digest_record)
+        ]
+        TelegramBotDigestRecordCategorizationAttempt.objects.bulk_create(attempts, batch_size=BATCH_SIZE)
+        return len(attempts)
+
+    def _measure(self,
+                 tbot_user: TelegramBotUser,
+                 attempts_count: int,
+                 digest_records_count: int,
+                 candidates_count: int,
+                 requests_count: int):
+        # Same queries as Telegram bot request of random not categorized record does
+        mixin = NotCategorizedFossNewsDigestRecordsMixin()
+        requests_times = []
+        queries_counter = QueriesCounter()
+        for _ in range(requests_count):
+            started_at = time.monotonic()
+            with connection.execute_wrapper(queries_counter):
+                random_object(mixin.not_categorized_records(tbot_user.pk, BENCHMARK_PROJECT_NAME))
+            requests_times.append(time.monotonic() - started_at)
+        self.stdout.write(f'{attempts_count:>10} {digest_records_count:>10} {candidates_count:>10} '
+                          f'{statistics.median(requests_times) * 1000:>12.1f} {max(requests_times) * 1000:>10.1f} '
+                          f'{queries_counter.count // requests_count:>8}')
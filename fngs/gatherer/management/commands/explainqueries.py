@@ -0,0 +1,124 @@
+import json
+import re
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from gatherer.mixins import NotCategorizedDigestRecordsMixin
+from gatherer.models import (
+    DigestIssue,
+    DigestRecord,
+    DigestRecordState,
+    DigestRecordsSource,
+)
+from tbot.models import TelegramBotUser
+from tbot.views import NotCategorizedFossNewsDigestRecordsMixin
+from .fetchdigestrecordtext import DEFAULT_POOL_BATCH_SIZE
+
+
+DEFAULT_PROJECT_NAME = 'FOSS News'
+PAGE_SIZE = 50
+CANONICAL_QUERIES_NAMES = (
+    'not-categorized',
+    'not-categorized-from-tbot',
+    'tbot-not-categorized-by-user',
+    'new-records',
+    'detailed-records-page',
+    'digest-issue-records',
+    'records-without-text',
+)
+
+
+class Command(BaseCommand):
+
+    help = ('Run `EXPLAIN ANALYZE` on canonical queries of API and commands and report their plans and timings, '
+            'queries are really executed, but only read data')
+
+    def add_arguments(self, parser):
+        parser.add_argument('-q',
+                            '--query',
+                            action='append',
+                            choices=CANONICAL_QUERIES_NAMES,
+                            help='name of query to explain, could be repeated, default - all queries')
+        parser.add_argument('-p',
+                            '--project',
+                            default=DEFAULT_PROJECT_NAME,
+                            help=f'project name used in queries, default - "{DEFAULT_PROJECT_NAME}"')
+        parser.add_argument('-u',
+                            '--tbot-user-id',
+                            type=int,
+                            help='Telegram bot user id used in queries, default - first user')
+        parser.add_argument('-b',
+                            '--buffers',
+                            action='store_true',
+                            help='report buffers usage too')
+        parser.add_argument('-o',
+                            '--output-file',
+                            help='JSON file to save report to')
+
+    def handle(self, *args, **options):
+        queries = self._canonical_queries(options['project'], options['tbot_user_id'])
+        names = options['query'] or CANONICAL_QUERIES_NAMES
+        explain_options = {'analyze': True}
+        if options['buffers']:
+            explain_options['buffers'] = True
+        report = []
+        for name in names:
+            queryset = queries[name]
+            if queryset is None:
+                self.stderr.write(f'Skipping "{name}", no data to build query')
+                continue
+            started_at = time.monotonic()
+            try:
+                plan = queryset.explain(**explain_options)
+            except Exception as e:
+                self.stderr.write(f'Failed to explain "{name}": {e}')
+                sys.exit(1)
+            explain_time = time.monotonic() - started_at
+            execution_time_match = re.search(r'Execution Time: ([\d.]+) ms', plan)
+            query_report = {
+                'name': name,
+                'execution_time_ms': float(execution_time_match.group(1)) if execution_time_match else None,
+                'explain_time_ms': explain_time * 1000,
+                'plan': plan,
+            }
+            report.append(query_report)
+            self._print_query_report(query_report)
+        if options['output_file']:
+            with open(options['output_file'], 'w') as fout:
+                json.dump(report, fout, indent=2)
+
+    @staticmethod
+    def _canonical_queries(project_name: str, tbot_user_id: int):
+        # Same querysets as views and commands use, evaluated only by explain
+        not_categorized_mixin = NotCategorizedDigestRecordsMixin()
+        if tbot_user_id is None:
+            tbot_user_id = TelegramBotUser.objects.order_by('id').values_list('id', flat=True).first()
+        last_digest_issue = DigestIssue.objects.order_by('-number').first()
+        return {
+            'not-categorized': not_categorized_mixin.not_categorized_records_queryset(False, project_name).order_by('dt')[:1],
+            'not-categorized-from-tbot': not_categorized_mixin.not_categorized_records_queryset(True, project_name).order_by('id'),
+            'tbot-not-categorized-by-user':
+                NotCategorizedFossNewsDigestRecordsMixin().not_categorized_records(tbot_user_id, project_name).order_by('pk')[:1]
+                if tbot_user_id is not None
+                else None,
+            'new-records': DigestRecord.objects.filter(state=DigestRecordState.UNKNOWN.name).order_by('dt')[:PAGE_SIZE],
+            'detailed-records-page': DigestRecord.objects.order_by('dt')[:PAGE_SIZE],
+            'digest-issue-records':
+                DigestRecord.objects.filter(digest_issue=last_digest_issue,
+                                            state=DigestRecordState.IN_DIGEST.name).order_by('dt')
+                if last_digest_issue is not None
+                else None,
+            'records-without-text':
+                DigestRecord.objects.filter(source__in=DigestRecordsSource.objects.filter(text_fetching_enabled=True),
+                                            text=None).only('id', 'url', 'source_id').order_by('id')[:DEFAULT_POOL_BATCH_SIZE],
+        }
+
+    def _print_query_report(self, query_report):
+        execution_time = query_report['execution_time_ms']
+        execution_time_str = f'{execution_time:.3f} ms' if execution_time is not None else 'unknown'
+        self.stdout.write(f'=== {query_report["name"]}: execution {execution_time_str}, '
+                          f'explain with round trip {query_report["explain_time_ms"]:.3f} ms')
+        self.stdout.write(query_report['plan'])
+        self.stdout.write('')
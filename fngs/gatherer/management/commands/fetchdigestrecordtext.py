@@ -2,16 +2,28 @@ import logging
 import pathlib
 import sys
 import time
-import random
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
 from enum import Enum
+from typing import List
 
 from django.core.management.base import BaseCommand
 
+from common.sampling import random_object
 from gatherer.models import (
     DigestRecord,
     DigestRecordsSource,
 )
 from .gatherfromsources import ParsingModuleFactory
+from .sources import DigestRecordsSourcesRegistry
+from .httpclient import (
+    DEFAULT_POLITE_CONNECTIONS_PER_HOST,
+    DEFAULT_POLITE_DELAY_SECONDS,
+    HostsPolitenessLimiter,
+    HttpClient,
+)
 
 SCRIPT_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 
@@ -19,10 +31,13 @@ SCRIPT_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 class FetcherMode(Enum):
     ADHOC = 'adhoc'
     DAEMON = 'daemon'
+    POOL = 'pool'
 
 
 DEFAULT_FETCHER_MODE = FetcherMode.ADHOC
 DEFAULT_FETCHING_TIMEOUT_SECONDS = 60
+DEFAULT_POOL_WORKERS_COUNT = 8
+DEFAULT_POOL_BATCH_SIZE = 100
 
 
 class Command(BaseCommand):
@@ -61,6 +76,24 @@ class Command(BaseCommand):
                             choices=[mode.value for mode in FetcherMode],
                             default=DEFAULT_FETCHER_MODE.value,
                             help=f'fetcher mode, default - `{DEFAULT_FETCHER_MODE.value}`')
+        parser.add_argument('-w',
+                            '--workers',
+                            type=int,
+                            default=DEFAULT_POOL_WORKERS_COUNT,
+                            help=f'count of texts fetched in parallel in `pool` mode, default - {DEFAULT_POOL_WORKERS_COUNT}')
+        parser.add_argument('-b',
+                            '--batch-size',
+                            type=int,
+                            default=DEFAULT_POOL_BATCH_SIZE,
+                            help=f'count of digest records fetched and saved together in `pool` mode, default - {DEFAULT_POOL_BATCH_SIZE}')
+        parser.add_argument('--host-connections',
+                            type=int,
+                            default=DEFAULT_POLITE_CONNECTIONS_PER_HOST,
+                            help=f'max count of simultaneous requests to one host in `pool` mode, default - {DEFAULT_POLITE_CONNECTIONS_PER_HOST}')
+        parser.add_argument('--host-delay',
+                            type=float,
+                            default=DEFAULT_POLITE_DELAY_SECONDS,
+                            help=f'min delay in seconds between requests to one host in `pool` mode, default - {DEFAULT_POLITE_DELAY_SECONDS}')
 
     def handle(self, *args, **options):
         self._setup_logging(options)
@@ -73,11 +106,20 @@ class Command(BaseCommand):
                 case FetcherMode.DAEMON:
                     try:
                         while True:
+                            # Sources settings could be changed in database while daemon is running
+                            DigestRecordsSourcesRegistry.invalidate()
                             self._fetch_one(options)
                             logging.info(f'Sleeping {options["timeout"]} second(s)')
                             time.sleep(options["timeout"])
                     except Exception as e:
                         logging.error(e)
+                case FetcherMode.POOL:
+                    hosts_politeness_limiter = HostsPolitenessLimiter(options['host_connections'], options['host_delay'])
+                    pool_fetcher = DigestRecordsTextsPoolFetcher(options['workers'],
+                                                                 options['batch_size'],
+                                                                 hosts_politeness_limiter,
+                                                                 options['source'])
+                    pool_fetcher.fetch_all()
                 case _:
                     raise Exception(f'Invalid mode `{options["mode"]}`')
         except KeyboardInterrupt:
@@ -93,7 +135,17 @@ class Command(BaseCommand):
 
     @staticmethod
     def _check_options(options):
-        options['mode'] = FetcherMode.ADHOC if options['mode'] == FetcherMode.ADHOC.value else FetcherMode.DAEMON
+        options['mode'] = FetcherMode(options['mode'])
+        if options['mode'] is FetcherMode.POOL:
+            options_not_supported_for_pool_mode = ('random', 'output_file', 'digest_record_id')
+            for option_key in options_not_supported_for_pool_mode:
+                if options[option_key]:
+                    raise Exception(f'`--{option_key.replace("_", "-")}` argument is not supported for pool mode')
+            if not options['save_to_db']:
+                raise Exception('`--save-to-db` argument is required for pool mode')
+            if options['workers'] < 1 or options['batch_size'] < 1 or options['host_connections'] < 1:
+                raise Exception('Workers count, batch size and host connections count should be positive')
+            return
         if options['mode'] is FetcherMode.DAEMON:
             options_not_supported_for_daemon_mode = ('source', 'output_file', 'digest_record_id')
             for option_key in options_not_supported_for_daemon_mode:
@@ -119,7 +171,7 @@ class Command(BaseCommand):
         if options['random']:
             sources_with_enabled_text_fetching = DigestRecordsSource.objects.filter(text_fetching_enabled=True)
             if options['source']:
-                logging.info(f'Selected source - "{options["source"].name}"')
+                logging.info(f'Selected source - "{options["source"]}"')
                 selected_sources = DigestRecordsSource.objects.filter(name=options['source'])
                 if not selected_sources:
                     raise Exception(f'Failed to find source with name "{options["source"]}"')
@@ -127,15 +179,18 @@ class Command(BaseCommand):
                 if selected_source not in sources_with_enabled_text_fetching:
                     raise Exception(f'Text fetching is not enabled for source with name "{options["source"]}", available are {[s.name for s in sources_with_enabled_text_fetching]}')  # noqa
                 digest_records_without_text_from_selected_source = DigestRecord.objects.filter(source=selected_source, text=None)
-                if not digest_records_without_text_from_selected_source:
-                    logging.info(f'No digest records without text found in selected source "{options["source"].name}"')
+                digest_record = random_object(digest_records_without_text_from_selected_source)
+                if digest_record is None:
+                    logging.info(f'No digest records without text found in selected source "{options["source"]}"')
                     return
-                digest_record = random.choice(digest_records_without_text_from_selected_source)
             else:
-                logging.info(f'{len(sources_with_enabled_text_fetching)} source(s) with enabled text fetching found')
+                logging.info(f'{sources_with_enabled_text_fetching.count()} source(s) with enabled text fetching found')
                 digest_records_without_text = DigestRecord.objects.filter(source__in=sources_with_enabled_text_fetching, text=None)
-                logging.info(f'{len(digest_records_without_text)} digest records without text found')
-                digest_record = random.choice(digest_records_without_text)
+                logging.info(f'{digest_records_without_text.count()} digest records without text found')
+                digest_record = random_object(digest_records_without_text)
+                if digest_record is None:
+                    logging.info('No digest records without text found')
+                    return
             logging.info(f'Randomly selected digest record - #{digest_record.pk} "{digest_record.title}"')
         else:
             digest_record = DigestRecord.objects.get(pk=options['digest_record_id'])
@@ -144,7 +199,7 @@ class Command(BaseCommand):
         text = fetch_digest_record_text(digest_record)
         logging.info(f'Fetched text from URL {digest_record.url}')
         if options['save_to_db']:
-            digest_record.text = str(text)
+            digest_record.set_text(str(text))
             logging.info(f'Saving to database')
             digest_record.save()
             logging.info(f'Saved to database')
@@ -170,3 +225,80 @@ def fetch_digest_record_text(digest_record: DigestRecord):
     source: DigestRecordsSource = digest_record.source
     parsing_module = ParsingModuleFactory.create([source.name], logging.getLogger())[0]
     return parsing_module.fetch_url(digest_record.url)
+
+
+class DigestRecordsTextsPoolFetcher:
+    # Fetches texts of all digest records without text from sources with enabled text fetching in threads pool,
+    # politely to each host, and saves fetched texts in batches
+
+    def __init__(self,
+                 workers_count: int,
+                 batch_size: int,
+                 hosts_politeness_limiter: HostsPolitenessLimiter,
+                 source_name: str = None):
+        self.workers_count = workers_count
+        self.batch_size = batch_size
+        self.hosts_politeness_limiter = hosts_politeness_limiter
+        self.source_name = source_name
+        self.fetched_count = 0
+        self.failed_count = 0
+        self.fetched_chars_count = 0
+        self.started_at = None
+
+    def fetch_all(self):
+        sources = DigestRecordsSource.objects.filter(text_fetching_enabled=True)
+        if self.source_name:
+            sources = sources.filter(name=self.source_name)
+            if not sources:
+                raise Exception(f'Failed to find source with name "{self.source_name}" and enabled text fetching')
+        http_client = HttpClient(max_connections_per_host=self.hosts_politeness_limiter.max_connections_per_host)
+        parsing_modules_by_source_id = {source.id: ParsingModuleFactory.create_one(source.name, logging.getLogger(), http_client)
+                                        for source in sources}
+        digest_records_without_text = DigestRecord.objects.filter(source__in=sources,
+                                                                  text=None).only('id', 'url', 'source_id').order_by('id')
+        logging.info(f'{digest_records_without_text.count()} digest records without text found in {len(parsing_modules_by_source_id)} source(s)')
+        self.started_at = time.monotonic()
+        # Records are taken by increasing id, so records which texts failed to fetch are not taken again
+        last_id = 0
+        with ThreadPoolExecutor(max_workers=self.workers_count) as executor:
+            while True:
+                digest_records = list(digest_records_without_text.filter(id__gt=last_id)[:self.batch_size])
+                if not digest_records:
+                    break
+                last_id = digest_records[-1].id
+                fetching_futures = {executor.submit(self._fetch_text, parsing_modules_by_source_id[digest_record.source_id], digest_record): digest_record
+                                    for digest_record in digest_records}
+                fetched_digest_records: List[DigestRecord] = []
+                for fetching_future in as_completed(fetching_futures):
+                    digest_record = fetching_futures[fetching_future]
+                    text = fetching_future.result()
+                    if text is None:
+                        self.failed_count += 1
+                        continue
+                    digest_record.set_text(str(text))
+                    self.fetched_count += 1
+                    self.fetched_chars_count += len(digest_record.text)
+                    fetched_digest_records.append(digest_record)
+                DigestRecord.objects.bulk_update(fetched_digest_records, ['text', 'cleared_text'])
+                logging.info(f'Saved {len(fetched_digest_records)} text(s) to database, {self._stats()}')
+        logging.info(f'Finished, {self._stats()}')
+
+    def _fetch_text(self, parsing_module, digest_record: DigestRecord):
+        try:
+            with self.hosts_politeness_limiter.request_slot(digest_record.url):
+                text = parsing_module.fetch_url(digest_record.url)
+        except Exception as e:
+            logging.error(f'Failed to fetch text of digest record #{digest_record.pk} from URL {digest_record.url}: {e}')
+            return None
+        if text is None:
+            logging.warning(f'No text found for digest record #{digest_record.pk} at URL {digest_record.url}')
+        else:
+            logging.debug(f'Fetched text of digest record #{digest_record.pk} from URL {digest_record.url}')
+        return text
+
+    def _stats(self):
+        elapsed_seconds = time.monotonic() - self.started_at
+        processed_count = self.fetched_count + self.failed_count
+        records_per_second = processed_count / elapsed_seconds if elapsed_seconds else 0
+        return (f'fetched {self.fetched_count} text(s) ({self.fetched_chars_count} chars), failed {self.failed_count}, '
+                f'{records_per_second:.2f} record(s)/s in {elapsed_seconds:.0f} s')
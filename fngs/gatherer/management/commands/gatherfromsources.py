@@ -3,25 +3,71 @@ from django.core.management.base import BaseCommand
 from ds.models import *
 
 import dateutil.parser
+import json
 import logging
 import sys
 import os
+import time
 import traceback
-import lemminflect
-import nltk
-from bs4 import BeautifulSoup
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
+from django.db import (
+    connection,
+    transaction,
+)
+from typing import Dict
 
 
+from ds.lemmas import (
+    lemmas_counts,
+    save_digest_records_lemmas,
+    words_lemmas_cache,
+)
+from gatherer.categorizationqueue import refresh_categorization_queue
+from gatherer.htmltext import html_to_text
+from gatherer.keywordsmatcher import clear_cached_keywords_matchers
 from .sources import *
+from .httpclient import (
+    HttpClient,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+)
 
 from .logger import Logger
+from .pollingscheduler import (
+    DEFAULT_MAX_POLLING_INTERVAL_SECONDS,
+    DEFAULT_MIN_POLLING_INTERVAL_SECONDS,
+    DEFAULT_POLLING_JITTER,
+    PollingScheduler,
+)
 SCRIPT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
 custom_logger = Logger(os.path.join(SCRIPT_DIRECTORY, 'gatherfromsources.log'))
 
 SCRIPT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
 
+DEFAULT_WORKERS_COUNT = 8
+
 parsing_modules_names = []
+selected_module = None
 days_count = None
+workers_count = None
+conditional_requests_enabled = None
+lemmatization_deferred = None
+lemmas_cache_file_path = None
+summary_file_path = None
+responses_recording_directory = None
+
+
+class QueriesCounter:
+    # Database execute wrapper counting queries made through connection it is installed to
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
 
 
 class Command(BaseCommand):
@@ -33,6 +79,40 @@ class Command(BaseCommand):
                             '--debug',
                             action='store_true',
                             help='Debug mode')
+        parser.add_argument('-w',
+                            '--workers',
+                            type=int,
+                            default=DEFAULT_WORKERS_COUNT,
+                            help=f'Count of sources fetched and parsed in parallel, default - {DEFAULT_WORKERS_COUNT}')
+        parser.add_argument('-f',
+                            '--force-fetch',
+                            action='store_true',
+                            help='Do not send conditional requests, fetch sources even if they were not modified since previous gathering')
+        parser.add_argument('-l',
+                            '--defer-lemmatization',
+                            action='store_true',
+                            help='Do not parse lemmas of new digest records, leave it to `lemmatizedigestrecords` command')
+        parser.add_argument('--lemmas-cache-file',
+                            help='JSON file to load words lemmas cache from before parsing lemmas and save it to after')
+        parser.add_argument('--summary-file',
+                            help='JSON file to save gathering summary to, in addition to log')
+        parser.add_argument('--record-responses',
+                            help='Directory to save snapshots of sources responses to, for replaying them with `benchmarkgathering` command')
+        parser.add_argument('--daemon',
+                            action='store_true',
+                            help='Run forever, gathering each source when it is due according to rate of new posts in it')
+        parser.add_argument('--min-polling-interval',
+                            type=int,
+                            default=DEFAULT_MIN_POLLING_INTERVAL_SECONDS,
+                            help=f'Min seconds between gatherings of one source in daemon mode, default - {DEFAULT_MIN_POLLING_INTERVAL_SECONDS}')
+        parser.add_argument('--max-polling-interval',
+                            type=int,
+                            default=DEFAULT_MAX_POLLING_INTERVAL_SECONDS,
+                            help=f'Max seconds between gatherings of one source in daemon mode, default - {DEFAULT_MAX_POLLING_INTERVAL_SECONDS}')
+        parser.add_argument('--polling-jitter',
+                            type=float,
+                            default=DEFAULT_POLLING_JITTER,
+                            help=f'Max part of polling interval it is randomly changed by in daemon mode, default - {DEFAULT_POLLING_JITTER}')
         parser.add_argument('MODULE',
                             type=str,
                             help='Parsing module')
@@ -44,23 +124,91 @@ class Command(BaseCommand):
         try:
             self._init_globals(**options)
             custom_logger.info(f'Saving log to "{custom_logger.file_path}"')
-            parsing_modules = ParsingModuleFactory.create(parsing_modules_names, custom_logger)
-            custom_logger.info('Started parsing all sources')
-            for parsing_module in parsing_modules:
-                parsing_result = self._parse(parsing_module)
-                if parsing_result is not None:
-                    iteration, posts_data_one = parsing_result
-                    self._save_to_database(iteration, posts_data_one)
-            custom_logger.info(f'Finished parsing all sources, all saved to database')  # TODO: Add stats
+            # Cache is loaded once and kept in memory between daemon passes
+            if not lemmatization_deferred:
+                self._load_words_lemmas_cache()
+            http_client = HttpClient(max_connections_per_host=min(workers_count, DEFAULT_MAX_CONNECTIONS_PER_HOST),
+                                     recording_directory=responses_recording_directory)
+            if options['daemon']:
+                polling_scheduler = PollingScheduler(options['min_polling_interval'],
+                                                     options['max_polling_interval'],
+                                                     options['polling_jitter'])
+                self._gather_in_daemon_mode(http_client, polling_scheduler)
+            else:
+                self._gather(http_client, parsing_modules_names)
+        except KeyboardInterrupt:
+            custom_logger.info('Interrupted')
         except Exception as e:
             custom_logger.critical(e)
             custom_logger.critical(traceback.format_exc())
             sys.exit(1)
 
-    def _parse(self, parsing_module):
+    def _gather_in_daemon_mode(self, http_client: HttpClient, polling_scheduler: PollingScheduler):
+        custom_logger.info(f'Started daemon mode for {len(parsing_modules_names)} source(s)')
+        while True:
+            try:
+                # Sources could be added, changed, disabled or removed while daemon sleeps
+                DigestRecordsSourcesRegistry.invalidate()
+                enabled_parsing_modules_names = [source.name
+                                                 for source in self._sources_selected_by_user()
+                                                 if source.enabled]
+                due_parsing_modules_names, seconds_until_next_poll = polling_scheduler.plan(enabled_parsing_modules_names)
+                if due_parsing_modules_names:
+                    self._gather(http_client, due_parsing_modules_names)
+                    continue
+                custom_logger.info(f'No sources to gather, sleeping {seconds_until_next_poll:.0f} second(s)')
+            except Exception as e:
+                # Daemon is not restarted by anyone, so failed pass, e.g. because of database unavailability,
+                # is retried later
+                seconds_until_next_poll = polling_scheduler.min_interval_seconds
+                custom_logger.error(f'Failed to gather in daemon mode, retrying in {seconds_until_next_poll:.0f} second(s): {e}')
+                custom_logger.error(traceback.format_exc())
+            # Connection is not kept open while sleeping, it is opened again by next query
+            connection.close()
+            time.sleep(seconds_until_next_poll)
+
+    def _gather(self, http_client: HttpClient, parsing_modules_names: List[str]):
+        clear_cached_keywords_matchers()
+        parsing_modules = ParsingModuleFactory.create(parsing_modules_names, custom_logger, http_client)
+        for parsing_module in parsing_modules:
+            parsing_module.conditional_requests_enabled = conditional_requests_enabled
+        # Lemmas of all digest records added during run are saved together after all sources
+        self.digest_records_to_lemmatize: List[DigestRecord] = []
+        words_lemmas_cache.reset_stats()
+        self.iterations: List[DigestGatheringIteration] = []
+        custom_logger.info(f'Started parsing {len(parsing_modules)} source(s) using {workers_count} worker(s)')
+        # Sources are fetched and parsed concurrently, but everything that goes to database after parsing
+        # is done here, in main thread, one source after another
+        with ThreadPoolExecutor(max_workers=workers_count) as executor:
+            parsing_futures = {executor.submit(self._parse_in_worker, parsing_module): parsing_module
+                               for parsing_module in parsing_modules}
+            for parsing_future in as_completed(parsing_futures):
+                parsing_module = parsing_futures[parsing_future]
+                parsing_result = self._process_parsing_result(parsing_module, parsing_future.result())
+                if parsing_result is not None:
+                    iteration, posts_data_one = parsing_result
+                    self._save_to_database(iteration, posts_data_one)
+        if lemmatization_deferred:
+            custom_logger.info(f'Lemmatization of {len(self.digest_records_to_lemmatize)} digest record(s) deferred')
+        else:
+            self._save_lemmas(self.digest_records_to_lemmatize)
+        self._save_summary()
+        custom_logger.info(f'Finished parsing {len(parsing_modules)} source(s), all saved to database')
+
+    @staticmethod
+    def _parse_in_worker(parsing_module):
         custom_logger.info(f'Started parsing {parsing_module.source_name}')
-        parsing_result = parsing_module.parse(days_count)
-        source = DigestRecordsSource.objects.get(name=parsing_module.source_name)
+        queries_counter = QueriesCounter()
+        try:
+            with connection.execute_wrapper(queries_counter):
+                return parsing_module.parse(days_count)
+        finally:
+            parsing_module.stats.queries_count = queries_counter.count
+            # Each worker thread gets its own database connection, it should not outlive the parsing
+            connection.close()
+
+    def _process_parsing_result(self, parsing_module, parsing_result):
+        source = DigestRecordsSourcesRegistry.get(parsing_module.source_name)
         datetime_now = datetime.datetime.now(tz=dateutil.tz.tzlocal())
         if parsing_result.success:
             posts_data_one = PostsData(parsing_module.source_name,
@@ -68,14 +216,23 @@ class Command(BaseCommand):
                                        parsing_result.posts_data_after_filtration,
                                        parsing_module.language,
                                        parsing_module.filters,
-                                       parsing_module.warning)
+                                       parsing_module.warning,
+                                       parsing_module.http_etag,
+                                       parsing_module.http_last_modified,
+                                       parsing_result.outdated_posts_data)
             iteration = DigestGatheringIteration(dt=datetime_now,
                                                  overall_count=parsing_result.overall_count,
                                                  source_enabled=True,
                                                  gathered_count=len(parsing_result.posts_data_after_filtration),
                                                  saved_count=0,
-                                                 source=source)
+                                                 source=source,
+                                                 not_modified=parsing_result.not_modified,
+                                                 **self._iteration_stats_fields(parsing_module))
             iteration.save()
+            self.iterations.append(iteration)
+            if parsing_result.not_modified:
+                custom_logger.info(f'Finished parsing {parsing_module.source_name}, not modified since previous gathering, no new posts')
+                return None
             for post_data in posts_data_one.posts_data_list:
                 custom_logger.info(f'New post {post_data.dt if post_data.dt is not None else "?"} "{post_data.title}" {post_data.url}')
             custom_logger.debug(f'Parsed from {parsing_module.source_name}: {[(post_data.title, post_data.url) for post_data in posts_data_one.posts_data_list]}')
@@ -87,8 +244,10 @@ class Command(BaseCommand):
                                                  source_enabled=False,
                                                  gathered_count=0,
                                                  saved_count=0,
-                                                 source=source)
+                                                 source=source,
+                                                 **self._iteration_stats_fields(parsing_module))
             iteration.save()
+            self.iterations.append(iteration)
             return None
         else:
             iteration = DigestGatheringIteration(dt=datetime_now,
@@ -98,29 +257,62 @@ class Command(BaseCommand):
                                                  saved_count=0,
                                                  source=source,
                                                  source_error=parsing_result.source_error,
-                                                 parser_error=parsing_result.parser_error)
+                                                 parser_error=parsing_result.parser_error,
+                                                 **self._iteration_stats_fields(parsing_module))
             iteration.save()
+            self.iterations.append(iteration)
             return None
 
+    @staticmethod
+    def _iteration_stats_fields(parsing_module):
+        stats: ParsingStats = parsing_module.stats
+        return {
+            'http_status': stats.http_status,
+            'bytes_downloaded': stats.bytes_downloaded,
+            'fetch_time': stats.fetch_time,
+            'parse_time': stats.parse_time,
+            'filtration_time': stats.filtration_time,
+            'queries_count': stats.queries_count,
+        }
+
     def _save_to_database(self, iteration: DigestGatheringIteration, posts_data_one: PostsData):
+        saving_started_at = time.monotonic()
+        queries_counter = QueriesCounter()
+        with connection.execute_wrapper(queries_counter):
+            self._save_posts_data(iteration, posts_data_one)
+        iteration.save_time = time.monotonic() - saving_started_at
+        iteration.queries_count = (iteration.queries_count or 0) + queries_counter.count
+        iteration.save(update_fields=['save_time', 'queries_count'])
+
+    def _save_posts_data(self, iteration: DigestGatheringIteration, posts_data_one: PostsData):
         custom_logger.info(f'Saving to database for source "{posts_data_one.source_name}"')
-        source = DigestRecordsSource.objects.get(name=posts_data_one.source_name)
+        source = DigestRecordsSourcesRegistry.get(posts_data_one.source_name)
+        source_projects = list(source.projects.all())
+        keywords_by_name = self._keywords_by_name(posts_data_one.posts_data_list)
+        known_digest_records = KnownDigestRecords(posts_data_one.posts_data_list + posts_data_one.outdated_posts_data_list)
+        for post_data in posts_data_one.outdated_posts_data_list:
+            if known_digest_records.dt_missing(post_data):
+                known_digest_records.fix_dt(post_data)
+                custom_logger.debug(f'Outdated {post_data.url} already exists in database, but without date, fix it')
         added_digest_records_count = 0
         already_existing_digest_records_count = 0
-        already_existing_digest_records_dt_updated_count = 0
+        digest_records_to_add: List[DigestRecord] = []
+        digest_records_to_add_keywords: List[List[Keyword]] = []
+        digest_records_to_add_urls = set()
         for post_data in posts_data_one.posts_data_list:
             short_post_data_str = f'{post_data.dt} "{post_data.title}" ({post_data.url})'
-            similar_records = DigestRecord.objects.filter(url=post_data.url)  # TODO: Replace check for similar records before and with "get"
-            if similar_records:
-                if not similar_records[0].dt:
-                    similar_records[0].dt = post_data.dt
+            if known_digest_records.contains(post_data):
+                if known_digest_records.dt_missing(post_data):
+                    known_digest_records.fix_dt(post_data)
                     custom_logger.debug(f'{short_post_data_str} already exists in database, but without date, fix it')
-                    already_existing_digest_records_dt_updated_count += 1
-                    similar_records[0].save()
                 else:
                     custom_logger.warning(f'{short_post_data_str} ignored, found same in database')
                     already_existing_digest_records_count += 1
                 continue
+            elif post_data.url in digest_records_to_add_urls:
+                custom_logger.warning(f'{short_post_data_str} ignored, found same in source feed')
+                already_existing_digest_records_count += 1
+                continue
             else:
                 custom_logger.debug(f'Adding {short_post_data_str} to database')
                 all_matched_keywords = []
@@ -129,7 +321,7 @@ class Command(BaseCommand):
                 else:
                     state = DigestRecordState.UNKNOWN.name
                 for keyword_name in post_data.keywords:
-                    matched_keywords_for_one = Keyword.objects.filter(name=keyword_name)
+                    matched_keywords_for_one = keywords_by_name.get(keyword_name, [])
                     if len(matched_keywords_for_one) == 0:
                         custom_logger.error(f'Failed to find keywords with name "{keyword_name}" in database')
                     else:
@@ -137,44 +329,9 @@ class Command(BaseCommand):
                             custom_logger.warning(f'More than one keyword with name "{keyword_name}" found in database')
                         all_matched_keywords += matched_keywords_for_one
                 if state == DigestRecordState.UNKNOWN.name and all_matched_keywords:
-                    enabled_and_valuable_matched_keywords = []
-                    if not posts_data_one.filters:
-                        for keyword in all_matched_keywords:
-                            if keyword.enabled:
-                                enabled_and_valuable_matched_keywords.append(keyword)
-                        should_be_skipped = False
-                    elif FiltrationType.SPECIFIC in posts_data_one.filters \
-                            and FiltrationType.GENERIC in posts_data_one.filters:
-                        should_be_skipped = True
-                        for keyword in all_matched_keywords:
-                            if keyword.enabled:
-                                enabled_and_valuable_matched_keywords.append(keyword)
-                    elif FiltrationType.SPECIFIC in posts_data_one.filters:
-                        should_be_skipped = True
-                        for keyword in all_matched_keywords:
-                            if keyword.enabled and not keyword.is_generic:
-                                enabled_and_valuable_matched_keywords.append(keyword)
-                    else:
-                        should_be_skipped = True
-                        for keyword in all_matched_keywords:
-                            if keyword.enabled and keyword.is_generic:
-                                enabled_and_valuable_matched_keywords.append(keyword)
-                    if enabled_and_valuable_matched_keywords:
-                        should_be_skipped = False
-                    if should_be_skipped:
-                        custom_logger.warning(f'Record "{post_data.title}" ({post_data.url}) marked as skipped after keywords check')
-                        state = DigestRecordState.SKIPPED.name
-                    else:
-                        all_proprietary = True
-                        for keyword in enabled_and_valuable_matched_keywords:
-                            if not keyword.proprietary:
-                                all_proprietary = False
-                                break
-                        if all_proprietary and enabled_and_valuable_matched_keywords:
-                            custom_logger.warning(f'Record "{post_data.title}" ({post_data.url}) marked as skipped because all it\'s enabled and valuable keywords {[k.name for k in enabled_and_valuable_matched_keywords]} are proprietary')
-                            state = DigestRecordState.SKIPPED.name
+                    state = self._state_after_keywords_check(post_data, posts_data_one, all_matched_keywords)
                 description = post_data.brief
-                cleared_description = BeautifulSoup(description, 'lxml').text if description else None
+                cleared_description = html_to_text(description) if description else None
                 digest_record = DigestRecord(dt=post_data.dt,
                                              source=source,
                                              gather_dt=datetime.datetime.now(tz=dateutil.tz.tzlocal()),
@@ -184,73 +341,187 @@ class Command(BaseCommand):
                                              language=source.language,
                                              description=description,
                                              cleared_description=cleared_description)
-                digest_record.save()
-                digest_record.projects.set(source.projects.all())
-                if all_matched_keywords:
-                    digest_record.title_keywords.set(all_matched_keywords)
-                digest_record.save()
-                if digest_record.language == Language.ENGLISH.name:
-                    if cleared_description:
-                        self._save_lemmas(digest_record, cleared_description)
-                    else:
-                        custom_logger.debug(f'Skipped parsing lemmas for "{digest_record.title}" because cleared description is empty')
+                digest_records_to_add.append(digest_record)
+                digest_records_to_add_keywords.append(all_matched_keywords)
+                digest_records_to_add_urls.add(post_data.url)
+        with transaction.atomic():
+            already_existing_digest_records_dt_updated_count = known_digest_records.save_fixed_dts()
+            DigestRecord.objects.bulk_create(digest_records_to_add)
+            DigestRecord.projects.through.objects.bulk_create([
+                DigestRecord.projects.through(digestrecord_id=digest_record.id, project_id=project.id)
+                for digest_record in digest_records_to_add
+                for project in source_projects
+            ])
+            DigestRecord.title_keywords.through.objects.bulk_create([
+                DigestRecord.title_keywords.through(digestrecord_id=digest_record.id, keyword_id=keyword_id)
+                for digest_record, keywords in zip(digest_records_to_add, digest_records_to_add_keywords)
+                for keyword_id in set(keyword.id for keyword in keywords)
+            ])
+            # Signals are not sent on bulk creation
+            refresh_categorization_queue(digest_record.id for digest_record in digest_records_to_add)
+            added_digest_records_count = len(digest_records_to_add)
+            iteration.saved_count = added_digest_records_count
+            iteration.save()
+            # Remember HTTP validators only when records are saved, otherwise next gathering could skip posts
+            source.http_etag = self._http_validator_to_save('http_etag', posts_data_one)
+            source.http_last_modified = self._http_validator_to_save('http_last_modified', posts_data_one)
+            source.save(update_fields=['http_etag', 'http_last_modified'])
+        for digest_record in digest_records_to_add:
+            custom_logger.debug(f'Added {digest_record.dt} "{digest_record.title}" ({digest_record.url}) to database')
+            if digest_record.language == Language.ENGLISH.name:
+                if digest_record.cleared_description:
+                    self.digest_records_to_lemmatize.append(digest_record)
                 else:
-                    custom_logger.debug(f'Skipped parsing lemmas for "{digest_record.title}" because it is not english')
-                added_digest_records_count += 1
-                custom_logger.debug(f'Added {short_post_data_str} to database')
-        iteration.saved_count = added_digest_records_count
-        iteration.save()
+                    custom_logger.debug(f'Skipped parsing lemmas for "{digest_record.title}" because cleared description is empty')
+            else:
+                custom_logger.debug(f'Skipped parsing lemmas for "{digest_record.title}" because it is not english')
         custom_logger.info(f'Finished saving to database for source "{posts_data_one.source_name}", added {added_digest_records_count} digest record(s), {already_existing_digest_records_count} already existed, dates filled for {already_existing_digest_records_dt_updated_count} existing record(s)')
 
-    def _save_lemmas(self, digest_record, cleared_description):
-        words = nltk.word_tokenize(cleared_description)
-        word_lemmas_counts = {}
-        for word in words:
-            word_lemmas = lemminflect.getAllLemmas(word)
-            lemmas_keys = ('NOUN', 'VERB', 'AUX', 'ADV', 'ADJ')
-            word_lemmas_plain = []
-            for lk in lemmas_keys:
-                if lk in word_lemmas:
-                    word_lemmas_plain += (l.lower() for l in word_lemmas[lk])
-            if not word_lemmas and re.match(r'\w', word):
-                word_lemmas_plain.append(word.lower())
-            for l in word_lemmas_plain:
-                if l not in word_lemmas_counts:
-                    word_lemmas_counts[l] = 1
-                else:
-                    word_lemmas_counts[l] += 1
-        for lemma_text, lemma_count_in_dr in word_lemmas_counts.items():
-            existing_lemmas = Lemma.objects.filter(text=lemma_text)
-            if not existing_lemmas:
-                lemma_object = Lemma(text=lemma_text)
-                lemma_object.save()
-            else:
-                lemma_object = existing_lemmas[0]
-            existing_digest_record_lemmas = DigestRecordLemma.objects.filter(lemma=lemma_object,
-                                                                             digest_record=digest_record)
-            if not existing_digest_record_lemmas:
-                digest_record_lemma = DigestRecordLemma(lemma=lemma_object,
-                                                        digest_record=digest_record,
-                                                        count=lemma_count_in_dr)
-                digest_record_lemma.save()
+    @staticmethod
+    def _http_validator_to_save(field_name: str, posts_data_one: PostsData):
+        # Too long validator is not saved, so saving does not fail, next gathering is just not conditional then
+        value = getattr(posts_data_one, field_name)
+        max_length = DigestRecordsSource._meta.get_field(field_name).max_length
+        if value is not None and len(value) > max_length:
+            custom_logger.warning(f'Not saving {field_name} of {len(value)} characters for source "{posts_data_one.source_name}", '
+                                  f'maximum is {max_length}')
+            return None
+        return value
+
+    @staticmethod
+    def _keywords_by_name(posts_data_list: List[PostData]) -> Dict[str, List[Keyword]]:
+        keywords_names = set(keyword_name for post_data in posts_data_list for keyword_name in post_data.keywords)
+        keywords_by_name = {}
+        for keyword in Keyword.objects.filter(name__in=keywords_names):
+            keywords_by_name.setdefault(keyword.name, []).append(keyword)
+        return keywords_by_name
+
+    @staticmethod
+    def _state_after_keywords_check(post_data: PostData, posts_data_one: PostsData, all_matched_keywords: List[Keyword]):
+        state = DigestRecordState.UNKNOWN.name
+        enabled_and_valuable_matched_keywords = []
+        if not posts_data_one.filters:
+            for keyword in all_matched_keywords:
+                if keyword.enabled:
+                    enabled_and_valuable_matched_keywords.append(keyword)
+            should_be_skipped = False
+        elif FiltrationType.SPECIFIC in posts_data_one.filters \
+                and FiltrationType.GENERIC in posts_data_one.filters:
+            should_be_skipped = True
+            for keyword in all_matched_keywords:
+                if keyword.enabled:
+                    enabled_and_valuable_matched_keywords.append(keyword)
+        elif FiltrationType.SPECIFIC in posts_data_one.filters:
+            should_be_skipped = True
+            for keyword in all_matched_keywords:
+                if keyword.enabled and not keyword.is_generic:
+                    enabled_and_valuable_matched_keywords.append(keyword)
+        else:
+            should_be_skipped = True
+            for keyword in all_matched_keywords:
+                if keyword.enabled and keyword.is_generic:
+                    enabled_and_valuable_matched_keywords.append(keyword)
+        if enabled_and_valuable_matched_keywords:
+            should_be_skipped = False
+        if should_be_skipped:
+            custom_logger.warning(f'Record "{post_data.title}" ({post_data.url}) marked as skipped after keywords check')
+            state = DigestRecordState.SKIPPED.name
+        else:
+            all_proprietary = True
+            for keyword in enabled_and_valuable_matched_keywords:
+                if not keyword.proprietary:
+                    all_proprietary = False
+                    break
+            if all_proprietary and enabled_and_valuable_matched_keywords:
+                custom_logger.warning(f'Record "{post_data.title}" ({post_data.url}) marked as skipped because all it\'s enabled and valuable keywords {[k.name for k in enabled_and_valuable_matched_keywords]} are proprietary')
+                state = DigestRecordState.SKIPPED.name
+        return state
+
+    @staticmethod
+    def _load_words_lemmas_cache():
+        if lemmas_cache_file_path is not None and os.path.exists(lemmas_cache_file_path):
+            words_lemmas_cache.load(lemmas_cache_file_path)
+            custom_logger.info(f'Loaded {len(words_lemmas_cache)} word(s) lemmas from "{lemmas_cache_file_path}"')
+
+    def _save_lemmas(self, digest_records: List[DigestRecord]):
+        custom_logger.info(f'Parsing lemmas for {len(digest_records)} digest record(s)')
+        lemmas_counts_by_digest_record_id = {digest_record.id: lemmas_counts(digest_record.cleared_description)
+                                             for digest_record in digest_records}
+        saved_count = save_digest_records_lemmas(lemmas_counts_by_digest_record_id)
+        custom_logger.info(f'Saved {saved_count} lemma(s) connections to {len(digest_records)} digest record(s)')
+        custom_logger.info(f'Words lemmas cache: {words_lemmas_cache.stats()}')
+        if lemmas_cache_file_path is not None and digest_records:
+            words_lemmas_cache.save(lemmas_cache_file_path)
+            custom_logger.info(f'Saved {len(words_lemmas_cache)} word(s) lemmas to "{lemmas_cache_file_path}"')
+
+    def _save_summary(self):
+        # Slowest sources go first
+        iterations = sorted(self.iterations, key=self._iteration_time, reverse=True)
+        summary = {
+            'sources_count': len(iterations),
+            'time': sum(self._iteration_time(iteration) for iteration in iterations),
+            'bytes_downloaded': sum(iteration.bytes_downloaded or 0 for iteration in iterations),
+            'queries_count': sum(iteration.queries_count or 0 for iteration in iterations),
+            'saved_count': sum(iteration.saved_count or 0 for iteration in iterations),
+            'sources': [
+                {
+                    'source': iteration.source.name,
+                    'time': self._iteration_time(iteration),
+                    'http_status': iteration.http_status,
+                    'bytes_downloaded': iteration.bytes_downloaded,
+                    'fetch_time': iteration.fetch_time,
+                    'parse_time': iteration.parse_time,
+                    'filtration_time': iteration.filtration_time,
+                    'save_time': iteration.save_time,
+                    'queries_count': iteration.queries_count,
+                    'overall_count': iteration.overall_count,
+                    'gathered_count': iteration.gathered_count,
+                    'saved_count': iteration.saved_count,
+                    'not_modified': iteration.not_modified,
+                    'error': iteration.source_error or iteration.parser_error,
+                }
+                for iteration in iterations
+            ],
+        }
+        custom_logger.info(f'Gathering summary: {json.dumps(summary)}')
+        if summary_file_path is not None:
+            with open(summary_file_path, 'w') as fout:
+                json.dump(summary, fout, indent=2)
+            custom_logger.info(f'Saved gathering summary to "{summary_file_path}"')
+
+    @staticmethod
+    def _iteration_time(iteration: DigestGatheringIteration) -> float:
+        stages_times = (iteration.fetch_time, iteration.parse_time, iteration.filtration_time, iteration.save_time)
+        return sum(stage_time for stage_time in stages_times if stage_time is not None)
 
     def _init_globals(self, **options):
         if options['debug']:
             custom_logger.console_handler.setLevel(logging.DEBUG)
+        DigestRecordsSourcesRegistry.invalidate()
         global days_count
         days_count = options['DAYS_COUNT']
-        module = options['MODULE']
+        global workers_count
+        workers_count = options['workers']
+        global conditional_requests_enabled
+        # Recorded responses should have bodies to be replayed, so conditional requests are not sent while recording
+        conditional_requests_enabled = not options['force_fetch'] and options['record_responses'] is None
+        global lemmatization_deferred
+        lemmatization_deferred = options['defer_lemmatization']
+        global lemmas_cache_file_path
+        lemmas_cache_file_path = options['lemmas_cache_file']
+        global summary_file_path
+        summary_file_path = options['summary_file']
+        global responses_recording_directory
+        responses_recording_directory = options['record_responses']
+        if workers_count < 1:
+            custom_logger.error(f'Workers count should be positive, got {workers_count}')
+            sys.exit(1)
+        global selected_module
+        selected_module = options['MODULE']
         global parsing_modules_names
-        projects = Project.objects.values_list('name', flat=True)
-        if module == 'ALL':
-            sources_selected_by_user = DigestRecordsSource.objects.all()
-        elif module in projects:
-            sources_selected_by_user = DigestRecordsSource.objects.filter(projects__name__in=(module,))
-        else:
-            sources_names_selected_by_user = module.split(',')
-            sources_selected_by_user = [source for source in DigestRecordsSource.objects.all() if source.name in sources_names_selected_by_user]
+        sources_selected_by_user = self._sources_selected_by_user()
         if not sources_selected_by_user:
-            custom_logger.error(f'Failed to find parsing modules matched "{module}"')
+            custom_logger.error(f'Failed to find parsing modules matched "{selected_module}"')
             sys.exit(1)
         enabled_sources_selected_by_user = []
         for source in sources_selected_by_user:
@@ -260,15 +531,34 @@ class Command(BaseCommand):
                 custom_logger.warning(f'Source "{source.name}" is disabled, not parsing')
         parsing_modules_names = [s.name for s in enabled_sources_selected_by_user]
 
+    @staticmethod
+    def _sources_selected_by_user() -> List[DigestRecordsSource]:
+        projects = Project.objects.values_list('name', flat=True)
+        if selected_module == 'ALL':
+            return DigestRecordsSourcesRegistry.all()
+        elif selected_module in projects:
+            return [source for source in DigestRecordsSourcesRegistry.all()
+                    if selected_module in [project.name for project in source.projects.all()]]
+        else:
+            sources_names_selected_by_user = selected_module.split(',')
+            return [source for source in DigestRecordsSourcesRegistry.all() if source.name in sources_names_selected_by_user]
+
 
 class ParsingModuleFactory:
 
     @staticmethod
-    def create(parsing_module_names: List[str], logger) -> List[BasicParsingModule]:
-        return [ParsingModuleFactory.create_one(parsing_module_name, logger) for parsing_module_name in parsing_module_names]
+    def create(parsing_module_names: List[str], logger, http_client: HttpClient = None) -> List[BasicParsingModule]:
+        return [ParsingModuleFactory.create_one(parsing_module_name, logger, http_client) for parsing_module_name in parsing_module_names]
 
     @staticmethod
-    def create_one(parsing_module_name: str, logger) -> BasicParsingModule:
-        parsing_module_constructor = globals()[parsing_module_name + 'ParsingModule']
-        parsing_module = parsing_module_constructor(logger)
+    def create_one(parsing_module_name: str, logger, http_client: HttpClient = None) -> BasicParsingModule:
+        source = DigestRecordsSourcesRegistry.get(parsing_module_name)
+        if source.parsing_module_kind:
+            return create_configured_parsing_module(source, logger, http_client)
+        # Sources without kind need hand-written parsing modules
+        parsing_module_class_name = parsing_module_name + 'ParsingModule'
+        if parsing_module_class_name not in globals():
+            raise Exception(f'Source "{parsing_module_name}" has no parsing module kind and no parsing module class')
+        parsing_module_constructor = globals()[parsing_module_class_name]
+        parsing_module = parsing_module_constructor(logger, http_client)
         return parsing_module
@@ -0,0 +1,183 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
+
+
+DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_RETRIES_COUNT = 3
+DEFAULT_RETRIES_BACKOFF_FACTOR = 0.5
+RETRIED_STATUS_CODES = (429, 500, 502, 503, 504)
+# Count of hosts which connections pools are kept alive, should be not less than count of different sources hosts
+DEFAULT_HOSTS_POOLS_COUNT = 128
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+DEFAULT_POLITE_CONNECTIONS_PER_HOST = 1
+DEFAULT_POLITE_DELAY_SECONDS = 1.0
+
+
+# Session shared by parsing modules: keeps connections alive and pooled per host, so requests to the same host
+# reuse TCP and TLS connections, retries failed requests with backoff and applies the same timeout to all requests
+class HttpClient(requests.Session):
+
+    def __init__(self,
+                 timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 retries_count: int = DEFAULT_RETRIES_COUNT,
+                 retries_backoff_factor: float = DEFAULT_RETRIES_BACKOFF_FACTOR,
+                 max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                 recording_directory: str = None,
+                 replaying_directory: str = None):
+        super().__init__()
+        self.timeout = timeout
+        retry = Retry(total=retries_count,
+                      backoff_factor=retries_backoff_factor,
+                      status_forcelist=RETRIED_STATUS_CODES,
+                      raise_on_status=False)
+        adapter_kwargs = {
+            'pool_connections': DEFAULT_HOSTS_POOLS_COUNT,
+            'pool_maxsize': max_connections_per_host,
+            # Blocking pool makes threads wait for free connection instead of opening more than allowed per host
+            'pool_block': True,
+            'max_retries': retry,
+        }
+        if replaying_directory is not None:
+            adapter = ReplayingHTTPAdapter(replaying_directory)
+        elif recording_directory is not None:
+            adapter = RecordingHTTPAdapter(recording_directory, **adapter_kwargs)
+        else:
+            adapter = HTTPAdapter(**adapter_kwargs)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+class ResponsesSnapshots:
+    # Directory with responses saved as pairs of files named by request hash: JSON with status and headers
+    # and body, decompressed, so snapshots are replayed without network
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @staticmethod
+    def _key(request) -> str:
+        return hashlib.sha1(f'{request.method} {request.url}'.encode('utf-8')).hexdigest()
+
+    def _paths(self, request):
+        key = self._key(request)
+        return os.path.join(self.directory, f'{key}.json'), os.path.join(self.directory, f'{key}.body')
+
+    def save(self, request, status: int, reason: str, headers: dict, body: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        meta_path, body_path = self._paths(request)
+        with open(body_path, 'wb') as fout:
+            fout.write(body)
+        # Body is saved decompressed and whole, so headers describing transfer are not valid for it
+        headers = {name: value for name, value in headers.items()
+                   if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+        with open(meta_path, 'w') as fout:
+            json.dump({'method': request.method, 'url': request.url, 'status': status, 'reason': reason, 'headers': headers},
+                      fout,
+                      indent=2)
+
+    def load(self, request):
+        meta_path, body_path = self._paths(request)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r') as fin:
+            meta = json.load(fin)
+        with open(body_path, 'rb') as fin:
+            body = fin.read()
+        return meta, body
+
+    @staticmethod
+    def build_raw_response(meta: dict, body: bytes) -> HTTPResponse:
+        return HTTPResponse(body=io.BytesIO(body),
+                            headers=meta['headers'],
+                            status=meta['status'],
+                            reason=meta['reason'],
+                            preload_content=False,
+                            decode_content=False)
+
+
+# Transport adapter sending requests to network and saving snapshots of their responses
+class RecordingHTTPAdapter(HTTPAdapter):
+
+    def __init__(self, directory: str, **kwargs):
+        super().__init__(**kwargs)
+        self.snapshots = ResponsesSnapshots(directory)
+
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=False, **kwargs)
+        self.snapshots.save(request, response.status_code, response.reason, dict(response.headers), response.content)
+        # Response is rebuilt from snapshot, so it is read by caller same way as it will be when replayed
+        meta, body = self.snapshots.load(request)
+        return self.build_response(request, ResponsesSnapshots.build_raw_response(meta, body))
+
+
+# Transport adapter answering requests with responses recorded by RecordingHTTPAdapter, without network
+class ReplayingHTTPAdapter(HTTPAdapter):
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.snapshots = ResponsesSnapshots(directory)
+
+    def send(self, request, stream=False, **kwargs):
+        snapshot = self.snapshots.load(request)
+        if snapshot is None:
+            raise requests.exceptions.ConnectionError(f'No recorded response for {request.method} {request.url}',
+                                                      request=request)
+        meta, body = snapshot
+        return self.build_response(request, ResponsesSnapshots.build_raw_response(meta, body))
+
+
+_default_http_client = None
+_default_http_client_lock = threading.Lock()
+
+
+def default_http_client() -> HttpClient:
+    global _default_http_client
+    with _default_http_client_lock:
+        if _default_http_client is None:
+            _default_http_client = HttpClient()
+        return _default_http_client
+
+
+# Keeps many threads from overloading one site: limits count of simultaneous requests to each host
+# and delays requests to the same host so they start not more often than once per delay
+class HostsPolitenessLimiter:
+
+    def __init__(self,
+                 max_connections_per_host: int = DEFAULT_POLITE_CONNECTIONS_PER_HOST,
+                 delay_seconds: float = DEFAULT_POLITE_DELAY_SECONDS):
+        self.max_connections_per_host = max_connections_per_host
+        self.delay_seconds = delay_seconds
+        self._lock = threading.Lock()
+        self._semaphores_by_host = {}
+        self._next_request_times_by_host = {}
+
+    @contextmanager
+    def request_slot(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores_by_host:
+                self._semaphores_by_host[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            semaphore = self._semaphores_by_host[host]
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                request_time = max(now, self._next_request_times_by_host.get(host, now))
+                self._next_request_times_by_host[host] = request_time + self.delay_seconds
+            if request_time > now:
+                time.sleep(request_time - now)
+            yield
@@ -0,0 +1,9 @@
+#!/usr/bin/env bash
+# Add "30 * * * * /ABSOLUTE_PATH_TO_SCRIPT/lemmatizedigestrecords.cron.sh" to your crontab
+# if gathering is run with `--defer-lemmatization` option
+
+SCRIPT_DIRECTORY="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
+cd "$SCRIPT_DIRECTORY/../../../../"
+source env/bin/activate
+cd fngs
+python3 manage.py lemmatizedigestrecords
@@ -0,0 +1,130 @@
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from enum import Enum
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from django.core.management.base import BaseCommand
+from django.db.models import (
+    Exists,
+    OuterRef,
+)
+
+from ds.lemmas import (
+    lemmas_counts,
+    save_digest_records_lemmas,
+)
+from ds.models import LemmatizedDigestRecord
+from gatherer.models import (
+    DigestRecord,
+    Language,
+)
+
+
+class LemmatizerMode(Enum):
+    ADHOC = 'adhoc'
+    DAEMON = 'daemon'
+
+
+DEFAULT_LEMMATIZER_MODE = LemmatizerMode.ADHOC
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_DAEMON_TIMEOUT_SECONDS = 300
+
+
+def digest_records_to_lemmatize():
+    lemmatized_digest_records = LemmatizedDigestRecord.objects.filter(digest_record=OuterRef('pk'))
+    return DigestRecord.objects.filter(
+        language=Language.ENGLISH.name,
+        cleared_description__isnull=False,
+    ).exclude(
+        cleared_description='',
+    ).filter(
+        ~Exists(lemmatized_digest_records),
+    ).order_by('id')
+
+
+def _lemmas_counts_by_digest_record_id(digest_records_descriptions: List[Tuple[int, str]]) -> Dict[int, Dict[str, int]]:
+    # Runs in pool process, so works only with data passed to it and does not touch database
+    return {digest_record_id: lemmas_counts(cleared_description)
+            for digest_record_id, cleared_description in digest_records_descriptions}
+
+
+class Command(BaseCommand):
+
+    help = 'Parse and save lemmas of English digest records which are not lemmatized yet (in adhoc or daemon mode)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-p',
+                            '--processes',
+                            type=int,
+                            default=os.cpu_count(),
+                            help=f'count of processes parsing lemmas in parallel, default - count of CPUs ({os.cpu_count()})')
+        parser.add_argument('-c',
+                            '--chunk-size',
+                            type=int,
+                            default=DEFAULT_CHUNK_SIZE,
+                            help=f'count of digest records parsed by one process at once and saved together, default - {DEFAULT_CHUNK_SIZE}')
+        parser.add_argument('-t',
+                            '--timeout',
+                            type=int,
+                            default=DEFAULT_DAEMON_TIMEOUT_SECONDS,
+                            help=f'seconds to sleep between runs in `daemon` mode, default - {DEFAULT_DAEMON_TIMEOUT_SECONDS}')
+        parser.add_argument('-m',
+                            '--mode',
+                            choices=[mode.value for mode in LemmatizerMode],
+                            default=DEFAULT_LEMMATIZER_MODE.value,
+                            help=f'lemmatizer mode, default - `{DEFAULT_LEMMATIZER_MODE.value}`')
+        parser.add_argument('-d',
+                            '--debug',
+                            action='store_true',
+                            help='debug mode')
+
+    def handle(self, *args, **options):
+        logging.basicConfig(level=logging.INFO if not options['debug'] else logging.DEBUG,
+                            format='[%(asctime)s] %(levelname)s: %(message)s')
+        try:
+            mode = LemmatizerMode(options['mode'])
+            logging.info(f'Using `{mode.value}` mode')
+            # Pool is created before any query, so forked processes do not inherit database connection
+            with multiprocessing.get_context('fork').Pool(options['processes']) as pool:
+                while True:
+                    self._lemmatize_all(pool, options['processes'], options['chunk_size'])
+                    if mode is not LemmatizerMode.DAEMON:
+                        break
+                    logging.info(f'Sleeping {options["timeout"]} second(s)')
+                    time.sleep(options['timeout'])
+        except KeyboardInterrupt:
+            logging.info('Interrupted')
+        except Exception as e:
+            logging.error(e)
+            sys.exit(1)
+
+    @staticmethod
+    def _lemmatize_all(pool, processes_count: int, chunk_size: int):
+        # Lemmas of each chunk are saved as soon as it is parsed, so interrupted run is continued by next one
+        # from records left not lemmatized
+        left_count = digest_records_to_lemmatize().count()
+        logging.info(f'{left_count} not lemmatized digest record(s) found')
+        lemmatized_count = 0
+        last_id = 0
+        while True:
+            digest_records_descriptions = list(digest_records_to_lemmatize()
+                                               .filter(id__gt=last_id)
+                                               .values_list('id', 'cleared_description')[:processes_count * chunk_size])
+            if not digest_records_descriptions:
+                break
+            last_id = digest_records_descriptions[-1][0]
+            chunks = [digest_records_descriptions[i:i + chunk_size]
+                      for i in range(0, len(digest_records_descriptions), chunk_size)]
+            for lemmas_counts_by_digest_record_id in pool.imap(_lemmas_counts_by_digest_record_id, chunks):
+                saved_count = save_digest_records_lemmas(lemmas_counts_by_digest_record_id)
+                lemmatized_count += len(lemmas_counts_by_digest_record_id)
+                logging.debug(f'Saved {saved_count} lemma(s) connections to {len(lemmas_counts_by_digest_record_id)} digest record(s)')
+            logging.info(f'Lemmatized {lemmatized_count} of {left_count} digest record(s)')
+        logging.info(f'Finished, lemmatized {lemmatized_count} digest record(s)')
@@ -0,0 +1,87 @@
+import datetime
+import random
+from typing import (
+    List,
+    Tuple,
+)
+
+import dateutil.tz
+from django.db.models import (
+    Max,
+    Q,
+    Sum,
+)
+
+from gatherer.models import DigestGatheringIteration
+
+
+DEFAULT_RATE_PERIOD_DAYS = 14
+DEFAULT_MIN_POLLING_INTERVAL_SECONDS = 15 * 60
+DEFAULT_MAX_POLLING_INTERVAL_SECONDS = 24 * 60 * 60
+DEFAULT_POLLING_JITTER = 0.1
+
+
+class PollingScheduler:
+    # Decides which sources should be gathered now: each source is polled about as often as it published new posts
+    # during rate period, so busy sources are polled often and dormant ones rarely. Intervals are limited by min and
+    # max ones and randomly stretched or shrunk by jitter, so sources with same rates are not polled all at once.
+    # Next poll time is drawn once after each gathering of source and kept until source is gathered again, otherwise
+    # each plan would be another chance for source to become due earlier
+
+    def __init__(self,
+                 min_interval_seconds: float = DEFAULT_MIN_POLLING_INTERVAL_SECONDS,
+                 max_interval_seconds: float = DEFAULT_MAX_POLLING_INTERVAL_SECONDS,
+                 jitter: float = DEFAULT_POLLING_JITTER,
+                 rate_period_days: int = DEFAULT_RATE_PERIOD_DAYS):
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.jitter = jitter
+        self.rate_period_days = rate_period_days
+        # Source name -> (date&time of its last gathering, date&time of its next poll)
+        self._next_polls_dts = {}
+
+    def polling_interval_seconds(self, saved_count: int) -> float:
+        if saved_count:
+            interval_seconds = self.rate_period_days * 24 * 60 * 60 / saved_count
+            interval_seconds = min(max(interval_seconds, self.min_interval_seconds), self.max_interval_seconds)
+        else:
+            interval_seconds = self.max_interval_seconds
+        return interval_seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def plan(self, sources_names: List[str]) -> Tuple[List[str], float]:
+        # Returns names of sources to gather now and seconds to wait until next source should be gathered
+        now = datetime.datetime.now(tz=dateutil.tz.tzlocal())
+        rate_period_start = now - datetime.timedelta(days=self.rate_period_days)
+        sources_polling_stats = {
+            polling_stats['source__name']: polling_stats
+            for polling_stats in DigestGatheringIteration.objects.filter(
+                source__name__in=sources_names,
+            ).values(
+                'source__name',
+            ).annotate(
+                saved_count_sum=Sum('saved_count', filter=Q(dt__gte=rate_period_start)),
+                last_dt=Max('dt'),
+            )
+        }
+        due_sources_names = []
+        seconds_until_next_poll = self.max_interval_seconds
+        next_polls_dts = {}
+        for source_name in sources_names:
+            polling_stats = sources_polling_stats.get(source_name)
+            if polling_stats is None:
+                due_sources_names.append(source_name)
+                continue
+            last_dt, next_poll_dt = self._next_polls_dts.get(source_name, (None, None))
+            if last_dt != polling_stats['last_dt']:
+                last_dt = polling_stats['last_dt']
+                interval_seconds = self.polling_interval_seconds(polling_stats['saved_count_sum'])
+                next_poll_dt = last_dt + datetime.timedelta(seconds=interval_seconds)
+            next_polls_dts[source_name] = (last_dt, next_poll_dt)
+            seconds_until_poll = (next_poll_dt - now).total_seconds()
+            if seconds_until_poll <= 0:
+                due_sources_names.append(source_name)
+            else:
+                seconds_until_next_poll = min(seconds_until_next_poll, seconds_until_poll)
+        # Sources which are not polled anymore are forgotten
+        self._next_polls_dts = next_polls_dts
+        return due_sources_names, seconds_until_next_poll
@@ -1,25 +1,52 @@
+import codecs
 import requests
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+from urllib.parse import (
+    urljoin,
+    urlparse,
+)
 from typing import List, Tuple
 from abc import ABCMeta, abstractmethod
 import xml.etree.ElementTree as ET
-from lxml import html
+from lxml import (
+    etree,
+    html,
+)
 import requests
+from requests.compat import chardet
 import re
 from pprint import pprint
 import traceback
 import datetime
 import dateutil
 from copy import copy
+import functools
 import pytz
+import threading
+import time
 
+from gatherer.htmltext import element_text
 from gatherer.models import *
+from gatherer.keywordsmatcher import cached_keywords_matcher
+from .httpclient import (
+    HttpClient,
+    default_http_client,
+)
+
+
+# Projects are resolved on first use, not on import, so importing this module does not touch database
+@functools.lru_cache(maxsize=None)
+def project_by_name(name: str) -> Project:
+    return Project.objects.get(name=name)
+
+
+def os_friday_project() -> Project:
+    return project_by_name('OS Friday')
 
 
-foss_news_project = Project.objects.get(name='FOSS News')
-os_friday_project = Project.objects.get(name='OS Friday')
 FOSS_NEWS_REGEXP = r'^FOSS News №\d+.*$'
+HTML_CHUNK_SIZE = 64 * 1024
+HTML_META_CHARSET_REGEXP = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+DEFAULT_HTML_ENCODING = 'utf-8'
 
 
 def shorten_text(s: str, max_length: int = 20):
@@ -31,6 +58,55 @@ def shorten_text(s: str, max_length: int = 20):
         return s[:max_length - 3] + '...'
 
 
+def container_xpath(container_tag: str, container_class: str) -> str:
+    # Matches elements like BeautifulSoup `find(tag, class)` does: class with spaces should be equal to whole class
+    # attribute, otherwise it should be one of element classes
+    if not container_class:
+        return f'//{container_tag}'
+    if ' ' in container_class.strip():
+        return f'//{container_tag}[@class="{container_class}"]'
+    return f'//{container_tag}[contains(concat(" ", normalize-space(@class), " "), " {container_class} ")]'
+
+
+def known_encoding(encoding: str) -> bool:
+    if not encoding:
+        return False
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return False
+    return True
+
+
+def html_encoding(response, first_chunk: bytes) -> str:
+    # Encoding from headers, then from page meta tag, then detected from page beginning, like BeautifulSoup did,
+    # libxml2 is not left to guess it, as it takes UTF-8 pages without meta tag for Latin-1 ones
+    # Unknown encodings are skipped, as parser fails to be created with them
+    if 'charset' in response.headers.get('Content-Type', '').lower() and known_encoding(response.encoding):
+        return response.encoding
+    meta_charset_match = HTML_META_CHARSET_REGEXP.search(first_chunk)
+    if meta_charset_match:
+        meta_charset = meta_charset_match.group(1).decode('ascii')
+        if known_encoding(meta_charset):
+            return meta_charset
+    detected_encoding = chardet.detect(first_chunk)['encoding'] if chardet is not None else None
+    if detected_encoding is None or detected_encoding.lower() == 'ascii':
+        return DEFAULT_HTML_ENCODING
+    return detected_encoding
+
+
+class FetchedContainer:
+    # Post page element containing post text, converts to its HTML when saved as digest record text
+
+    def __init__(self, element):
+        self.html = html.tostring(element, encoding='unicode', with_tail=False)
+        # Text is taken after HTML, as not text elements are removed from element
+        self.text = element_text(element)
+
+    def __str__(self):
+        return self.html
+
+
 class PostData:
 
     def __init__(self,
@@ -58,13 +134,20 @@ class PostsData:
                  posts_data_list: List[PostData],
                  language: Language,
                  filters: List['FiltrationType'],
-                 warning: str = None):
+                 warning: str = None,
+                 http_etag: str = None,
+                 http_last_modified: str = None,
+                 outdated_posts_data_list: List[PostData] = None):
         self.source_name = source_name
         self.projects = projects
         self.posts_data_list = posts_data_list
         self.language = language
         self.filters = filters
         self.warning = warning
+        self.http_etag = http_etag
+        self.http_last_modified = http_last_modified
+        # Too old to be saved, but could fill dates of already saved digest records
+        self.outdated_posts_data_list = outdated_posts_data_list if outdated_posts_data_list is not None else []
 
 
 class FiltrationType(Enum):
@@ -72,14 +155,97 @@ class FiltrationType(Enum):
     SPECIFIC = 'specific'
 
 
+class DigestRecordsSourcesRegistry:
+    # All digest records sources with their projects, loaded from database once and kept until explicitly invalidated
+
+    _sources_by_name = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str) -> DigestRecordsSource:
+        sources_by_name = cls._load()
+        if name not in sources_by_name:
+            raise DigestRecordsSource.DoesNotExist(f'Digest records source "{name}" does not exist')
+        return sources_by_name[name]
+
+    @classmethod
+    def all(cls) -> List[DigestRecordsSource]:
+        return list(cls._load().values())
+
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._sources_by_name = None
+
+    @classmethod
+    def _load(cls):
+        with cls._lock:
+            if cls._sources_by_name is None:
+                cls._sources_by_name = {source.name: source
+                                        for source in DigestRecordsSource.objects.prefetch_related('projects').order_by('id')}
+            return cls._sources_by_name
+
+
+class KnownDigestRecords:
+    # Already saved digest records with same URLs as posts have, selected with one query for whole batch of posts
+
+    def __init__(self, posts_data: List[PostData]):
+        urls = set(post_data.url for post_data in posts_data)
+        if urls:
+            known_digest_records = DigestRecord.objects.filter(url__in=urls).only('id', 'url', 'dt')
+        else:
+            known_digest_records = []
+        self._digest_records_by_url = {digest_record.url: digest_record for digest_record in known_digest_records}
+        self._digest_records_with_fixed_dt = {}
+
+    def contains(self, post_data: PostData) -> bool:
+        return post_data.url in self._digest_records_by_url
+
+    def dt_missing(self, post_data: PostData) -> bool:
+        digest_record = self._digest_records_by_url.get(post_data.url)
+        return digest_record is not None and digest_record.dt is None and post_data.dt is not None
+
+    def fix_dt(self, post_data: PostData):
+        digest_record = self._digest_records_by_url[post_data.url]
+        digest_record.dt = post_data.dt
+        self._digest_records_with_fixed_dt[digest_record.id] = digest_record
+
+    def save_fixed_dts(self) -> int:
+        if self._digest_records_with_fixed_dt:
+            DigestRecord.objects.bulk_update(self._digest_records_with_fixed_dt.values(), ['dt'])
+        return len(self._digest_records_with_fixed_dt)
+
+
+class ParsingStats:
+    # Measurements of one parsing module run, saved with gathering iteration, times are in seconds
+
+    def __init__(self):
+        self.http_status = None
+        self.bytes_downloaded = None
+        self.fetch_time = None
+        self.parse_time = None
+        self.filtration_time = None
+        self.queries_count = 0
+
+
+def downloaded_bytes_count(response) -> int:
+    # Count of bytes read from connection, before decompression, or length of content if it is not known
+    if hasattr(response.raw, 'tell'):
+        return response.raw.tell()
+    return len(response.content)
+
+
 class ParsingResult:
 
-    def __init__(self, overall_count, posts_data_after_filtration, source_enabled, source_error, parser_error):
+    def __init__(self, overall_count, posts_data_after_filtration, source_enabled, source_error, parser_error, not_modified=False,
+                 outdated_posts_data=None):
         self.overall_count = overall_count
         self.posts_data_after_filtration: List[PostData] or None = posts_data_after_filtration
+        self.outdated_posts_data: List[PostData] = outdated_posts_data if outdated_posts_data is not None else []
         self.source_enabled: bool = source_enabled
         self.source_error: str or None = source_error
         self.parser_error: str or None = parser_error
+        self.not_modified: bool = not_modified
 
     @property
     def success(self):
@@ -92,6 +258,12 @@ class DigestSourceException(Exception):
         super().__init__(*args, **kwargs)
 
 
+class DigestSourceNotModifiedException(Exception):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
 class BasicParsingModule(metaclass=ABCMeta):
 
     data_url = None
@@ -100,27 +272,45 @@ class BasicParsingModule(metaclass=ABCMeta):
     filtration_needed = False
     filters = []
     language: Language = None
+    conditional_requests_enabled = True
+    # Tag and class of page element containing post text, used to fetch text by post URL
+    text_container: Tuple[str, str] = None
 
-    def __init__(self, logger):
+    def __init__(self, logger, http_client: HttpClient = None, source_name: str = None):
+        self._source_name = source_name
         self.logger = logger
+        self.http_client = http_client if http_client is not None else default_http_client()
+        self.http_etag = None
+        self.http_last_modified = None
+        self.stats = ParsingStats()
 
     @property
     def source_name(self):
+        if self._source_name is not None:
+            return self._source_name
         return self.__class__.__name__.replace('ParsingModule', '')
 
+    @property
+    def source(self) -> DigestRecordsSource:
+        return DigestRecordsSourcesRegistry.get(self.source_name)
+
     @property
     def data_url(self):
-        return DigestRecordsSource.objects.get(name=self.source_name).data_url
+        return self.source.data_url
 
     def language(self):
-        return DigestRecordsSource.objects.get(name=self.source_name).language
+        return self.source.language
 
     def parse(self, days_count: int) -> ParsingResult:
-        if not DigestRecordsSource.objects.get(name=self.source_name).enabled:  # TODO: Check existence
+        if not self.source.enabled:
             self.logger.warning(f'"{self.source_name}" is disabled')
             return ParsingResult(0, [], False, None, None)
+        parsing_started_at = time.monotonic()
         try:
             posts_data: List[PostData] = self._parse()
+        except DigestSourceNotModifiedException as e:
+            self.logger.info(f'"{self.source_name}" not modified since previous gathering: {str(e)}')
+            return ParsingResult(0, [], True, None, None, not_modified=True)
         except DigestSourceException as e:
             self.logger.error(f'Failed to parse "{self.source_name}", source error: {str(e)}')
             return ParsingResult(0, [], True, str(e), None)
@@ -128,47 +318,67 @@ class BasicParsingModule(metaclass=ABCMeta):
             self.logger.error(f'Failed to parse "{self.source_name}", parser error: {str(e)}')
             self.logger.error(traceback.format_exc())
             return ParsingResult(0, [], True, None, str(e))
+        finally:
+            # Fetch time is measured by modules fetching data, rest of time is parse time
+            self.stats.parse_time = time.monotonic() - parsing_started_at - (self.stats.fetch_time or 0)
+        filtration_started_at = time.monotonic()
         try:
-            filtered_posts_data: List[PostData] = self._filter_out(posts_data, days_count)
+            filtered_posts_data, outdated_posts_data = self._filter_out(posts_data, days_count)
             self._fill_keywords(filtered_posts_data)
-            return ParsingResult(len(posts_data), filtered_posts_data, True, None, None)
+            return ParsingResult(len(posts_data), filtered_posts_data, True, None, None,
+                                 outdated_posts_data=outdated_posts_data)
         except Exception as e:
             self.logger.error(f'Failed to filter data parsed from "{self.source_name}" source: {str(e)}')
             self.logger.error(traceback.format_exc())
             return ParsingResult(0, [], True, None, str(e))
+        finally:
+            self.stats.filtration_time = time.monotonic() - filtration_started_at
 
     @abstractmethod
     def _parse(self) -> List[PostData]:
         pass
 
-    def fetch_tag_from_url_by_selector(self, url, container_tag, container_selector):
-        # TODO: Add retries and handle errors
-        response = requests.get(url, timeout=30)
-        html = response.content
-        parser = BeautifulSoup(html, 'html.parser')
-        content = parser.find(container_tag, container_selector)
-        return content
+    def fetch_tag_from_url_by_selector(self, url, container_tag, container_selector) -> 'FetchedContainer':
+        response = self.http_client.get(url, stream=True)
+        with response:
+            if response.status_code != 200:
+                self.logger.error(f'Failed to fetch "{url}", status code {response.status_code}')
+                return None
+            # Page is parsed while it is downloaded, so neither whole response body nor its decoded copy are kept
+            chunks = response.iter_content(chunk_size=HTML_CHUNK_SIZE)
+            first_chunk = next(chunks, b'')
+            if not first_chunk:
+                self.logger.error(f'Failed to fetch "{url}", page is empty')
+                return None
+            parser = html.HTMLParser(encoding=html_encoding(response, first_chunk))
+            parser.feed(first_chunk)
+            for chunk in chunks:
+                parser.feed(chunk)
+            try:
+                root = parser.close()
+            except etree.LxmlError as e:
+                self.logger.error(f'Failed to parse "{url}": {e}')
+                return None
+        containers = root.xpath(container_xpath(container_tag, container_selector))
+        if not containers:
+            return None
+        return FetchedContainer(containers[0])
 
-    # TODO: Make abstract when it will be implemented for all sources
     def fetch_url(self, url):
-        return None
+        if self.text_container is None:
+            return None
+        return self.fetch_tag_from_url_by_selector(url, *self.text_container)
 
     def _fill_keywords(self, posts_data: List[PostData]):
-        keywords_to_check = []
-        keywords_to_check += [k.name for k in Keyword.objects.all()]
+        keywords_matcher = cached_keywords_matcher()
         for post_data in posts_data:
-            for keyword in keywords_to_check:
-                if keyword in post_data.keywords:
+            for keyword in keywords_matcher.match(post_data.title):
+                if keyword.name in post_data.keywords:
                     continue
-                if BasicParsingModule.find_keyword_in_title(keyword, post_data.title):
-                    post_data.keywords.append(keyword)
+                post_data.keywords.append(keyword.name)
 
-    @staticmethod
-    def find_keyword_in_title(keyword, title):
-        return re.search(rf'\b{re.escape(keyword)}\b', title, re.IGNORECASE)
-
-    def _filter_out(self, source_posts_data: List[PostData], days_count: int):
-        actual_posts_data = self._filter_out_old(source_posts_data, days_count)
+    def _filter_out(self, source_posts_data: List[PostData], days_count: int) -> Tuple[List[PostData], List[PostData]]:
+        actual_posts_data, outdated_posts_data = self._filter_out_old(source_posts_data, days_count)
         outdated_len = len(source_posts_data) - len(actual_posts_data)
         if outdated_len:
             self.logger.info(f'{len(source_posts_data) - len(actual_posts_data)}/{len(source_posts_data)} posts ignored for "{self.source_name}" as too old')
@@ -176,26 +386,23 @@ class BasicParsingModule(metaclass=ABCMeta):
         nonactual_len = len(actual_posts_data) - len(filtered_posts_data)
         if nonactual_len:
             self.logger.info(f'{len(source_posts_data) - len(actual_posts_data)}/{len(source_posts_data)} posts ignored for "{self.source_name}" as not passed keywords filters')
-        return filtered_posts_data
+        return filtered_posts_data, outdated_posts_data
 
     def _filter_out_by_keywords(self, posts_data: List[PostData]):
         if not self.filtration_needed:
             return posts_data
         filtered_posts_data: List[PostData] = []
-        keywords_to_check = []
+        keywords_is_generic_values = []
         if FiltrationType.GENERIC in self.filters:
-            keywords_to_check += [k.name for k in Keyword.objects.filter(is_generic=True, proprietary=False)]
+            keywords_is_generic_values.append(True)
         if FiltrationType.SPECIFIC in self.filters:
-            keywords_to_check += [k.name for k in Keyword.objects.filter(is_generic=False, proprietary=False)]
+            keywords_is_generic_values.append(False)
+        keywords_matcher = cached_keywords_matcher(is_generic__in=tuple(keywords_is_generic_values), proprietary=False)
         for post_data in posts_data:
             if not post_data.title:
                 self.logger.error(f'Empty title for URL {post_data.url}')
                 continue
-            matched = False
-            for keyword in keywords_to_check:
-                if BasicParsingModule.find_keyword_in_title(keyword, post_data.title):
-                    matched = True
-                    break
+            matched = keywords_matcher.matches_any(post_data.title)
             processed_post_data = copy(post_data)
             if matched:
                 self.logger.debug(f'"{post_data.title}" from "{self.source_name}" added because it contains keywords {post_data.keywords}')
@@ -206,25 +413,19 @@ class BasicParsingModule(metaclass=ABCMeta):
             filtered_posts_data.append(processed_post_data)
         return filtered_posts_data
 
-    def _filter_out_old(self, posts_data: List[PostData], days_count: int) -> List[PostData]:
+    def _filter_out_old(self, posts_data: List[PostData], days_count: int) -> Tuple[List[PostData], List[PostData]]:
+        # Outdated posts are returned too, dates of saved digest records are fixed with them later in main thread,
+        # so parsing in worker threads does not write to database
         filtered_posts_data: List[PostData] = []
+        outdated_posts_data: List[PostData] = []
         dt_now = datetime.datetime.now(tz=dateutil.tz.tzlocal())
-        already_existing_digest_records_dt_updated_count = 0
         for post_data in posts_data:
             if post_data.dt is not None and (dt_now - post_data.dt).days > days_count:
                 self.logger.debug(f'"{post_data.title}" from "{self.source_name}" filtered as too old ({post_data.dt})')
-                similar_records = DigestRecord.objects.filter(url=post_data.url)  # TODO: Replace check for similar records before and with "get"
-                if similar_records:
-                    if not similar_records[0].dt:
-                        similar_records[0].dt = post_data.dt
-                        self.logger.debug(f'{post_data.url} already exists in database, but without date, fix it')
-                        already_existing_digest_records_dt_updated_count += 1
-                        similar_records[0].save()
+                outdated_posts_data.append(post_data)
             else:
                 filtered_posts_data.append(post_data)
-        if already_existing_digest_records_dt_updated_count:
-            self.logger.info(f'Few outdated sources found in database without dates, fixed for {already_existing_digest_records_dt_updated_count} sources')
-        return filtered_posts_data
+        return filtered_posts_data, outdated_posts_data
 
 
 class RssBasicParsingModule(BasicParsingModule):
@@ -235,10 +436,15 @@ class RssBasicParsingModule(BasicParsingModule):
     link_tag_name = None
     description_tag_name = None
     no_description = False
+    items_at_root = False
+    # Relative URLs of posts are resolved against it
+    base_url = None
+    # Streaming parsing works with raw response bytes, so it should be disabled for modules preprocessing XML text
+    streaming_parsing_enabled = True
 
-    def __init__(self, logger):
+    def __init__(self, logger, http_client: HttpClient = None, source_name: str = None):
         self.rss_data_root = None
-        super().__init__(logger)
+        super().__init__(logger, http_client, source_name)
 
     def _preprocess_xml(self, text: str):
         return text
@@ -246,65 +452,123 @@ class RssBasicParsingModule(BasicParsingModule):
     def _preprocess_date_str(self, date_str: str):
         return date_str
 
+    def _conditional_request_headers(self):
+        if not self.conditional_requests_enabled:
+            return {}
+        source = self.source
+        headers = {}
+        if source.http_etag:
+            headers['If-None-Match'] = source.http_etag
+        if source.http_last_modified:
+            headers['If-Modified-Since'] = source.http_last_modified
+        return headers
+
     def _parse(self):
         posts_data: List[PostData] = []
-        response = requests.get(self.data_url,
-                                headers={'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'})
-        if response.status_code != 200:
-            raise DigestSourceException(f'"{self.source_name}" returned status code {response.status_code}')
-        else:
-            self.logger.debug(f'Successfully fetched RSS for "{self.source_name}"')
-        self.rss_data_root = ET.fromstring(self._preprocess_xml(response.text))
-        no_description_at_all = True
-        for rss_data_elem in self.rss_items_root():
-            if self.item_tag_name in rss_data_elem.tag:
-                dt = None
-                title = None
-                url = None
-                brief = None
-                for rss_data_subelem in rss_data_elem:
-                    tag = rss_data_subelem.tag
-                    text = rss_data_subelem.text
-                    if self.title_tag_name in tag:
-                        if not text:
-                            continue
-                        title = text.strip()
-                    elif self.pubdate_tag_name in tag:
-                        text = self._preprocess_date_str(text)
-                        text = self._date_from_russian_to_english(text) # TODO: Extract such filter to specific classes
-                        dt: datetime.datetime = dateutil.parser.parse(text)
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=pytz.UTC)
-                    elif self.link_tag_name in tag:
-                        if text:
-                            url = text
-                        elif 'href' in rss_data_subelem.attrib:
-                            url = rss_data_subelem.attrib['href']
-                        else:
-                            self.logger.error(f'Could not find URL for "{title}" feed record')
-                    elif self.description_tag_name in tag:
-                        brief = text
-                        no_description_at_all = False
-                    elif 'group' in tag:
-                        for rss_data_subsubelem in rss_data_subelem:
-                            subtag = rss_data_subsubelem.tag
-                            if self.description_tag_name in subtag:
-                                subtext = rss_data_subsubelem.text
-                                brief = subtext
-                                no_description_at_all = False
-                url = self.process_url(url)
-                if not url:
-                    if title:
-                        self.logger.error(f'Empty URL for title "{title}" for source "{self.source_name}"')
-                    else:
-                        self.logger.error(f'Empty URL and empty title for source "{self.source_name}"')
-                    continue
-                post_data = PostData(dt, title, url, brief)
-                posts_data.append(post_data)
+        fetching_started_at = time.monotonic()
+        response = self.http_client.get(self.data_url,
+                                        headers={'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36',
+                                                 **self._conditional_request_headers()},
+                                        stream=self.streaming_parsing_enabled)
+        # In streaming mode only headers are received here, body is downloaded while it is parsed
+        self.stats.fetch_time = time.monotonic() - fetching_started_at
+        self.stats.http_status = response.status_code
+        with response:
+            if response.status_code == 304:
+                raise DigestSourceNotModifiedException(f'"{self.source_name}" returned status code {response.status_code}')
+            elif response.status_code != 200:
+                raise DigestSourceException(f'"{self.source_name}" returned status code {response.status_code}')
+            else:
+                self.logger.debug(f'Successfully fetched RSS for "{self.source_name}"')
+            self.http_etag = response.headers.get('ETag')
+            self.http_last_modified = response.headers.get('Last-Modified')
+            if self.streaming_parsing_enabled:
+                rss_data_items = self._iterparse_items(response)
+            else:
+                self.rss_data_root = ET.fromstring(self._preprocess_xml(response.text))
+                rss_data_items = (rss_data_elem
+                                  for rss_data_elem in self.rss_items_root()
+                                  if self.item_tag_name in rss_data_elem.tag)
+            no_description_at_all = True
+            for rss_data_elem in rss_data_items:
+                post_data, description_found = self._post_data_from_item(rss_data_elem)
+                if description_found:
+                    no_description_at_all = False
+                if post_data is not None:
+                    posts_data.append(post_data)
+            self.stats.bytes_downloaded = downloaded_bytes_count(response)
         if posts_data and no_description_at_all and not self.no_description:
             self.logger.error(f'No descriptions at all in {self.source_name} source feed')
         return posts_data
 
+    def _iterparse_items(self, response):
+        # Parses raw response bytes incrementally, yields items being direct children of the same element
+        # `rss_items_root` returns for whole tree and drops each of them after processing,
+        # so whole document never stays in memory
+        response.raw.decode_content = True
+        parents = []
+        items_root = None
+        for event, elem in ET.iterparse(response.raw, events=('start', 'end')):
+            if event == 'start':
+                if items_root is None and len(parents) == (0 if self.items_at_root else 1):
+                    items_root = elem
+                parents.append(elem)
+                continue
+            parents.pop()
+            if parents and parents[-1] is items_root and self._is_item_tag(elem.tag):
+                yield elem
+                elem.clear()
+                items_root.remove(elem)
+
+    def _is_item_tag(self, tag: str):
+        # Tag is compared without namespace, e.g. `{http://www.w3.org/2005/Atom}entry` is `entry` item
+        return tag.rsplit('}', 1)[-1] == self.item_tag_name
+
+    def _post_data_from_item(self, rss_data_elem):
+        dt = None
+        title = None
+        url = None
+        brief = None
+        description_found = False
+        for rss_data_subelem in rss_data_elem:
+            tag = rss_data_subelem.tag
+            text = rss_data_subelem.text
+            if self.title_tag_name in tag:
+                if not text:
+                    continue
+                title = text.strip()
+            elif self.pubdate_tag_name in tag:
+                text = self._preprocess_date_str(text)
+                text = self._date_from_russian_to_english(text) # TODO: Extract such filter to specific classes
+                dt: datetime.datetime = dateutil.parser.parse(text)
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=pytz.UTC)
+            elif self.link_tag_name in tag:
+                if text:
+                    url = text
+                elif 'href' in rss_data_subelem.attrib:
+                    url = rss_data_subelem.attrib['href']
+                else:
+                    self.logger.error(f'Could not find URL for "{title}" feed record')
+            elif self.description_tag_name in tag:
+                brief = text
+                description_found = True
+            elif 'group' in tag:
+                for rss_data_subsubelem in rss_data_subelem:
+                    subtag = rss_data_subsubelem.tag
+                    if self.description_tag_name in subtag:
+                        subtext = rss_data_subsubelem.text
+                        brief = subtext
+                        description_found = True
+        url = self.process_url(url)
+        if not url:
+            if title:
+                self.logger.error(f'Empty URL for title "{title}" for source "{self.source_name}"')
+            else:
+                self.logger.error(f'Empty URL and empty title for source "{self.source_name}"')
+            return None, description_found
+        return PostData(dt, title, url, brief), description_found
+
     def _date_from_russian_to_english(self,
                                       datetime_text: str):
         days_map = {
@@ -338,11 +602,13 @@ class RssBasicParsingModule(BasicParsingModule):
         return converted_datetime_text
 
     def process_url(self, url):
+        if url and self.base_url and not urlparse(url).netloc:
+            self.logger.info(f'Relative URL found "{url}", resolving it against base url "{self.base_url}"')
+            return urljoin(self.base_url, url)
         return url
 
-    @abstractmethod
     def rss_items_root(self):
-        pass
+        return self.rss_data_root if self.items_at_root else self.rss_data_root[0]
 
 
 class SimpleRssBasicParsingModule(RssBasicParsingModule):
@@ -353,1761 +619,190 @@ class SimpleRssBasicParsingModule(RssBasicParsingModule):
     link_tag_name = 'link'
     description_tag_name = 'description'
 
-    def rss_items_root(self):
-        return self.rss_data_root[0]
-
-
-class OpenNetRuParsingModule(SimpleRssBasicParsingModule):
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'table', 'ttxt2')
-
-
-class LinuxComParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class OpenSourceComParsingModule(SimpleRssBasicParsingModule):
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'clearfix text-formatted field field--name-body field--type-text-with-summary field--label-hidden field__item')
-
-
-class ItsFossComParsingModule(SimpleRssBasicParsingModule):
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'article', 'content')
-
-
-class LinuxOrgRuParsingModule(SimpleRssBasicParsingModule):
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'msg_body')
-
-
-class AnalyticsIndiaMagComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'elementor-element elementor-element-4dc5d005 elementor-widget elementor-widget-theme-post-content')
-
-
-class ArsTechnicaComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class HackadayComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class JaxenterComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LinuxInsiderComParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class MashableComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    language = Language.ENGLISH
 
+class HabrComBasicParsingModule(SimpleRssBasicParsingModule):
 
-class SdTimesComParsingModule(SimpleRssBasicParsingModule):
+    text_container = ('div', 'tm-article-body')
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
+    def process_url(self, url: str):
+        return re.sub('/\?utm_campaign=.*&utm_source=habrahabr&utm_medium=rss',
+                      '',
+                      url)
 
 
-class SecurityBoulevardComParsingModule(SimpleRssBasicParsingModule):
+class FilterFossNewsItselfMixin:
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
+    def filter_foss_news_itself(self, posts_data: List[PostData]):
+        for post_data in posts_data:
+            if re.fullmatch(FOSS_NEWS_REGEXP, post_data.title):
+                self.logger.warning(f'Filtered "{post_data.title}" as it is our digest itself')
+                post_data.filtered = True
+        return posts_data
 
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'article-content clearfix')
 
+class HabrComOpenSourceParsingModule(HabrComBasicParsingModule,
+                                     FilterFossNewsItselfMixin):
 
-class SiliconAngleComParsingModule(SimpleRssBasicParsingModule):
+    def _parse(self):
+        posts_data: List[PostData] = super()._parse()
+        filtered_posts_data = self.filter_foss_news_itself(posts_data)
+        return filtered_posts_data
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
 
+class HabrComNixParsingModule(HabrComBasicParsingModule,
+                              FilterFossNewsItselfMixin):
 
-class TechCrunchComParsingModule(SimpleRssBasicParsingModule):
+    def _parse(self):
+        posts_data: List[PostData] = super()._parse()
+        filtered_posts_data = self.filter_foss_news_itself(posts_data)
+        return filtered_posts_data
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
 
+class YouTubeComBasicParsingModule(RssBasicParsingModule):
 
-class TechNodeComParsingModule(SimpleRssBasicParsingModule):
+    item_tag_name = 'entry'
+    title_tag_name = 'title'
+    pubdate_tag_name = 'published'
+    link_tag_name = 'link'
+    description_tag_name = 'description'
+    items_at_root = True
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
 
+class PingvinusRuParsingModule(BasicParsingModule):
 
-class TheNextWebComParsingModule(SimpleRssBasicParsingModule):
+    def __init__(self, logger, http_client: HttpClient = None, source_name: str = None):
+        super().__init__(logger, http_client, source_name)
+        self.news_page_url = f'{self.data_url}/news'
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
+    def _parse(self):
+        fetching_started_at = time.monotonic()
+        response = self.http_client.get(self.news_page_url)
+        self.stats.fetch_time = time.monotonic() - fetching_started_at
+        self.stats.http_status = response.status_code
+        self.stats.bytes_downloaded = downloaded_bytes_count(response)
+        if response.status_code != 200:
+            raise DigestSourceException(f'"{self.source_name}" returned status code {response.status_code}')
+        tree = html.fromstring(response.content)
+        titles_blocks = tree.xpath('//div[@class="newsdateblock"]//h2/a[contains(@href, "/news/")]')
+        dates_blocks = tree.xpath('//div[@class="newsdateblock"]//span[@class="time"]')
+        if len(titles_blocks) != len(dates_blocks):
+            raise Exception('News titles count does not match dates count')
+        rel_urls = tree.xpath('//div[@class="newsdateblock"]//h2/a[contains(@href, "/news/")]/@href')
+        titles_texts = [title_block.text for title_block in titles_blocks]
+        dates_texts = [date_block.text for date_block in dates_blocks]
+        urls = [f'{self.data_url}{rel_url}' for rel_url in rel_urls]
+        posts = []
+        for title, date_str, url in zip(titles_texts, dates_texts, urls):
+            dt = datetime.datetime.strptime(date_str, '%d.%m.%Y')
+            dt = dt.replace(tzinfo=dateutil.tz.gettz('Europe/Moscow'))
+            if not title:
+                self.logger.error(f'Empty title for URL {url}')
+                continue
+            post_data = PostData(dt, title, url, None)
+            posts.append(post_data)
+        return posts
 
 
-class VentureBeatComParsingModule(SimpleRssBasicParsingModule):
+class RedditRssBasicParsingModule(SimpleRssBasicParsingModule):
 
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
+    item_tag_name = 'entry'
+    pubdate_tag_name = 'published'
+    description_tag_name = 'content'
+    items_at_root = True
 
 
-class ThreeDPrintingMediaNetworkParsingModule(SimpleRssBasicParsingModule):
+class FlossWeeklyVideoParsingModule(SimpleRssBasicParsingModule):
 
     filtration_needed = True
     filters = (
         FiltrationType.SPECIFIC,
     )
 
-
-class CbrOnlineComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
+    def _preprocess_date_str(self, date_str: str):
+        return super()._preprocess_date_str(date_str.replace('PDT', 'UTC-07'))
 
 
-class HelpNetSecurityComParsingModule(SimpleRssBasicParsingModule):
+class CommandLineFanaticParsingModule(SimpleRssBasicParsingModule):
 
     filtration_needed = True
     filters = (
         FiltrationType.SPECIFIC,
     )
 
-
-class SecuritySalesComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
+    def _preprocess_date_str(self, date_str: str):
+        return super()._preprocess_date_str(date_str.replace('- 0700', 'UTC-07'));
 
 
-class TechRadarComParsingModule(SimpleRssBasicParsingModule):
+class SecretgeekParsingModule(SimpleRssBasicParsingModule):
 
     filtration_needed = True
     filters = (
         FiltrationType.SPECIFIC,
     )
+    streaming_parsing_enabled = False
 
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'text-copy bodyCopy auto')
+    def _preprocess_xml(self, text: str):
+        return super()._preprocess_xml(text.replace('ï»¿', ''))
 
 
-class TfirIoParsingModule(SimpleRssBasicParsingModule):
+class AlexanderBindyuBlogParsingModule(SimpleRssBasicParsingModule):
 
     filtration_needed = True
     filters = (
         FiltrationType.SPECIFIC,
     )
 
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'single-body single-body--wide entry-content typography-copy')
-
-
-class ZdNetComLinuxParsingModule(SimpleRssBasicParsingModule):
-    # TODO: Think about parsing other sections
-    pass
-
-
-class LinuxFoundationOrgParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class HabrComBasicParsingModule(SimpleRssBasicParsingModule):
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'tm-article-body')
-
-    def process_url(self, url: str):
-        return re.sub('/\?utm_campaign=.*&utm_source=habrahabr&utm_medium=rss',
-                      '',
-                      url)
+    def _preprocess_date_str(self, date_str: str):
+        return super()._preprocess_date_str(date_str.replace('PST', 'UTC-08'))
 
 
-class HabrComNewsParsingModule(HabrComBasicParsingModule):
+class Rss20TaggedMerkleTreesAndRelatedSimilarDataStructuresNotBusinessScamNewsParsingModule(SimpleRssBasicParsingModule):
 
+    source_name = 'Rss20TaggedMerkleTreesAndRelatedSimilarDataStructuresNotBusinessScamNews'
+    data_url = 'https://lobste.rs/t/merkle-trees.rss'
+    language = Language.ENGLISH
     filtration_needed = True
     filters = (
         FiltrationType.SPECIFIC,
     )
 
-
-class FilterFossNewsItselfMixin:
-
-    def filter_foss_news_itself(self, posts_data: List[PostData]):
-        for post_data in posts_data:
-            if re.fullmatch(FOSS_NEWS_REGEXP, post_data.title):
-                self.logger.warning(f'Filtered "{post_data.title}" as it is our digest itself')
-                post_data.filtered = True
-        return posts_data
-
-
-class HabrComOpenSourceParsingModule(HabrComBasicParsingModule,
-                                     FilterFossNewsItselfMixin):
-
-    def _parse(self):
-        posts_data: List[PostData] = super()._parse()
-        filtered_posts_data = self.filter_foss_news_itself(posts_data)
-        return filtered_posts_data
-
-
-class HabrComLinuxParsingModule(HabrComBasicParsingModule):
-    pass
-
-
-class HabrComLinuxDevParsingModule(HabrComBasicParsingModule):
-    pass
-
-
-class HabrComNixParsingModule(HabrComBasicParsingModule,
-                              FilterFossNewsItselfMixin):
-
-    def _parse(self):
-        posts_data: List[PostData] = super()._parse()
-        filtered_posts_data = self.filter_foss_news_itself(posts_data)
-        return filtered_posts_data
-
-
-class HabrComDevOpsParsingModule(HabrComBasicParsingModule):
-    pass
-
-
-class HabrComSysAdmParsingModule(HabrComBasicParsingModule):
-    pass
-
-
-class HabrComGitParsingModule(HabrComBasicParsingModule):
-    pass
-
-
-class YouTubeComBasicParsingModule(RssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    title_tag_name = 'title'
-    pubdate_tag_name = 'published'
-    link_tag_name = 'link'
-    description_tag_name = 'description'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class YouTubeComAlekseySamoilovParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class PlafonAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class TheLinuxExperimentAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class NikolayIvanovichAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class SwitchedToLinuxAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class LearnLinuxTVAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class DmitryRobionekAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class LosstRuParsingModule(SimpleRssBasicParsingModule):
-
-    def fetch_url(self, url):
-        return self.fetch_tag_from_url_by_selector(url, 'div', 'entry-content')
-
-
-class AstraLinuxRuParsingModule(SimpleRssBasicParsingModule):
-
-    no_description = True
-
-
-class BaseAltRuParsingModule(SimpleRssBasicParsingModule):
-
-    _BASE_URL = 'https://www.basealt.ru'
-
-    def process_url(self, url):
-        if self._BASE_URL not in url:
-            self.logger.info(f'Relative URL found "{url}", prepending with base url "{self._BASE_URL}"')
-            return f'{self._BASE_URL}{url}'
-        else:
-            return url
-
-
-class PingvinusRuParsingModule(BasicParsingModule):
-
-    def __init__(self, logger):
-        super().__init__(logger)
-        self.news_page_url = f'{self.data_url}/news'
-
-    def _parse(self):
-        response = requests.get(self.news_page_url)
-        if response.status_code != 200:
-            raise DigestSourceException(f'"{self.source_name}" returned status code {response.status_code}')
-        tree = html.fromstring(response.content)
-        titles_blocks = tree.xpath('//div[@class="newsdateblock"]//h2/a[contains(@href, "/news/")]')
-        dates_blocks = tree.xpath('//div[@class="newsdateblock"]//span[@class="time"]')
-        if len(titles_blocks) != len(dates_blocks):
-            raise Exception('News titles count does not match dates count')
-        rel_urls = tree.xpath('//div[@class="newsdateblock"]//h2/a[contains(@href, "/news/")]/@href')
-        titles_texts = [title_block.text for title_block in titles_blocks]
-        dates_texts = [date_block.text for date_block in dates_blocks]
-        urls = [f'{self.data_url}{rel_url}' for rel_url in rel_urls]
-        posts = []
-        for title, date_str, url in zip(titles_texts, dates_texts, urls):
-            dt = datetime.datetime.strptime(date_str, '%d.%m.%Y')
-            dt = dt.replace(tzinfo=dateutil.tz.gettz('Europe/Moscow'))
-            if not title:
-                self.logger.error(f'Empty title for URL {url}')
-                continue
-            post_data = PostData(dt, title, url, None)
-            posts.append(post_data)
-        return posts
-
-
-class RedditRssBasicParsingModule(SimpleRssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class OpenSourceOnRedditParsingModule(RedditRssBasicParsingModule):
-    pass
-
-
-class LinuxGnuLinuxFreeSoftwareParsingModule(RedditRssBasicParsingModule):
-    pass
-
-
-class ContainerJournalParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class BlogCloudNativeComputingFoundationParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class KubedexComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CiliumBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class EngineeringDockerBlogParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class BlogSysdigParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CodefreshParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AquaBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AmbassadorApiGatewayParsingModule(SimpleRssBasicParsingModule):
-
-    description_tag_name = 'content'
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class WeaveworksParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class KubeweeklyArchiveFeedParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LachlanEvensonParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class UnixWayAtYouTubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class SoftwareDefinedTalkParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class PrometheusBlogParsingModule(SimpleRssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class SysdigParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class InnovateEverywhereOnRancherLabsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TheNewStackPodcastParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class KubernetesOnMediumParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class RamblingsFromJessieParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class DiscussKubernetesLatestTopicsParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class ProjectCalicoParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class LastWeekInKubernetesDevelopmentParsingModule(SimpleRssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class KubernetesParsingModule(RedditRssBasicParsingModule):
-    pass
-
-
-class EnvoyProxyParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'content'
-
-
-class TheNewStackAnalystsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TigeraParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TwistlockParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class BlogOnRancherLabsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TheNewStackParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class KonghqParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class DockerOnMediumParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class DockerBlogParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class DiscussKubernetesLatestPostsParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class D2IqBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class PodctlEnterpriseKubernetesParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class IstioBlogAndNewsParsingModule(SimpleRssBasicParsingModule):
-
-    def _parse(self):
-        posts_data: List[PostData] = super()._parse()
-        posts_data_with_fixed_urls = []
-        for p in posts_data:
-            if not re.fullmatch(r'^https://.*', p.url):
-                p.url = f'https://istio.io{p.url}'
-            posts_data_with_fixed_urls.append(p)
-        return posts_data_with_fixed_urls
-
-
-class ProgrammingKubernetesParsingModule(SimpleRssBasicParsingModule):
-
-    description_tag_name = 'content'
-
-
-class KubernetesPodcastFromGoogleParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class CloudNativeComputingFoundationParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class BlogOnStackroxSecurityBuiltInParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class RecentQuestionsOpenSourceStackExchangeParsingModule(SimpleRssBasicParsingModule):
-
-    description_tag_name = 'summary'
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class LxerLinuxNewsParsingModule(SimpleRssBasicParsingModule):
-
-    pubdate_tag_name = 'date'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class NativecloudDevParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LinuxlinksParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LobstersJavaJavaProgrammingParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class FlossWeeklyVideoParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-    def _preprocess_date_str(self, date_str: str):
-        return super()._preprocess_date_str(date_str.replace('PDT', 'UTC-07'))
-
-
-class LobstersNodejsNodeJsProgrammingParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class OpenSourceOnMediumParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class BlogOnSmallstepParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LinuxNotesFromDarkduckParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class MicrosoftOpenSourceStoriesParsingModule(SimpleRssBasicParsingModule):
-
-    description_tag_name = 'content'
-
-
-class LobstersUnixNixParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class AmericanExpressTechnologyParsingModule(SimpleRssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class NewestOpenSourceQuestionsFeedParsingModule(SimpleRssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'summary'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class TeejeetechParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class FreedomPenguinParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class LobstersLinuxLinuxParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class CrunchToolsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LinuxUprisingBlogParsingModule(SimpleRssBasicParsingModule):
-
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class EaglemanBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class DbakevlarParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class EngblogRuParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LobstersDotnetCFNetProgrammingParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LobstersWebWebDevelopmentAndNewsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MorningDewByAlvinAshcraftParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LobstersSecurityNetsecAppsecAndInfosecParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class SamJarManParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LobstersDistributedDistributedSystemsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class LobstersDevopsDevopsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class DevRelWeeklyParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AzureAdvocatesContentWrapUpParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class FlantBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class ThoughtworksInsightsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'summary'
-
-    item_tag_name = 'entry'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class LobstersOsdevOperatingSystemDesignAndDevelopmentWhenNoSpecificOsTagExistsParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class MicrosoftDevradioParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class NewBlogArticlesInMicrosoftTechCommunityParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class FosslifeParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class AzureInfohubRssAzureParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class PerformanceIsAFeatureParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'updated'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class LobstersWasmWebassemblyParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TheCommunityRoundtableParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class Rss20TaggedMobileMobileAppWebDevelopmentParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AwsArchitectureBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class HeptioUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AlexEllisOpenfaasCommunityAwesomenessOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class VmwareCloudNativeAppsUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class D2IqParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TigeraUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CncfCloudNativeComputingFoundationUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class CephUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class RookRookPresentationsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class DockerParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class RookUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CncfCloudNativeComputingFoundationParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class WeaveworksIncWeaveOnlineUserGroupsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class KubernautsIoUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class AlexEllisUploadsOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CephCephTestingWeeklyOnYoutubeParsingModule(YouTubeComBasicParsingModule):
-    pass
-
-
-class NetCurryRecentArticlesParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class ThreeHundredSixtyDegreeDbProgrammingParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'content'
-
-    item_tag_name = 'entry'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class FourSysopsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AProgrammerWithMicrosoftToolsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AarononthewebParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AllanSBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AndyGibsonParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AntonioSBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class ArcaneCodeParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AugustoAlvarezParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class Channel9ParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CloudComputingBigDataHpcCodeinstinctParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class ClusteringForMereMortalsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class CommandLineFanaticParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-    def _preprocess_date_str(self, date_str: str):
-        return super()._preprocess_date_str(date_str.replace('- 0700', 'UTC-07'));
-
-
-class DevcurryParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class DonTBeIffyParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'content'
-
-
-class ElegantCodeParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class FelipeOliveiraParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class FromRavikanthSBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class FullFeedParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class GauravmantriComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class GeekSucksParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class GoodCodersCodeGreatReuseParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class GunnarPeipmanSAspNetBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'content'
-
-
-class HanselminutesParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class HelpDeskGeekHelpDeskTipsForItProsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class HenrikOlssonSComputerSoftwareNotesParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class HongkiatComParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class IcosmogeekParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    description_tag_name = 'content'
-
-
-class InDepthFeaturesParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class JenkovComNewsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class JonathanGKoomeyPhDParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class KScottAllenParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MaartenBalliauwBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MarceloSincicMvpParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MartinFowlerParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'updated'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class MaxTrinidadThePowershellFrontParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MethodOfFailedByTimHeuerParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MichaelCrumpParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class NewsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class PetriItKnowledgebaseParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class PrecisionComputingParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class PublisherSRoundUpParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class RandsInReposeParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class RedmondReportParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class RhyousParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class RichardSeroterSArchitectureMusingsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class RickStrahlSWebLogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class SdmSoftwareParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class SecretgeekParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-    def _preprocess_xml(self, text: str):
-        return super()._preprocess_xml(text.replace('ï»¿', ''))
-
-
-class ShawnWildermuthSBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'updated'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class SimpleTalkRssFeedParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class SmashingMagazineFeedParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class SteveSmithSBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TechgenixNewsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TecosystemsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TheArtOfSimplicityParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class TheExptaBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class TheMicrosoftPlatformParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class ThinkingInSoftwareParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class VirtualisationManagementBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class VisioGuyParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class WebcastsParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class WindowsPowershellBlogParsingModule(SimpleRssBasicParsingModule):
-    pass
-
-
-class WindowsServerDivisionWeblogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class YouAreNotSoSmartParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class YouVeBeenHaackedParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class AlexanderBindyuBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-    def _preprocess_date_str(self, date_str: str):
-        return super()._preprocess_date_str(date_str.replace('PST', 'UTC-08'))
-
-
-class ScottHanselmanSBlogParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class AndreyOnNetParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class MyInformationResourceBlogMirNetParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-    item_tag_name = 'entry'
-    pubdate_tag_name = 'published'
-    description_tag_name = 'content'
-
-    def rss_items_root(self):
-        return self.rss_data_root
-
-
-class EternalArrivalParsingModule(SimpleRssBasicParsingModule):
-
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class Rss20TaggedMerkleTreesAndRelatedSimilarDataStructuresNotBusinessScamNewsParsingModule(SimpleRssBasicParsingModule):
-
-    source_name = 'Rss20TaggedMerkleTreesAndRelatedSimilarDataStructuresNotBusinessScamNews'
-    projects = (
-        os_friday_project,
-    )
-    data_url = 'https://lobste.rs/t/merkle-trees.rss'
-    language = Language.ENGLISH
-    filtration_needed = True
-    filters = (
-        FiltrationType.SPECIFIC,
-    )
-
-
-class WeeklyOsmParsingModule(SimpleRssBasicParsingModule):
-    pass
+    @property
+    def projects(self):
+        return (
+            os_friday_project(),
+        )
+
+
+PARSING_MODULES_CLASSES_BY_KIND = {
+    ParsingModuleKind.SIMPLE_RSS.name: SimpleRssBasicParsingModule,
+    ParsingModuleKind.YOUTUBE.name: YouTubeComBasicParsingModule,
+    ParsingModuleKind.REDDIT.name: RedditRssBasicParsingModule,
+    ParsingModuleKind.HABR.name: HabrComBasicParsingModule,
+}
+
+
+def create_configured_parsing_module(source: DigestRecordsSource,
+                                     logger,
+                                     http_client: HttpClient = None) -> RssBasicParsingModule:
+    # Parsing module of source kind, with defaults of kind overridden by source configuration
+    parsing_module_class = PARSING_MODULES_CLASSES_BY_KIND[source.parsing_module_kind]
+    parsing_module = parsing_module_class(logger, http_client, source.name)
+    filters = []
+    if source.filtration_by_generic_keywords:
+        filters.append(FiltrationType.GENERIC)
+    if source.filtration_by_specific_keywords:
+        filters.append(FiltrationType.SPECIFIC)
+    parsing_module.filtration_needed = bool(filters)
+    parsing_module.filters = tuple(filters)
+    for tag_name_attribute in ('item_tag_name', 'pubdate_tag_name', 'description_tag_name'):
+        tag_name = getattr(source, tag_name_attribute)
+        if tag_name:
+            setattr(parsing_module, tag_name_attribute, tag_name)
+    if source.items_at_root is not None:
+        parsing_module.items_at_root = source.items_at_root
+    parsing_module.no_description = source.no_description
+    if source.base_url:
+        parsing_module.base_url = source.base_url
+    if source.text_container_tag:
+        parsing_module.text_container = (source.text_container_tag, source.text_container_class)
+    return parsing_module
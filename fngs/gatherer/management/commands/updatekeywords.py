@@ -13,7 +13,7 @@ import datetime
 from .logger import Logger
 SCRIPT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
 custom_logger = Logger(os.path.join('keywordsupdate.log'))
-from .sources import BasicParsingModule
+from gatherer.keywordsmatcher import KeywordsMatcher
 
 
 SCRIPT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
@@ -39,14 +39,10 @@ class Command(BaseCommand):
             digest_records_queryset = DigestRecord.objects.all()
             last_printed_percent = None
             digest_record_object: DigestRecord
-            keywords_queryset = Keyword.objects.all()
+            keywords_matcher = KeywordsMatcher.from_queryset(Keyword.objects.all())
             updated_digest_records_count = 0
             for digest_record_object_i, digest_record_object in enumerate(digest_records_queryset):
-                # TODO: Optimize, too slow
-                title_keywords_to_save = []
-                for keyword in keywords_queryset:
-                    if BasicParsingModule.find_keyword_in_title(keyword.name, digest_record_object.title):
-                        title_keywords_to_save.append(keyword)
+                title_keywords_to_save = keywords_matcher.match(digest_record_object.title)
                 if set(title_keywords_to_save) != set(digest_record_object.title_keywords.all()):
                     custom_logger.debug(f'Need to update keywords for digest record #{digest_record_object.id} "{digest_record_object.title}", old keywords were {sorted([k.name for k in digest_record_object.title_keywords.all()])}, new keywords are {sorted([k.name for k in title_keywords_to_save])}')
                     digest_record_object.title_keywords.set(title_keywords_to_save)
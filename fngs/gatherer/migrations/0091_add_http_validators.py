@@ -0,0 +1,28 @@
+# Generated by Django 3.2.23 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0090_enable_fetching_for_some_sources'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='http_etag',
+            field=models.CharField(blank=True, max_length=256, null=True, verbose_name='HTTP ETag'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='http_last_modified',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='HTTP Last-Modified'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='not_modified',
+            field=models.BooleanField(blank=True, null=True, verbose_name='Not modified since previous iteration'),
+        ),
+    ]
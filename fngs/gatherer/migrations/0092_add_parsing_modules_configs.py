@@ -0,0 +1,68 @@
+# Generated by Django 3.2.23 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0091_add_http_validators'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='parsing_module_kind',
+            field=models.CharField(blank=True, choices=[('SIMPLE_RSS', 'simple_rss'), ('YOUTUBE', 'youtube'), ('REDDIT', 'reddit'), ('HABR', 'habr')], max_length=15, null=True, verbose_name='Parsing module kind'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='filtration_by_generic_keywords',
+            field=models.BooleanField(default=False, verbose_name='Filtration by generic keywords'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='filtration_by_specific_keywords',
+            field=models.BooleanField(default=False, verbose_name='Filtration by specific keywords'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='item_tag_name',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='Item tag name'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='pubdate_tag_name',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='Publication date tag name'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='description_tag_name',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='Description tag name'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='items_at_root',
+            field=models.BooleanField(blank=True, null=True, verbose_name='Items at feed root'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='no_description',
+            field=models.BooleanField(default=False, verbose_name='No description'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='base_url',
+            field=models.CharField(blank=True, max_length=256, null=True, verbose_name='Base URL'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='text_container_tag',
+            field=models.CharField(blank=True, max_length=32, null=True, verbose_name='Text container tag'),
+        ),
+        migrations.AddField(
+            model_name='digestrecordssource',
+            name='text_container_class',
+            field=models.CharField(blank=True, max_length=256, null=True, verbose_name='Text container class'),
+        ),
+    ]
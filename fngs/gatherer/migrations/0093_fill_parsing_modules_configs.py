@@ -0,0 +1,35 @@
+# Generated by Django 3.2.23 on 2026-10-18 11:42
+
+import os
+import yaml
+
+from django.db import migrations
+from gatherer.models import DigestRecordsSource
+
+
+def load_parsing_modules_configs():
+    parsing_modules_configs_path = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                'data',
+                                                'parsing_modules_configs.yaml')
+    with open(parsing_modules_configs_path, 'r') as fin:
+        return yaml.safe_load(fin)
+
+
+def fill_parsing_modules_configs(apps, schema_editor):
+    for source_name, parsing_module_config in load_parsing_modules_configs().items():
+        DigestRecordsSource.objects.filter(name=source_name).update(**parsing_module_config)
+
+
+def clear_parsing_modules_configs(apps, schema_editor):
+    DigestRecordsSource.objects.filter(name__in=load_parsing_modules_configs().keys()).update(parsing_module_kind=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0092_add_parsing_modules_configs'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_parsing_modules_configs, clear_parsing_modules_configs),
+    ]
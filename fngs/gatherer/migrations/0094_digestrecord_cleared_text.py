@@ -0,0 +1,18 @@
+# Generated by Django 3.2.23 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0093_fill_parsing_modules_configs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='digestrecord',
+            name='cleared_text',
+            field=models.TextField(blank=True, null=True, verbose_name='Cleared text'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.23 on 2026-10-18 14:07
+
+from django.db import migrations
+from gatherer.models import DigestRecord
+from gatherer.htmltext import html_to_text
+
+
+BATCH_SIZE = 500
+
+
+def fill_digest_records_cleared_texts(apps, schema_editor):
+    digest_records_with_text = DigestRecord.objects.exclude(text=None).only('id', 'text').order_by('id')
+    last_id = 0
+    while True:
+        digest_records = list(digest_records_with_text.filter(id__gt=last_id)[:BATCH_SIZE])
+        if not digest_records:
+            break
+        last_id = digest_records[-1].id
+        for digest_record in digest_records:
+            digest_record.cleared_text = html_to_text(digest_record.text) if digest_record.text else None
+        DigestRecord.objects.bulk_update(digest_records, ['cleared_text'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0094_digestrecord_cleared_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_digest_records_cleared_texts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.2.23 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0095_fill_digest_records_cleared_texts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='http_status',
+            field=models.IntegerField(blank=True, null=True, verbose_name='HTTP status'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='bytes_downloaded',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='Bytes downloaded'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='fetch_time',
+            field=models.FloatField(blank=True, null=True, verbose_name='Fetch time'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='parse_time',
+            field=models.FloatField(blank=True, null=True, verbose_name='Parse time'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='filtration_time',
+            field=models.FloatField(blank=True, null=True, verbose_name='Filtration time'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='save_time',
+            field=models.FloatField(blank=True, null=True, verbose_name='Save time'),
+        ),
+        migrations.AddField(
+            model_name='digestgatheringiteration',
+            name='queries_count',
+            field=models.IntegerField(blank=True, null=True, verbose_name='Database queries count'),
+        ),
+    ]
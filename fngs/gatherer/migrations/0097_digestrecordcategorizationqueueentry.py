@@ -0,0 +1,30 @@
+# Generated by Django 3.2.23 on 2026-10-18 16:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0096_add_gathering_iterations_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DigestRecordCategorizationQueueEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gather_dt', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Gather Date&time')),
+                ('is_state_unknown', models.BooleanField(verbose_name='Is state unknown')),
+                ('last_tbot_attempt_dt', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Last Telegram Bot Categorization Attempt Date&time')),
+                ('digest_record', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='categorization_queue_entries', to='gatherer.digestrecord')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gatherer.project')),
+            ],
+            options={
+                'verbose_name': 'Digest Record Categorization Queue Entry',
+                'verbose_name_plural': 'Digest Records Categorization Queue Entries',
+                'unique_together': {('digest_record', 'project')},
+            },
+        ),
+    ]
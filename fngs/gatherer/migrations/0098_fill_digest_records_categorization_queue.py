@@ -0,0 +1,21 @@
+# Generated by Django 3.2.23 on 2026-10-18 16:06
+
+from django.db import migrations
+from gatherer.models import DigestRecord
+from gatherer.categorizationqueue import refresh_categorization_queue
+
+
+def fill_digest_records_categorization_queue(apps, schema_editor):
+    refresh_categorization_queue(DigestRecord.objects.values_list('id', flat=True))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0097_digestrecordcategorizationqueueentry'),
+        ('tbot', '0018_changed_default_estimated_is_main_to_none'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_digest_records_categorization_queue, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.23 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0098_fill_digest_records_categorization_queue'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='digestrecord',
+            index=models.Index(fields=['dt'], name='digest_record_dt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='digestrecord',
+            index=models.Index(condition=models.Q(('state', 'UNKNOWN')), fields=['dt'], name='digest_record_unknown_dt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='digestrecord',
+            index=models.Index(fields=['digest_issue', 'state'], name='digest_record_issue_state_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='digestrecord',
+            index=models.Index(condition=models.Q(('text__isnull', True)), fields=['source', 'id'], name='digest_record_no_text_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='digestrecordcategorizationqueueentry',
+            index=models.Index(fields=['project', 'gather_dt'], name='queue_entry_project_dt_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from enum import Enum
-from bs4 import BeautifulSoup
+
+from gatherer.htmltext import html_to_text
 
 
 class DigestRecordState(Enum):
@@ -46,6 +47,18 @@ class Language(Enum):
         return tuple((i.name, i.value) for i in cls)
 
 
+# Kind of feed, parsing module for source of this kind is built from source configuration
+class ParsingModuleKind(Enum):
+    SIMPLE_RSS = 'simple_rss'
+    YOUTUBE = 'youtube'
+    REDDIT = 'reddit'
+    HABR = 'habr'
+
+    @classmethod
+    def choices(cls):
+        return tuple((i.name, i.value) for i in cls)
+
+
 class DigestRecordContentCategory(Enum):
     EVENTS = 'events'
     INTROS = 'intros'
@@ -151,9 +164,14 @@ class DigestRecord(models.Model):
     text = models.TextField(verbose_name='Text',
                             null=True,
                             blank=True)
+    # Should be changed only together with text, use `set_text`
+    cleared_text = models.TextField(verbose_name='Cleared text',
+                                    null=True,
+                                    blank=True)
 
-    def cleared_text(self):
-        return BeautifulSoup(self.text, 'lxml').text if self.text else None
+    def set_text(self, text):
+        self.text = text
+        self.cleared_text = html_to_text(text) if text else None
 
     def projects_names(self):
         return f'{", ".join([p.name for p in self.projects.all()])}'
@@ -161,15 +179,26 @@ class DigestRecord(models.Model):
     def title_keywords_names(self):
         return f'{", ".join([k.name for k in self.title_keywords.all()])}'
 
+    # Keywords are filtered in Python, so prefetched ones are used instead of query per call
     def not_proprietary_keywords(self):
-        return self.title_keywords.filter(proprietary=False, is_generic=False)
+        return [k for k in self.title_keywords.all() if not k.proprietary and not k.is_generic]
 
     def proprietary_keywords(self):
-        return self.title_keywords.filter(proprietary=True)
+        return [k for k in self.title_keywords.all() if k.proprietary]
 
     class Meta:
         verbose_name = 'Digest Record'
         verbose_name_plural = 'Digest Records'
+        indexes = [
+            # Lists of records ordered by date
+            models.Index(fields=['dt'], name='digest_record_dt_idx'),
+            # Not reviewed records for Telegram bot and admin, small part of all records
+            models.Index(fields=['dt'], condition=models.Q(state='UNKNOWN'), name='digest_record_unknown_dt_idx'),
+            # Records of digest issue in some state, e.g. ones included into digest
+            models.Index(fields=['digest_issue', 'state'], name='digest_record_issue_state_idx'),
+            # Records without text by source, walked by id batches when fetching texts
+            models.Index(fields=['source', 'id'], condition=models.Q(text__isnull=True), name='digest_record_no_text_idx'),
+        ]
 
     def __str__(self):
         return f'{self.dt} {self.title} {self.url} #{self.digest_issue.number if self.digest_issue else None} state:"{self.state}" cat:"{self.content_type}" subcat: "{self.content_category}" keywords: "{self.keywords}"'
@@ -262,6 +291,55 @@ class DigestRecordsSource(models.Model):
                                 blank=True)
     text_fetching_enabled = models.BooleanField(verbose_name='Text fetching enabled',
                                                 default=False)
+    http_etag = models.CharField(verbose_name='HTTP ETag',
+                                 max_length=256,
+                                 null=True,
+                                 blank=True)
+    http_last_modified = models.CharField(verbose_name='HTTP Last-Modified',
+                                          max_length=64,
+                                          null=True,
+                                          blank=True)
+    # Empty kind means that source is parsed with hand-written parsing module
+    parsing_module_kind = models.CharField(verbose_name='Parsing module kind',
+                                           choices=ParsingModuleKind.choices(),
+                                           max_length=15,
+                                           null=True,
+                                           blank=True)
+    filtration_by_generic_keywords = models.BooleanField(verbose_name='Filtration by generic keywords',
+                                                         default=False)
+    filtration_by_specific_keywords = models.BooleanField(verbose_name='Filtration by specific keywords',
+                                                          default=False)
+    # Empty tags names and items location mean defaults of parsing module kind
+    item_tag_name = models.CharField(verbose_name='Item tag name',
+                                     max_length=64,
+                                     null=True,
+                                     blank=True)
+    pubdate_tag_name = models.CharField(verbose_name='Publication date tag name',
+                                        max_length=64,
+                                        null=True,
+                                        blank=True)
+    description_tag_name = models.CharField(verbose_name='Description tag name',
+                                            max_length=64,
+                                            null=True,
+                                            blank=True)
+    items_at_root = models.BooleanField(verbose_name='Items at feed root',
+                                        null=True,
+                                        blank=True)
+    no_description = models.BooleanField(verbose_name='No description',
+                                         default=False)
+    # Relative URLs of posts are resolved against it
+    base_url = models.CharField(verbose_name='Base URL',
+                                max_length=256,
+                                null=True,
+                                blank=True)
+    text_container_tag = models.CharField(verbose_name='Text container tag',
+                                          max_length=32,
+                                          null=True,
+                                          blank=True)
+    text_container_class = models.CharField(verbose_name='Text container class',
+                                            max_length=256,
+                                            null=True,
+                                            blank=True)
 
     class Meta:
         verbose_name = 'Digest Records Source'
@@ -318,7 +396,66 @@ class DigestGatheringIteration(models.Model):
     parser_error = models.TextField(verbose_name='Parser error',
                                     blank=True,
                                     null=True)
+    not_modified = models.BooleanField(verbose_name='Not modified since previous iteration',
+                                       blank=True,
+                                       null=True)
+    http_status = models.IntegerField(verbose_name='HTTP status',
+                                      blank=True,
+                                      null=True)
+    bytes_downloaded = models.BigIntegerField(verbose_name='Bytes downloaded',
+                                              blank=True,
+                                              null=True)
+    # Stages times in seconds
+    fetch_time = models.FloatField(verbose_name='Fetch time',
+                                   blank=True,
+                                   null=True)
+    parse_time = models.FloatField(verbose_name='Parse time',
+                                   blank=True,
+                                   null=True)
+    filtration_time = models.FloatField(verbose_name='Filtration time',
+                                        blank=True,
+                                        null=True)
+    save_time = models.FloatField(verbose_name='Save time',
+                                  blank=True,
+                                  null=True)
+    queries_count = models.IntegerField(verbose_name='Database queries count',
+                                        blank=True,
+                                        null=True)
 
     class Meta:
         verbose_name = 'Digest Gathering Iteration'
-        verbose_name_plural = 'Digest Gathering Iterations'
\ No newline at end of file
+        verbose_name_plural = 'Digest Gathering Iterations'
+
+
+class DigestRecordCategorizationQueueEntry(models.Model):
+    # Not fully categorized digest record in one of its projects, maintained by `gatherer.categorizationqueue`
+    # on digest records and categorization attempts changes, so not categorized records are found by indexed lookups
+
+    digest_record = models.ForeignKey(to=DigestRecord,
+                                      related_name='categorization_queue_entries',
+                                      on_delete=models.CASCADE)
+    project = models.ForeignKey(to=Project,
+                                on_delete=models.CASCADE)
+    gather_dt = models.DateTimeField(verbose_name='Gather Date&time',
+                                     db_index=True,
+                                     null=True,
+                                     blank=True)
+    is_state_unknown = models.BooleanField(verbose_name='Is state unknown')
+    last_tbot_attempt_dt = models.DateTimeField(verbose_name='Last Telegram Bot Categorization Attempt Date&time',
+                                                db_index=True,
+                                                null=True,
+                                                blank=True)
+
+    class Meta:
+        unique_together = (
+            'digest_record',
+            'project',
+        )
+        verbose_name = 'Digest Record Categorization Queue Entry'
+        verbose_name_plural = 'Digest Records Categorization Queue Entries'
+        indexes = [
+            models.Index(fields=['project', 'gather_dt'], name='queue_entry_project_dt_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.project} {self.digest_record}'
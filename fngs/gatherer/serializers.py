@@ -1,6 +1,11 @@
+from django.db.models import (
+    Prefetch,
+    prefetch_related_objects,
+)
 from rest_framework import serializers
 
 from gatherer.models import *
+from tbot.models import TelegramBotDigestRecordCategorizationAttempt
 
 
 DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
@@ -76,6 +81,36 @@ class DigestRecordDetailedSerializer(serializers.ModelSerializer):
     not_proprietary_keywords = KeywordSerializer(many=True, read_only=True)
     proprietary_keywords = KeywordSerializer(many=True, read_only=True)
 
+    # Relations serialized with `depth = 2`, loaded with fixed count of queries for any count of digest records
+    # instead of several queries per digest record
+    SELECTED_RELATIONS = ('source', 'digest_issue')
+
+    @classmethod
+    def prefetched_relations(cls):
+        return [
+            'source__projects',
+            'title_keywords',
+            'projects',
+            Prefetch('tbot_estimations',
+                     queryset=TelegramBotDigestRecordCategorizationAttempt.objects.select_related(
+                         'telegram_bot_user',
+                         'digest_record',
+                     ).prefetch_related(
+                         'digest_record__title_keywords',
+                         'digest_record__projects',
+                     )),
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related(*cls.SELECTED_RELATIONS).prefetch_related(*cls.prefetched_relations())
+
+    @classmethod
+    def load_eagerly(cls, digest_records):
+        # For already fetched digest records, e.g. picked one by one
+        prefetch_related_objects(digest_records, *cls.SELECTED_RELATIONS, *cls.prefetched_relations())
+        return digest_records
+
     def to_representation(self, instance):
         # TODO: Extract common code from here and DigestRecordSerializer
         representation = super().to_representation(instance)
@@ -111,6 +146,12 @@ class DigestRecordDetailedSerializer(serializers.ModelSerializer):
 class SimilarDigestRecordsDetailedSerializer(serializers.ModelSerializer):
     digest_records = DigestRecordDetailedSerializer(many=True, read_only=True)
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        digest_records_queryset = DigestRecordDetailedSerializer.setup_eager_loading(DigestRecord.objects.all())
+        return queryset.select_related('digest_issue').prefetch_related(Prefetch('digest_records',
+                                                                                 queryset=digest_records_queryset))
+
     class Meta:
         model = SimilarDigestRecords
         depth = 2
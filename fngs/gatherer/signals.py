@@ -0,0 +1,39 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_save,
+)
+from django.dispatch import receiver
+
+from gatherer.categorizationqueue import (
+    QUEUE_DIGEST_RECORD_FIELDS,
+    refresh_categorization_queue,
+)
+from gatherer.models import DigestRecord
+
+
+# Bulk operations do not send these signals, so code creating or updating digest records in bulk refreshes
+# categorization queue itself
+
+
+@receiver(post_save, sender=DigestRecord)
+def refresh_saved_digest_record_categorization_queue(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(QUEUE_DIGEST_RECORD_FIELDS):
+        return
+    refresh_categorization_queue([instance.id])
+
+
+@receiver(m2m_changed, sender=DigestRecord.projects.through)
+def refresh_digest_records_projects_categorization_queue(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        # Records of project are not known after clear
+        instance._cleared_digest_records_ids = list(instance.records.values_list('id', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        digest_records_ids = [instance.id]
+    elif action == 'post_clear':
+        digest_records_ids = instance._cleared_digest_records_ids
+    else:
+        digest_records_ids = pk_set
+    refresh_categorization_queue(digest_records_ids)
@@ -1,13 +1,58 @@
 import datetime
+import io
+from copy import copy
+import logging
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from gatherer.models import *
 from django.forms.models import model_to_dict
 import random
+import re
 import string
+import tempfile
+import xml.etree.ElementTree as ET
+from django.utils import timezone
 from django.utils.http import urlencode
 from rest_framework.test import APIRequestFactory
+from django.db import connection
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+)
+from django.test.utils import CaptureQueriesContext
+from common.sampling import random_object
+from gatherer.categorizationqueue import refresh_categorization_queue
+from gatherer.htmltext import html_to_text
+from gatherer.keywordsmatcher import KeywordsMatcher
+from gatherer.management.commands.gatherfromsources import Command as GatherFromSourcesCommand
+from gatherer.management.commands.lemmatizedigestrecords import digest_records_to_lemmatize
+from gatherer.management.commands.sources import (
+    DigestRecordsSourcesRegistry,
+    FetchedContainer,
+    FiltrationType,
+    PostData,
+    PostsData,
+    RedditRssBasicParsingModule,
+    SimpleRssBasicParsingModule,
+    YouTubeComBasicParsingModule,
+    container_xpath,
+    create_configured_parsing_module,
+    html_encoding,
+)
+from gatherer.management.commands.pollingscheduler import PollingScheduler
+from gatherer.management.commands.httpclient import (
+    HttpClient,
+    ResponsesSnapshots,
+)
+from gatherer.serializers import DigestRecordDetailedSerializer
+from ds.lemmas import save_digest_records_lemmas
+from tbot.models import (
+    TelegramBotDigestRecordCategorizationAttempt,
+    TelegramBotUser,
+)
+from lxml import html
+import requests
 
 
 TEST_USERNAME = 'admin'
@@ -196,3 +241,443 @@ class OldestNotCategorizedDigestRecordViewSetTests(APITestCase, TestMixin):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json()['results'][0]['title'],
                          example_digest_record_1['title'])
+
+
+class KeywordsMatcherTests(SimpleTestCase):
+
+    KEYWORDS = [
+        'Linux',
+        'Linux Foundation',
+        'C++',
+        '.NET',
+        'Node.js',
+        'GNU/Linux',
+        'Go',
+    ]
+
+    def test_matches_same_keywords_as_regexp_search(self):
+        keywords_matcher = KeywordsMatcher(self.KEYWORDS)
+        titles = [
+            'The Linux Foundation announces new project',
+            'LINUX-foundation',
+            'Why C++ rocks',
+            'C++20 is here',
+            'What is new in .NET 6',
+            'Using Node.js and Go together',
+            'GNU/Linux distributions review',
+            'Gopher, going, good',
+            '',
+        ]
+        for title in titles:
+            expected_keywords = [keyword
+                                 for keyword in self.KEYWORDS
+                                 if re.search(rf'\b{re.escape(keyword)}\b', title, re.IGNORECASE)]
+            self.assertEqual(keywords_matcher.match(title), expected_keywords, title)
+            self.assertEqual(keywords_matcher.matches_any(title), bool(expected_keywords), title)
+
+    def test_returns_all_keywords_with_same_name(self):
+        keywords = [
+            ('Docker', DigestRecordContentCategory.DEVOPS.name),
+            ('docker', DigestRecordContentCategory.SYSADM.name),
+        ]
+        keywords_matcher = KeywordsMatcher(keywords, name=lambda k: k[0])
+        self.assertEqual(keywords_matcher.match('Docker Desktop released'), keywords)
+
+
+class ConfiguredParsingModuleTests(SimpleTestCase):
+
+    def test_overrides_kind_defaults_with_source_configuration(self):
+        source = DigestRecordsSource(name='SomeChannelAtYouTube',
+                                     parsing_module_kind=ParsingModuleKind.YOUTUBE.name,
+                                     filtration_by_specific_keywords=True,
+                                     description_tag_name='content',
+                                     text_container_tag='div',
+                                     text_container_class='post-content')
+        parsing_module = create_configured_parsing_module(source, logging.getLogger())
+        self.assertIsInstance(parsing_module, YouTubeComBasicParsingModule)
+        self.assertEqual(parsing_module.source_name, 'SomeChannelAtYouTube')
+        self.assertTrue(parsing_module.filtration_needed)
+        self.assertEqual(parsing_module.filters, (FiltrationType.SPECIFIC,))
+        self.assertEqual(parsing_module.item_tag_name, 'entry')
+        self.assertEqual(parsing_module.description_tag_name, 'content')
+        self.assertTrue(parsing_module.items_at_root)
+        self.assertEqual(parsing_module.text_container, ('div', 'post-content'))
+
+
+class IterparseItemsTests(SimpleTestCase):
+
+    RSS_FEED = b'''<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>Some blog</title>
+    <link>https://example.com</link>
+    <atom:link href="https://example.com/feed.xml" rel="self"/>
+    <item>
+      <title>First post</title>
+      <link>https://example.com/1</link>
+      <pubDate>Mon, 05 Oct 2026 10:00:00 +0000</pubDate>
+      <description>First post description</description>
+    </item>
+    <item>
+      <title>Second post</title>
+      <link>https://example.com/2</link>
+      <pubDate>Tue, 06 Oct 2026 10:00:00 +0000</pubDate>
+      <description>Second post description</description>
+    </item>
+  </channel>
+</rss>'''
+    ATOM_FEED = b'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Some subreddit</title>
+  <link href="https://example.com/r/linux"/>
+  <entry>
+    <title>First post</title>
+    <link href="https://example.com/r/linux/1"/>
+    <published>2026-10-05T10:00:00+00:00</published>
+    <content type="html">First post content</content>
+  </entry>
+  <entry>
+    <title>Second post</title>
+    <link href="https://example.com/r/linux/2"/>
+    <published>2026-10-06T10:00:00+00:00</published>
+    <content type="html">Second post content</content>
+  </entry>
+</feed>'''
+    RDF_FEED = b'''<?xml version="1.0" encoding="utf-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.com">
+    <title>Some news site</title>
+    <link>https://example.com</link>
+    <items>
+      <rdf:Seq>
+        <rdf:li rdf:resource="https://example.com/1"/>
+        <rdf:li rdf:resource="https://example.com/2"/>
+      </rdf:Seq>
+    </items>
+  </channel>
+  <item rdf:about="https://example.com/1">
+    <title>First post</title>
+    <link>https://example.com/1</link>
+    <dc:date>2026-10-05T10:00:00+00:00</dc:date>
+    <description>First post description</description>
+  </item>
+  <item rdf:about="https://example.com/2">
+    <title>Second post</title>
+    <link>https://example.com/2</link>
+    <dc:date>2026-10-06T10:00:00+00:00</dc:date>
+    <description>Second post description</description>
+  </item>
+</rdf:RDF>'''
+
+    @staticmethod
+    def _posts_data(parsing_module, items):
+        posts_data = [parsing_module._post_data_from_item(item)[0] for item in items]
+        return [(post_data.dt, post_data.title, post_data.url, post_data.brief) for post_data in posts_data]
+
+    def _check_same_as_tree_parsing(self, parsing_module, feed: bytes, items_count: int):
+        response = requests.Response()
+        response.raw = io.BytesIO(feed)
+        streamed_posts_data = self._posts_data(parsing_module, parsing_module._iterparse_items(response))
+        # Items as they were found before streaming parsing
+        parsing_module.rss_data_root = ET.fromstring(feed)
+        tree_posts_data = self._posts_data(parsing_module,
+                                           [rss_data_elem
+                                            for rss_data_elem in parsing_module.rss_items_root()
+                                            if parsing_module.item_tag_name in rss_data_elem.tag])
+        self.assertEqual(len(streamed_posts_data), items_count)
+        self.assertEqual(streamed_posts_data, tree_posts_data)
+
+    def test_yields_same_items_as_tree_parsing(self):
+        self._check_same_as_tree_parsing(SimpleRssBasicParsingModule(logging.getLogger(), source_name='Rss'),
+                                         self.RSS_FEED,
+                                         2)
+        self._check_same_as_tree_parsing(RedditRssBasicParsingModule(logging.getLogger(), source_name='Atom'),
+                                         self.ATOM_FEED,
+                                         2)
+        rdf_parsing_module = SimpleRssBasicParsingModule(logging.getLogger(), source_name='Rdf')
+        rdf_parsing_module.pubdate_tag_name = 'date'
+        rdf_parsing_module.items_at_root = True
+        self._check_same_as_tree_parsing(rdf_parsing_module, self.RDF_FEED, 2)
+
+    def test_takes_only_items_with_exact_tag_name_from_items_root(self):
+        # `items` of RDF channel is not an item, items of channel are not taken when items are expected at root
+        rdf_parsing_module = SimpleRssBasicParsingModule(logging.getLogger(), source_name='Rdf')
+        rdf_parsing_module.items_at_root = False
+        response = requests.Response()
+        response.raw = io.BytesIO(self.RDF_FEED)
+        self.assertEqual(list(rdf_parsing_module._iterparse_items(response)), [])
+        rss_parsing_module = SimpleRssBasicParsingModule(logging.getLogger(), source_name='Rss')
+        rss_parsing_module.items_at_root = True
+        response = requests.Response()
+        response.raw = io.BytesIO(self.RSS_FEED)
+        self.assertEqual(list(rss_parsing_module._iterparse_items(response)), [])
+
+
+class RandomObjectTests(TestCase):
+
+    def test_picks_only_objects_of_queryset(self):
+        for i in range(5):
+            DigestRecord.objects.create(title=f'Title {i}',
+                                        url=f'https://example.com/{i}',
+                                        state=DigestRecordState.UNKNOWN.name if i % 2 else DigestRecordState.SKIPPED.name)
+        unknown_digest_records = DigestRecord.objects.filter(state=DigestRecordState.UNKNOWN.name)
+        for _ in range(20):
+            self.assertIn(random_object(unknown_digest_records), unknown_digest_records)
+        self.assertIsNone(random_object(DigestRecord.objects.filter(state=DigestRecordState.IN_DIGEST.name)))
+
+
+class SavePostsDataTests(TestCase):
+
+    def setUp(self):
+        self.project = Project.objects.create(name='FOSS News')
+        self.source = DigestRecordsSource.objects.create(name='Some blog',
+                                                         enabled=True,
+                                                         language=Language.ENGLISH.name)
+        self.source.projects.add(self.project)
+        self.keyword = Keyword.objects.create(name='Linux', is_generic=False, proprietary=False)
+        DigestRecordsSourcesRegistry.invalidate()
+        self.addCleanup(DigestRecordsSourcesRegistry.invalidate)
+        self.iteration = DigestGatheringIteration.objects.create(dt=timezone.now(),
+                                                                 gathered_count=4,
+                                                                 source=self.source)
+
+    def _save_posts_data(self, posts_data_list, http_etag=None, http_last_modified=None, outdated_posts_data_list=None):
+        command = GatherFromSourcesCommand()
+        command.digest_records_to_lemmatize = []
+        command._save_posts_data(self.iteration,
+                                 PostsData(self.source.name,
+                                           [self.project],
+                                           posts_data_list,
+                                           Language.ENGLISH,
+                                           [],
+                                           http_etag=http_etag,
+                                           http_last_modified=http_last_modified,
+                                           outdated_posts_data_list=outdated_posts_data_list))
+        self.iteration.refresh_from_db()
+        self.source.refresh_from_db()
+
+    def test_saves_new_posts_once_and_fixes_dates_of_known_ones(self):
+        dt = timezone.now()
+        without_dt_digest_record = DigestRecord.objects.create(title='Without date', url='https://example.com/1')
+        with_dt_digest_record = DigestRecord.objects.create(title='With date', url='https://example.com/2', dt=dt)
+        new_post_data = PostData(dt, ' New Linux release ', 'https://example.com/3', '<p>New <b>Linux</b> release</p>')
+        new_post_data.keywords = ['Linux']
+        posts_data_list = [
+            PostData(dt, 'Without date', 'https://example.com/1', None),
+            PostData(dt - datetime.timedelta(days=1), 'With date', 'https://example.com/2', None),
+            new_post_data,
+            copy(new_post_data),
+        ]
+        self._save_posts_data(posts_data_list, http_etag='"etag"', http_last_modified='Mon, 05 Oct 2026 10:00:00 GMT')
+        self.assertEqual(self.iteration.saved_count, 1)
+        self.assertEqual(DigestRecord.objects.count(), 3)
+        new_digest_record = DigestRecord.objects.get(url='https://example.com/3')
+        self.assertEqual(new_digest_record.title, 'New Linux release')
+        self.assertEqual(new_digest_record.source, self.source)
+        self.assertEqual(new_digest_record.state, DigestRecordState.UNKNOWN.name)
+        self.assertEqual(new_digest_record.cleared_description, 'New Linux release')
+        self.assertEqual(list(new_digest_record.projects.all()), [self.project])
+        self.assertEqual(list(new_digest_record.title_keywords.all()), [self.keyword])
+        without_dt_digest_record.refresh_from_db()
+        self.assertEqual(without_dt_digest_record.dt, dt)
+        with_dt_digest_record.refresh_from_db()
+        self.assertEqual(with_dt_digest_record.dt, dt)
+        self.assertEqual(self.source.http_etag, '"etag"')
+        self.assertEqual(self.source.http_last_modified, 'Mon, 05 Oct 2026 10:00:00 GMT')
+
+    def test_fixes_dates_of_known_records_with_outdated_posts(self):
+        dt = timezone.now() - datetime.timedelta(days=365)
+        digest_record = DigestRecord.objects.create(title='Without date', url='https://example.com/1')
+        outdated_posts_data_list = [
+            PostData(dt, 'Without date', 'https://example.com/1', None),
+            PostData(dt, 'Unknown', 'https://example.com/2', None),
+        ]
+        self._save_posts_data([], outdated_posts_data_list=outdated_posts_data_list)
+        self.assertEqual(self.iteration.saved_count, 0)
+        self.assertEqual(DigestRecord.objects.count(), 1)
+        digest_record.refresh_from_db()
+        self.assertEqual(digest_record.dt, dt)
+
+    def test_does_not_save_too_long_http_validators(self):
+        self._save_posts_data([], http_etag='"etag"', http_last_modified='Mon, 05 Oct 2026 10:00:00 GMT')
+        self._save_posts_data([], http_etag='"' + 'e' * 300 + '"', http_last_modified='Mon, 05 Oct 2026 10:00:00 GMT')
+        self.assertIsNone(self.source.http_etag)
+        self.assertEqual(self.source.http_last_modified, 'Mon, 05 Oct 2026 10:00:00 GMT')
+
+
+class DigestRecordsToLemmatizeTests(TestCase):
+
+    def test_skips_lemmatized_records_even_without_lemmas(self):
+        digest_records = [DigestRecord.objects.create(title=f'Title {i}',
+                                                      url=f'https://example.com/{i}',
+                                                      language=Language.ENGLISH.name,
+                                                      cleared_description=cleared_description)
+                          for i, cleared_description in enumerate(('New release', '2 + 2'))]
+        self.assertEqual(list(digest_records_to_lemmatize()), digest_records)
+        save_digest_records_lemmas({digest_records[0].id: {'new': 1, 'release': 1}, digest_records[1].id: {}})
+        self.assertEqual(list(digest_records_to_lemmatize()), [])
+
+
+class DigestRecordDetailedSerializerTests(TestCase):
+
+    def setUp(self):
+        self.keywords = [
+            Keyword.objects.create(name='Linux', is_generic=False, proprietary=False),
+            Keyword.objects.create(name='Windows', is_generic=False, proprietary=True),
+            Keyword.objects.create(name='Kernel', is_generic=True, proprietary=False),
+        ]
+        self.project = Project.objects.create(name='FOSS News')
+        self.tbot_user = TelegramBotUser.objects.create(tid=1, username='user')
+
+    def _create_digest_records(self, count: int, first_index: int = 0):
+        for i in range(first_index, first_index + count):
+            digest_record = DigestRecord.objects.create(title=f'Title {i}', url=f'https://example.com/{i}')
+            digest_record.title_keywords.set(self.keywords)
+            digest_record.projects.set([self.project])
+            TelegramBotDigestRecordCategorizationAttempt.objects.create(dt=timezone.now(),
+                                                                        telegram_bot_user=self.tbot_user,
+                                                                        digest_record=digest_record)
+
+    def _serialize_all(self):
+        queryset = DigestRecordDetailedSerializer.setup_eager_loading(DigestRecord.objects.order_by('id'))
+        with CaptureQueriesContext(connection) as queries:
+            data = DigestRecordDetailedSerializer(queryset, many=True).data
+        return data, len(queries)
+
+    def test_serializes_any_count_of_records_with_same_queries_count(self):
+        self._create_digest_records(1)
+        data, one_record_queries_count = self._serialize_all()
+        self.assertEqual([k['name'] for k in data[0]['not_proprietary_keywords']], ['Linux'])
+        self.assertEqual([k['name'] for k in data[0]['proprietary_keywords']], ['Windows'])
+        self.assertEqual(len(data[0]['tbot_estimations']), 1)
+        self._create_digest_records(5, first_index=1)
+        data, six_records_queries_count = self._serialize_all()
+        self.assertEqual(len(data), 6)
+        self.assertEqual(six_records_queries_count, one_record_queries_count)
+
+
+class CategorizationQueueTests(TestCase):
+
+    def test_follows_digest_records_and_attempts_changes(self):
+        project = Project.objects.create(name='FOSS News')
+        digest_record = DigestRecord.objects.create(title='Title',
+                                                    url='https://example.com/1',
+                                                    gather_dt=timezone.now(),
+                                                    state=DigestRecordState.UNKNOWN.name)
+        queue_entries = DigestRecordCategorizationQueueEntry.objects.filter(digest_record=digest_record)
+        self.assertFalse(queue_entries.exists())
+        digest_record.projects.add(project)
+        self.assertTrue(queue_entries.get().is_state_unknown)
+        tbot_user = TelegramBotUser.objects.create(tid=1, username='user')
+        attempt = TelegramBotDigestRecordCategorizationAttempt.objects.create(dt=timezone.now(),
+                                                                              telegram_bot_user=tbot_user,
+                                                                              digest_record=digest_record)
+        self.assertEqual(queue_entries.get().last_tbot_attempt_dt, attempt.dt)
+        digest_record.state = DigestRecordState.IN_DIGEST.name
+        digest_record.save()
+        self.assertFalse(queue_entries.get().is_state_unknown)
+        digest_record.is_main = False
+        digest_record.content_type = 'OTHER'
+        digest_record.save()
+        self.assertFalse(queue_entries.exists())
+        DigestRecord.objects.filter(pk=digest_record.pk).update(is_main=None)
+        refresh_categorization_queue([digest_record.pk])
+        self.assertTrue(queue_entries.exists())
+
+
+class ContainerXpathTests(SimpleTestCase):
+
+    PAGE = (
+        '<html><body>'
+        '<div class="header">Header</div>'
+        '<div class="post entry-content wide"><p>Post <b>text</b></p><script>var x = 1;</script></div>'
+        'Text after post'
+        '<div class="entry-content">Other</div>'
+        '</body></html>'
+    )
+
+    def test_matches_one_of_classes(self):
+        containers = html.fromstring(self.PAGE).xpath(container_xpath('div', 'entry-content'))
+        self.assertEqual(len(containers), 2)
+        fetched_container = FetchedContainer(containers[0])
+        self.assertEqual(fetched_container.text, 'Post text')
+        self.assertEqual(str(fetched_container),
+                         '<div class="post entry-content wide"><p>Post <b>text</b></p><script>var x = 1;</script></div>')
+
+    def test_matches_whole_class_attribute_with_spaces(self):
+        self.assertEqual(len(html.fromstring(self.PAGE).xpath(container_xpath('div', 'post entry-content wide'))), 1)
+        self.assertEqual(len(html.fromstring(self.PAGE).xpath(container_xpath('div', 'post entry-content'))), 0)
+
+
+class HtmlEncodingTests(SimpleTestCase):
+
+    @staticmethod
+    def _response(content_type: str):
+        response = requests.Response()
+        response.headers['Content-Type'] = content_type
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def test_takes_encoding_from_headers_then_meta_then_page(self):
+        page = '<html><body><p>Текст поста</p></body></html>'.encode('utf-8')
+        self.assertEqual(html_encoding(self._response('text/html; charset=windows-1251'), page), 'windows-1251')
+        self.assertEqual(html_encoding(self._response('text/html'), b'<meta charset="koi8-r">' + page), 'koi8-r')
+        encoding = html_encoding(self._response('text/html'), page)
+        parser = html.HTMLParser(encoding=encoding)
+        parser.feed(page)
+        self.assertEqual(parser.close().text_content(), 'Текст поста')
+
+    def test_skips_unknown_encodings(self):
+        page = '<html><body><p>Текст поста</p></body></html>'.encode('utf-8')
+        self.assertEqual(html_encoding(self._response('text/html; charset=x-bogus-enc'), b'<meta charset="koi8-r">' + page),
+                         'koi8-r')
+        self.assertEqual(html_encoding(self._response('text/html'), b'<meta charset="x-bogus-enc">' + page),
+                         html_encoding(self._response('text/html'), page))
+
+
+class HtmlToTextTests(SimpleTestCase):
+
+    def test_strips_tags(self):
+        self.assertEqual(html_to_text('<p>New <a href="https://example.com">release</a> &amp; more</p>'),
+                         'New release & more')
+        self.assertEqual(html_to_text('Plain text'), 'Plain text')
+        self.assertEqual(html_to_text('<?xml version="1.0" encoding="utf-8"?><div>Текст</div>'), 'Текст')
+        self.assertEqual(html_to_text('   '), '')
+
+    def test_skips_scripts_and_styles(self):
+        self.assertEqual(html_to_text('<style>p{color:red}</style><script>var x=1;</script>'
+                                      '<p>Hello <b>world</b><script>alert(1)</script></p>'),
+                         'Hello world')
+
+
+class ReplayingHttpClientTests(SimpleTestCase):
+
+    def test_replays_recorded_response(self):
+        with tempfile.TemporaryDirectory() as directory:
+            request = requests.Request('GET', 'https://example.com/feed.xml').prepare()
+            ResponsesSnapshots(directory).save(request,
+                                               200,
+                                               'OK',
+                                               {'Content-Type': 'application/rss+xml', 'Content-Encoding': 'gzip'},
+                                               b'<rss></rss>')
+            http_client = HttpClient(replaying_directory=directory)
+            response = http_client.get('https://example.com/feed.xml', stream=True)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers['Content-Type'], 'application/rss+xml')
+            self.assertEqual(response.raw.read(), b'<rss></rss>')
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                http_client.get('https://example.com/other.xml')
+
+
+class PollingSchedulerTests(SimpleTestCase):
+
+    def test_polls_sources_as_often_as_they_publish_within_limits(self):
+        polling_scheduler = PollingScheduler(min_interval_seconds=15 * 60,
+                                             max_interval_seconds=24 * 60 * 60,
+                                             jitter=0,
+                                             rate_period_days=14)
+        self.assertEqual(polling_scheduler.polling_interval_seconds(None), 24 * 60 * 60)
+        self.assertEqual(polling_scheduler.polling_interval_seconds(7), 24 * 60 * 60)
+        self.assertEqual(polling_scheduler.polling_interval_seconds(14 * 4), 6 * 60 * 60)
+        self.assertEqual(polling_scheduler.polling_interval_seconds(100000), 15 * 60)
@@ -16,6 +16,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from gatherer.filters import *
 from common.permissions import *
 from gatherer.mixins import *
+from gatherer.keywordsmatcher import KeywordsMatcher
 from tbot.models import *
 
 
@@ -24,9 +25,15 @@ class DigestRecordViewSet(viewsets.ModelViewSet):
     queryset = DigestRecord.objects.all().order_by('dt')
     serializer_class = DigestRecordSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('detailed_list', 'detailed_one'):
+            queryset = DigestRecordDetailedSerializer.setup_eager_loading(queryset)
+        return queryset
+
     @action(detail=False, methods=['get'], url_path='detailed')
     def detailed_list(self, request, *args, **kwargs):
-        queryset = self.queryset
+        queryset = self.get_queryset()
         digest_issue = request.query_params.get('digest_issue', None)
         if digest_issue is not None:
             queryset = queryset.filter(digest_issue=digest_issue)
@@ -58,7 +65,7 @@ class DigestRecordViewSet(viewsets.ModelViewSet):
 # TODO: Obsolete, remove with removal of api/v1
 class DetailedDigestRecordViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAdminUser]
-    queryset = DigestRecord.objects.all().order_by('dt')
+    queryset = DigestRecordDetailedSerializer.setup_eager_loading(DigestRecord.objects.all()).order_by('dt')
     serializer_class = DigestRecordDetailedSerializer
     model = DigestRecord
     filter_class = SpecificDigestRecordsFilter
@@ -81,7 +88,7 @@ class NewFossNewsDigestRecordViewSet(GenericViewSet,
 
     def get_queryset(self):
         queryset = self.not_categorized_records_queryset(from_bot=False)
-        return queryset
+        return DigestRecordDetailedSerializer.setup_eager_loading(queryset)
 
 
 class NotCategorizedDigestRecordViewSet(GenericViewSet,
@@ -107,9 +114,9 @@ class OneNewFossNewsDigestRecordViewSet(GenericViewSet,
 
     def get_queryset(self):
         queryset = self.not_categorized_records_queryset(from_bot=False)
-        queryset = queryset.order_by('dt')
-        if queryset:
-            return [queryset[0]]
+        digest_record = DigestRecordDetailedSerializer.setup_eager_loading(queryset).order_by('dt').first()
+        if digest_record is not None:
+            return [digest_record]
         else:
             return []
 
@@ -131,9 +138,8 @@ class OldestNotCategorizedDigestRecordViewSet(GenericViewSet,
             return Response({'error': 'Missing "from-bot" option'}, status=status.HTTP_400_BAD_REQUEST)
         from_bot = False if from_bot.lower() == 'false' else True
         queryset = self.not_categorized_records_queryset(from_bot, project_name)
-        queryset = queryset.order_by('dt')
-        if queryset:
-            digest_record = queryset[0]
+        digest_record = DigestRecordDetailedSerializer.setup_eager_loading(queryset).order_by('dt').first()
+        if digest_record is not None:
             return Response({
                                 'results': [DigestRecordDetailedSerializer(digest_record).data],
                                 'links': {
@@ -160,9 +166,9 @@ class OneNewFossNewsDigestRecordFromTbotViewSet(GenericViewSet,
 
     def get_queryset(self):
         queryset = self.not_categorized_records_queryset(from_bot=True)
-        queryset = queryset.order_by('dt')
-        if queryset:
-            return [queryset[0]]
+        digest_record = DigestRecordDetailedSerializer.setup_eager_loading(queryset).order_by('dt').first()
+        if digest_record is not None:
+            return [digest_record]
         else:
             return []
 
@@ -202,7 +208,7 @@ class SpecificDigestRecordsViewSet(GenericViewSet, mixins.ListModelMixin):
     permission_classes = [permissions.IsAdminUser]
     model = DigestRecord
     serializer_class = DigestRecordDetailedSerializer
-    queryset = DigestRecord.objects.all()
+    queryset = DigestRecordDetailedSerializer.setup_eager_loading(DigestRecord.objects.all())
     filter_class = SpecificDigestRecordsFilter
     filter_backends = [DjangoFilterBackend]
 
@@ -212,9 +218,15 @@ class SimilarDigestRecordsViewSet(viewsets.ModelViewSet):
     queryset = SimilarDigestRecords.objects.all()
     serializer_class = SimilarDigestRecordsSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('detailed_list', 'detailed_one'):
+            queryset = SimilarDigestRecordsDetailedSerializer.setup_eager_loading(queryset)
+        return queryset
+
     @action(detail=False, methods=['get'], url_path='detailed')
     def detailed_list(self, request, *args, **kwargs):
-        queryset = self.queryset
+        queryset = self.get_queryset()
         digest_issue = request.query_params.get('digest_issue', None)
         if digest_issue is not None:
             queryset = queryset.filter(digest_issue=digest_issue)
@@ -234,7 +246,7 @@ class SimilarDigestRecordsViewSet(viewsets.ModelViewSet):
 # TODO: Obsolete, remove with removal of api/v1
 class SimilarDigestRecordsDetailedViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAdminUser]
-    queryset = SimilarDigestRecords.objects.all()
+    queryset = SimilarDigestRecordsDetailedSerializer.setup_eager_loading(SimilarDigestRecords.objects.all())
     serializer_class = SimilarDigestRecordsDetailedSerializer
     filter_class = SimilarDigestRecordsFilter
     filter_backends = [DjangoFilterBackend]
@@ -255,7 +267,7 @@ class SimilarDigestRecordsByDigestRecordViewSet(GenericViewSet, mixins.ListModel
     permission_classes = [permissions.IsAdminUser]
     model = SimilarDigestRecords
     serializer_class = SimilarDigestRecordsDetailedSerializer
-    queryset = SimilarDigestRecords.objects.all()
+    queryset = SimilarDigestRecordsDetailedSerializer.setup_eager_loading(SimilarDigestRecords.objects.all())
     filter_class = SimilarDigestRecordsByDigestRecordFilter
     filter_backends = [DjangoFilterBackend]
 
@@ -288,13 +300,12 @@ class GuessContentCategoryView(mixins.ListModelMixin, GenericViewSet):
 
     def list(self, request, *args, **kwargs):
         title = request.query_params.get('title', None)
-        keywords = Keyword.objects.all()
+        keywords_matcher = KeywordsMatcher.from_queryset(Keyword.objects.all())
         matched_keywords_by_content_category = {}
-        for keyword in keywords:
-            if re.search(rf'\b{re.escape(keyword.name)}\b', title, re.IGNORECASE):
-                if keyword.content_category not in matched_keywords_by_content_category:
-                    matched_keywords_by_content_category[keyword.content_category] = []
-                matched_keywords_by_content_category[keyword.content_category].append(keyword.name)
+        for keyword in keywords_matcher.match(title):
+            if keyword.content_category not in matched_keywords_by_content_category:
+                matched_keywords_by_content_category[keyword.content_category] = []
+            matched_keywords_by_content_category[keyword.content_category].append(keyword.name)
         return Response({'title': title, 'matches': matched_keywords_by_content_category}, status=status.HTTP_200_OK)
 
 
@@ -336,6 +347,7 @@ class SimilarRecordsInPreviousNonSpecialDigest(mixins.ListModelMixin, GenericVie
             for record in records:
                 if re.search(rf'\b{re.escape(keyword)}\b', record.title, re.IGNORECASE) and record not in similar_records_in_previous_digest:
                     similar_records_in_previous_digest.append(record)
+        DigestRecordDetailedSerializer.load_eagerly(similar_records_in_previous_digest)
         similar_records_in_previous_digest_titles = [DigestRecordDetailedSerializer(r).data
                                                      for r in similar_records_in_previous_digest]
 
@@ -369,6 +381,7 @@ class SimilarRecordsInPreviousDigest(mixins.ListModelMixin, GenericViewSet):
             for record in records:
                 if re.search(rf'\b{re.escape(keyword)}\b', record.title, re.IGNORECASE) and record not in similar_records_in_previous_digest:
                     similar_records_in_previous_digest.append(record)
+        DigestRecordDetailedSerializer.load_eagerly(similar_records_in_previous_digest)
         similar_records_in_previous_digest_titles = [DigestRecordDetailedSerializer(r).data
                                                      for r in similar_records_in_previous_digest]
 
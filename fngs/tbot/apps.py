@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class TbotConfig(AppConfig):
     name = 'tbot'
+
+    def ready(self):
+        import tbot.signals
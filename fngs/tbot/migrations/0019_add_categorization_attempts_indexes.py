@@ -0,0 +1,17 @@
+# Generated by Django 3.2.23 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tbot', '0018_changed_default_estimated_is_main_to_none'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='telegrambotdigestrecordcategorizationattempt',
+            index=models.Index(fields=['digest_record', 'telegram_bot_user'], name='tbot_attempt_record_user_idx'),
+        ),
+    ]
@@ -75,3 +75,7 @@ class TelegramBotDigestRecordCategorizationAttempt(models.Model):
     class Meta:
         verbose_name = 'Telegram Bot Digest Record Categorization Attempt'
         verbose_name_plural = 'Telegram Bot Digest Record Categorization Attempts'
+        indexes = [
+            # Checks if user has already estimated record
+            models.Index(fields=['digest_record', 'telegram_bot_user'], name='tbot_attempt_record_user_idx'),
+        ]
@@ -0,0 +1,14 @@
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+
+from gatherer.categorizationqueue import refresh_categorization_queue
+from tbot.models import TelegramBotDigestRecordCategorizationAttempt
+
+
+@receiver(post_save, sender=TelegramBotDigestRecordCategorizationAttempt)
+@receiver(post_delete, sender=TelegramBotDigestRecordCategorizationAttempt)
+def refresh_estimated_digest_record_categorization_queue(sender, instance, **kwargs):
+    refresh_categorization_queue([instance.digest_record_id])
@@ -1,3 +1,99 @@
+import json
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from common.sampling import random_object
+from gatherer.models import (
+    DigestRecord,
+    DigestRecordState,
+    Project,
+)
+from gatherer.tests import (
+    TEST_PASSWORD,
+    TEST_USERNAME,
+)
+from tbot.models import (
+    TelegramBotDigestRecordCategorizationAttempt,
+    TelegramBotUser,
+)
+from tbot.views import NotCategorizedFossNewsDigestRecordsMixin
+
+
+class NotCategorizedFossNewsDigestRecordsMixinTests(TestCase):
+
+    def setUp(self):
+        self.project = Project.objects.create(name='FOSS News')
+        self.tbot_users = [TelegramBotUser.objects.create(tid=i, username=f'user{i}') for i in range(4)]
+        self.tbot_user = self.tbot_users[0]
+        self.digest_records_count = 0
+
+    def _create_digest_record(self, estimating_tbot_users):
+        digest_record = DigestRecord.objects.create(title=f'Title {self.digest_records_count}',
+                                                    url=f'https://example.com/{self.digest_records_count}',
+                                                    state=DigestRecordState.UNKNOWN.name)
+        self.digest_records_count += 1
+        digest_record.projects.add(self.project)
+        for tbot_user in estimating_tbot_users:
+            TelegramBotDigestRecordCategorizationAttempt.objects.create(dt=timezone.now(),
+                                                                        telegram_bot_user=tbot_user,
+                                                                        digest_record=digest_record)
+        return digest_record
+
+    def _pick_random_not_categorized_record(self):
+        # User existence check, ids range and random record queries, and one more query when picking wraps around
+        # to first record, whatever attempts count is
+        with CaptureQueriesContext(connection) as queries:
+            not_categorized_records = NotCategorizedFossNewsDigestRecordsMixin().not_categorized_records(self.tbot_user.pk)
+            random_record = random_object(not_categorized_records)
+        self.assertIn(len(queries), (3, 4))
+        return random_record
+
+    def test_picks_records_not_estimated_by_user_and_by_enough_others(self):
+        not_estimated_digest_record = self._create_digest_record([])
+        estimated_once_digest_record = self._create_digest_record(self.tbot_users[1:2])
+        self._create_digest_record(self.tbot_users[:1])
+        self._create_digest_record(self.tbot_users[1:])
+        not_categorized_records = NotCategorizedFossNewsDigestRecordsMixin().not_categorized_records(self.tbot_user.pk)
+        self.assertEqual(set(not_categorized_records),
+                         {not_estimated_digest_record, estimated_once_digest_record})
+        self.assertIn(self._pick_random_not_categorized_record(), not_categorized_records)
+        for _ in range(10):
+            self._create_digest_record(self.tbot_users)
+        self.assertIn(self._pick_random_not_categorized_record(), not_categorized_records)
+
+
+class DigestRecordsCategorizedByTbotViewSetTests(APITestCase):
 
-# Create your tests here.
+    def test_returns_same_report_whole_paginated_and_streamed(self):
+        # Admin user is loaded with empty database dump
+        self.client.login(username=TEST_USERNAME, password=TEST_PASSWORD)
+        project = Project.objects.create(name='FOSS News')
+        for i in range(3):
+            digest_record = DigestRecord.objects.create(title=f'Title {i}',
+                                                        url=f'https://example.com/{i}',
+                                                        gather_dt=timezone.now(),
+                                                        state=DigestRecordState.UNKNOWN.name)
+            digest_record.projects.add(project)
+            for j in range(i + 1):
+                tbot_user, _ = TelegramBotUser.objects.get_or_create(tid=j, username=f'user{j}')
+                TelegramBotDigestRecordCategorizationAttempt.objects.create(dt=timezone.now(),
+                                                                            telegram_bot_user=tbot_user,
+                                                                            digest_record=digest_record,
+                                                                            estimated_state=DigestRecordState.IN_DIGEST.name)
+        url = reverse('digest-record/categorized-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        report = response.json()
+        self.assertEqual(len(report), 3)
+        self.assertEqual(sorted(len(data['estimations']) for data in report.values()), [1, 2, 3])
+        streamed_response = self.client.get(url, {'stream': 'true'})
+        self.assertEqual(json.loads(b''.join(streamed_response.streaming_content)), report)
+        paginated_response = self.client.get(url, {'page_size': 2})
+        self.assertEqual(paginated_response.json()['count'], 3)
+        self.assertEqual(len(paginated_response.json()['results']), 2)
@@ -1,7 +1,13 @@
-import random
+import json
 
 from rest_framework.decorators import action
+from django.db.models import (
+    Count,
+    Exists,
+    OuterRef,
+)
 from django.forms.models import model_to_dict
+from django.http import StreamingHttpResponse
 from rest_framework import (
     viewsets,
     permissions,
@@ -9,11 +15,13 @@ from rest_framework import (
     status,
 )
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.viewsets import GenericViewSet
 
 from gatherer.serializers import *
 from gatherer.mixins import *
 from common.permissions import *
+from common.sampling import random_object
 
 from .models import *
 from .serializers import *
@@ -79,27 +87,24 @@ class NotCategorizedFossNewsDigestRecordsMixin:
     ENOUGH_TBOT_USERS_DIGEST_RECORD_ESTIMATIONS = 3
 
     def not_categorized_records(self, tbot_user_id, project_name='FOSS News'):
+        # Records not estimated by user yet and estimated by not enough other users, selected by one query
+        # with estimations counted in database
         if tbot_user_id is None:
-            return []
-        try:
-            tbot_user = TelegramBotUser.objects.get(pk=tbot_user_id)
-        except TelegramBotUser.DoesNotExist:
-            return []
-        categorized_by_this_user_digest_records_attempts = TelegramBotDigestRecordCategorizationAttempt.objects.filter(telegram_bot_user=tbot_user)
-        not_categorized_by_this_user_digest_records = DigestRecord.objects.filter(state='UNKNOWN',
-                                                                                  projects__in=(Project.objects.filter(name=project_name))).exclude(pk__in=[a.digest_record.pk for a in categorized_by_this_user_digest_records_attempts]).order_by('-dt')
-        attempts_for_not_categorized_records = TelegramBotDigestRecordCategorizationAttempt.objects.filter(digest_record__in=not_categorized_by_this_user_digest_records)
-        attempts_per_digest_record = {}
-        for attempt in attempts_for_not_categorized_records:
-            if attempt.digest_record.id in attempts_per_digest_record:
-                attempts_per_digest_record[attempt.digest_record.id] += 1
-            else:
-                attempts_per_digest_record[attempt.digest_record.id] = 1
-        digest_records_with_enough_attempts = [drid
-                                               for drid, attempts in attempts_per_digest_record.items()
-                                               if attempts >= self.ENOUGH_TBOT_USERS_DIGEST_RECORD_ESTIMATIONS]
-        not_categorized_by_this_user_digest_records_but_still_actual = not_categorized_by_this_user_digest_records.exclude(pk__in=digest_records_with_enough_attempts)
-        return not_categorized_by_this_user_digest_records_but_still_actual
+            return DigestRecord.objects.none()
+        if not TelegramBotUser.objects.filter(pk=tbot_user_id).exists():
+            return DigestRecord.objects.none()
+        this_user_attempts = TelegramBotDigestRecordCategorizationAttempt.objects.filter(telegram_bot_user_id=tbot_user_id,
+                                                                                         digest_record=OuterRef('pk'))
+        return DigestRecord.objects.filter(
+            state='UNKNOWN',
+            projects__in=Project.objects.filter(name=project_name),
+        ).filter(
+            ~Exists(this_user_attempts),
+        ).annotate(
+            estimations_count=Count('tbot_estimations', distinct=True),
+        ).filter(
+            estimations_count__lt=self.ENOUGH_TBOT_USERS_DIGEST_RECORD_ESTIMATIONS,
+        ).order_by('-dt')
 
 
 # TODO: Obsolete, remove with removal of api/v1
@@ -113,9 +118,9 @@ class TelegramBotOneRandomNotCategorizedFossNewsDigestRecordViewSet(mixins.ListM
     def get_queryset(self):
         tbot_user_id = self.request.query_params.get('tbot-user-id', None)
         not_categorized_by_this_user_digest_records_but_still_actual = self.not_categorized_records(tbot_user_id)
-        if not_categorized_by_this_user_digest_records_but_still_actual:
-            random_record = random.choice(not_categorized_by_this_user_digest_records_but_still_actual)
-            return [random_record]
+        random_record = random_object(not_categorized_by_this_user_digest_records_but_still_actual)
+        if random_record is not None:
+            return DigestRecordDetailedSerializer.load_eagerly([random_record])
         else:
             return []
 
@@ -136,8 +141,9 @@ class TelegramBotOneRandomNotCategorizedDigestRecordViewSet(mixins.ListModelMixi
             return Response({'error': 'Empty "project_name" parameter'}, status=status.HTTP_400_BAD_REQUEST)
         not_categorized_by_this_user_digest_records_but_still_actual = self.not_categorized_records(tbot_user_id,
                                                                                                     project_name)
-        if not_categorized_by_this_user_digest_records_but_still_actual:
-            random_record = random.choice(not_categorized_by_this_user_digest_records_but_still_actual)
+        random_record = random_object(not_categorized_by_this_user_digest_records_but_still_actual)
+        if random_record is not None:
+            DigestRecordDetailedSerializer.load_eagerly([random_record])
             return Response({'results': [DigestRecordDetailedSerializer(random_record).data]}, status=status.HTTP_200_OK)
         else:
             return Response({'results': []}, status=status.HTTP_200_OK)
@@ -152,8 +158,9 @@ class TelegramBotNotCategorizedFossNewsDigestRecordsCountViewSet(mixins.ListMode
     def list(self, request, *args, **kwargs):
         tbot_user_id = request.query_params.get('tbot-user-id', None)
         not_categorized_by_this_user_digest_records_but_still_actual = self.not_categorized_records(tbot_user_id)
-        if not_categorized_by_this_user_digest_records_but_still_actual:
-            return Response({'count': not_categorized_by_this_user_digest_records_but_still_actual.count()}, status=status.HTTP_200_OK)
+        not_categorized_count = not_categorized_by_this_user_digest_records_but_still_actual.count()
+        if not_categorized_count:
+            return Response({'count': not_categorized_count}, status=status.HTTP_200_OK)
         else:
             return Response(None, status=status.HTTP_200_OK)
 
@@ -172,8 +179,9 @@ class TelegramBotNotCategorizedDigestRecordsCountViewSet(mixins.ListModelMixin,
             return Response({'error': 'Empty "project_name" parameter'}, status=status.HTTP_400_BAD_REQUEST)
         not_categorized_by_this_user_digest_records_but_still_actual = self.not_categorized_records(tbot_user_id,
                                                                                                     project_name)
-        if not_categorized_by_this_user_digest_records_but_still_actual:
-            return Response({'count': not_categorized_by_this_user_digest_records_but_still_actual.count()}, status=status.HTTP_200_OK)
+        not_categorized_count = not_categorized_by_this_user_digest_records_but_still_actual.count()
+        if not_categorized_count:
+            return Response({'count': not_categorized_count}, status=status.HTTP_200_OK)
         else:
             return Response(None, status=status.HTTP_200_OK)
 
@@ -200,27 +208,56 @@ class TelegramBotUserByTidViewSet(mixins.ListModelMixin,
 class DigestRecordsCategorizedByTbotViewSet(mixins.ListModelMixin,
                                             GenericViewSet,
                                             NotCategorizedDigestRecordsMixin):
+    # Whole report by default, page of it if page or page size is requested, or whole report streamed by batches
+    # of records with `stream=true`, records are loaded with their estimations, so queries count depends only
+    # on count of pages or batches
     permission_classes = [permissions.IsAdminUser]
 
+    STREAMING_BATCH_SIZE = 100
+
     def list(self, request, *args, **kwargs):
-        not_fully_categorized_digest_records = self.not_categorized_records_queryset(from_bot=True)
-        tbot_categorizations_attempts_for_unknown_records = TelegramBotDigestRecordCategorizationAttempt.objects.filter(digest_record__in=not_fully_categorized_digest_records)
-        categorizations_data_by_digest_record = {}
-        categorization_attempt: TelegramBotDigestRecordCategorizationAttempt
-        for categorization_attempt in tbot_categorizations_attempts_for_unknown_records:
-            digest_record_id = categorization_attempt.digest_record.id
-            if digest_record_id not in categorizations_data_by_digest_record:
-                categorizations_data_by_digest_record[digest_record_id] = {
-                    'record': DigestRecordDetailedSerializer(DigestRecord.objects.get(id=digest_record_id)).data,
-                    'estimations': [],
-                }
-            estimation_data = {
-                'user': categorization_attempt.telegram_bot_user.username,
-                'state': categorization_attempt.estimated_state,
-                'is_main': categorization_attempt.estimated_is_main,
-                'content_type': categorization_attempt.estimated_content_type,
-                'content_category': categorization_attempt.estimated_content_category,
-            }
-            categorizations_data_by_digest_record[digest_record_id]['estimations'].append(estimation_data)
-        return Response(categorizations_data_by_digest_record,
+        digest_records = DigestRecordDetailedSerializer.setup_eager_loading(
+            self.not_categorized_records_queryset(from_bot=True)
+        ).order_by('id')
+        if request.query_params.get('stream', '').lower() == 'true':
+            return StreamingHttpResponse(self._streamed_categorizations_data(digest_records),
+                                         content_type='application/json')
+        if self.paginator.page_query_param in request.query_params \
+                or self.paginator.page_size_query_param in request.query_params:
+            return self.get_paginated_response(self._categorizations_data(self.paginate_queryset(digest_records)))
+        return Response(self._categorizations_data(digest_records),
                         status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _categorizations_data(digest_records):
+        return {
+            digest_record.id: {
+                'record': DigestRecordDetailedSerializer(digest_record).data,
+                'estimations': [
+                    {
+                        'user': categorization_attempt.telegram_bot_user.username,
+                        'state': categorization_attempt.estimated_state,
+                        'is_main': categorization_attempt.estimated_is_main,
+                        'content_type': categorization_attempt.estimated_content_type,
+                        'content_category': categorization_attempt.estimated_content_category,
+                    }
+                    for categorization_attempt in digest_record.tbot_estimations.all()
+                ],
+            }
+            for digest_record in digest_records
+        }
+
+    def _streamed_categorizations_data(self, digest_records):
+        # Same JSON object as whole report, written by parts, so only one batch of records is kept in memory
+        yield '{'
+        separator = ''
+        last_id = 0
+        while True:
+            digest_records_batch = list(digest_records.filter(id__gt=last_id)[:self.STREAMING_BATCH_SIZE])
+            if not digest_records_batch:
+                break
+            last_id = digest_records_batch[-1].id
+            for digest_record_id, categorizations_data in self._categorizations_data(digest_records_batch).items():
+                yield f'{separator}{json.dumps(str(digest_record_id))}:{json.dumps(categorizations_data, cls=JSONEncoder)}'
+                separator = ','
+        yield '}'